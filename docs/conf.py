@@ -166,6 +166,8 @@ rst_epilog = """
 
 .. |_ColumnCollection| replace:: :class:`_ColumnCollection`
 
+.. |CompressionPolicy| replace:: :class:`.CompressionPolicy`
+
 .. |Connector| replace:: :class:`.Connector`
 
 .. |CoreProperties| replace:: :class:`.CoreProperties`
@@ -210,6 +212,8 @@ rst_epilog = """
 
 .. |Image| replace:: :class:`.Image`
 
+.. |ImageOptimizer| replace:: :class:`.ImageOptimizer`
+
 .. |ImagePart| replace:: :class:`.ImagePart`
 
 .. |Inches| replace:: :class:`.Inches`
@@ -294,6 +298,8 @@ rst_epilog = """
 
 .. |PresentationPart| replace:: :class:`.PresentationPart`
 
+.. |PresentationTemplate| replace:: :class:`.PresentationTemplate`
+
 .. |Pt| replace:: :class:`.Pt`
 
 .. |RadarSeries| replace:: :class:`.RadarSeries`
@@ -138,9 +138,9 @@ class ActionSetting(Subshape):
         if hlink is None:
             return
         rId = hlink.rId
-        if rId:
-            self.part.drop_rel(rId)
         self._element.remove(hlink)
+        if rId:
+            self.part.drop_unreferenced_rels([rId])
 
     @property
     def _hlink(self):
@@ -248,6 +248,6 @@ class Hyperlink(Subshape):
         if hlink is None:
             return
         rId = hlink.rId
-        if rId:
-            self.part.drop_rel(rId)
         self._element.remove(hlink)
+        if rId:
+            self.part.drop_unreferenced_rels([rId])
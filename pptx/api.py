@@ -14,20 +14,51 @@ from __future__ import (
 import os
 
 from .opc.constants import CONTENT_TYPE as CT
+from .opc.package import PackageTemplate
 from .package import Package
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, lazy=False, workers=None, mmap=False):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *lazy* is |True|, each part of the package (a slide, an image, etc.)
+    is only read and parsed when it is first used, which makes opening
+    a large presentation to access only a few of its parts much faster.
+    Parts left untouched are copied unchanged, without being reserialized or
+    recompressed, when the presentation is saved. In that case *pptx* must
+    remain available and unchanged, e.g. a file-like object must not be
+    closed and the file must not be written by other code, until the
+    presentation is closed with :meth:`.Presentation.close` or is no longer
+    in use. The presentation can be used as a context manager to close it::
+
+        with Presentation('deck.pptx', lazy=True) as prs:
+            ...
+
+    Saving the presentation to the path it was loaded from is supported; the
+    parts not yet read are read into memory before the file is overwritten.
+    Saving to the file-like object it was loaded from is not.
+
+    When *workers* is an integer greater than 1, the XML of the slides,
+    layouts, charts and other parts is parsed on a pool of that many
+    threads, which can substantially reduce the time taken to open a large
+    presentation on a multi-core machine.
+
+    When *mmap* is |True| and *pptx* is a path or an actual file, the file is
+    memory-mapped rather than read. The blob of each image, video or other
+    part stored in it without compression is then a `memoryview` of the
+    mapping instead of a copy in memory, so memory use when opening and
+    re-saving a media-heavy presentation doesn't grow with the size of its
+    media. The file must not be changed by other code while the presentation
+    is in use.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, lazy, workers, mmap).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
@@ -36,6 +67,49 @@ def Presentation(pptx=None):
     return presentation_part.presentation
 
 
+class PresentationTemplate(object):
+    """
+    Presentation loaded once from *pptx*, from which any number of
+    independent |Presentation| objects can be created, each in a small
+    fraction of the time loading *pptx* takes. *pptx* is a path to a
+    ``.pptx`` file or a file-like object, and the built-in default
+    presentation "template" is used when it is missing or ``None``. *pptx*
+    is not needed once the template is constructed.
+
+    Each presentation created shares the bytes read from *pptx* with the
+    template. The XML of a part, like a slide layout, is parsed once for the
+    template and copied for a presentation only when that presentation first
+    uses it. A part a presentation never uses is copied to its saved file
+    without being reserialized or recompressed.
+    """
+    def __init__(self, pptx=None):
+        super(PresentationTemplate, self).__init__()
+        if pptx is None:
+            pptx = _default_pptx_path()
+
+        self._package_template = PackageTemplate.from_file(pptx)
+
+        presentation_part = self._new_presentation_part()
+        if not _is_pptx_package(presentation_part):
+            tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
+            raise ValueError(tmpl % (pptx, presentation_part.content_type))
+
+    def presentation(self):
+        """
+        Return a new |Presentation| object containing a copy of this
+        template. Changes to it do not affect this template or any other
+        presentation created from it.
+        """
+        return self._new_presentation_part().presentation
+
+    def _new_presentation_part(self):
+        """
+        Return the presentation part of a new package copied from this
+        template.
+        """
+        return self._package_template.new_package(Package).main_document_part
+
+
 def _default_pptx_path():
     """
     Return the path to the built-in default .pptx package.
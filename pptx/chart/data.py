@@ -7,6 +7,9 @@ ChartData and related objects.
 from __future__ import absolute_import, print_function, unicode_literals
 
 import datetime
+import struct
+
+from array import array
 from collections import Sequence
 from numbers import Number
 
@@ -134,21 +137,39 @@ class _BaseSeriesData(Sequence):
     data object serves as proxy for a series data column in the Excel
     worksheet. It operates as a sequence of data points, as well as providing
     access to series-level attributes like the series label.
+
+    The values of the data points are stored by column rather than as data
+    point objects, each column an `array.array` when it was added from an
+    array of numbers and a list otherwise. Number formats are stored only for
+    the data points having one. A data point object is created each time one
+    is accessed by index.
     """
     def __init__(self, chart_data, name, number_format):
         self._chart_data = chart_data
         self._name = name
         self._number_format = number_format
-        self._data_points = []
+        self._number_formats = {}
 
     def __getitem__(self, index):
-        return self._data_points.__getitem__(index)
+        if isinstance(index, slice):
+            return [
+                self._data_point(idx)
+                for idx in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('data point index out of range')
+        return self._data_point(index)
 
     def __len__(self):
-        return self._data_points.__len__()
+        raise NotImplementedError('must be implemented by all subclasses')
 
     def append(self, data_point):
-        return self._data_points.append(data_point)
+        """
+        Append the values and number format of *data_point* to this series.
+        """
+        raise NotImplementedError('must be implemented by all subclasses')
 
     @property
     def data_point_offset(self):
@@ -196,14 +217,6 @@ class _BaseSeriesData(Sequence):
             return self._chart_data.number_format
         return number_format
 
-    @property
-    def x_values(self):
-        """
-        A sequence containing the X value of each datapoint in this series,
-        in data point order.
-        """
-        return [dp.x for dp in self._data_points]
-
     @property
     def x_values_ref(self):
         """
@@ -212,14 +225,6 @@ class _BaseSeriesData(Sequence):
         """
         return self._chart_data.x_values_ref(self)
 
-    @property
-    def y_values(self):
-        """
-        A sequence containing the Y value of each datapoint in this series,
-        in data point order.
-        """
-        return [dp.y for dp in self._data_points]
-
     @property
     def y_values_ref(self):
         """
@@ -228,6 +233,20 @@ class _BaseSeriesData(Sequence):
         """
         return self._chart_data.y_values_ref(self)
 
+    def _add_number_format(self, number_format):
+        """
+        Record *number_format* for the data point most recently added to this
+        series, unless it is |None|.
+        """
+        if number_format is not None:
+            self._number_formats[len(self) - 1] = number_format
+
+    def _data_point(self, idx):
+        """
+        Return a new data point object for the data point at *idx*.
+        """
+        raise NotImplementedError('must be implemented by all subclasses')
+
 
 class _BaseDataPoint(object):
     """
@@ -285,11 +304,14 @@ class CategoryChartData(_BaseChartData):
         *number_format* specifies how the series values will be displayed,
         and may be a string, e.g. '#,##0' corresponding to an Excel number
         format.
+
+        *values* can also be a one-dimensional array of numbers, like
+        a NumPy array or `array.array`, which is stored as a compact copy
+        rather than as an object for each value.
         """
         series_data = CategorySeriesData(self, name, number_format)
         self.append(series_data)
-        for value in values:
-            series_data.add_data_point(value)
+        series_data.add_data_points(values)
         return series_data
 
     @lazyproperty
@@ -303,14 +325,16 @@ class CategoryChartData(_BaseChartData):
 
         Creating a chart from chart data having date categories will cause
         the chart to have a |DateAxis| for its category axis.
+
+        The labels can also be assigned as a one-dimensional array of
+        numbers, like a NumPy array or `array.array`.
         """
         return Categories()
 
     @categories.setter
     def categories(self, category_labels):
         categories = Categories()
-        for label in category_labels:
-            categories.add_category(label)
+        categories.add_categories(category_labels)
         self._categories = categories
 
     @property
@@ -341,14 +365,19 @@ class Categories(Sequence):
     """
     A sequence of |data.Category| objects, also having certain hierarchical
     graph behaviors for support of multi-level (nested) categories.
+
+    Labels added with :meth:`add_categories` are kept as a column of labels,
+    without a |data.Category| object for each, until such an object is
+    accessed or another category is added with :meth:`add_category`.
     """
     def __init__(self):
         super(Categories, self).__init__()
         self._categories = []
+        self._labels = None
         self._number_format = None
 
     def __getitem__(self, idx):
-        return self._categories.__getitem__(idx)
+        return self._category_objects.__getitem__(idx)
 
     def __len__(self):
         """
@@ -357,8 +386,24 @@ class Categories(Sequence):
         will differ from :attr:`category_count`, which is the number of leaf
         nodes.
         """
+        if self._labels is not None:
+            return len(self._labels)
         return self._categories.__len__()
 
+    def add_categories(self, labels):
+        """
+        Append a category for each label in *labels*, an iterable of labels
+        or a one-dimensional array of numbers like a NumPy array or
+        `array.array`. When this sequence has no categories yet, the labels
+        are stored as a compact column rather than as a |data.Category|
+        object for each.
+        """
+        if self._labels is None and not self._categories:
+            self._labels = _column(labels)
+            return
+        for label in labels:
+            self.add_category(label)
+
     def add_category(self, label):
         """
         Return a newly created |data.Category| object having *label* and
@@ -371,7 +416,7 @@ class Categories(Sequence):
         the chart to have a |DateAxis| for its category axis.
         """
         category = Category(label, self)
-        self._categories.append(category)
+        self._category_objects.append(category)
         return category
 
     @property
@@ -386,7 +431,7 @@ class Categories(Sequence):
         """
         if self.depth != 1:
             return False
-        first_cat_label = self[0].label
+        first_cat_label = self._first_label
         date_types = (datetime.date, datetime.datetime)
         if isinstance(first_cat_label, date_types):
             return True
@@ -409,7 +454,7 @@ class Categories(Sequence):
         # be of uniform type, and if they're not, there will be problems
         # later in the process, but it's not this method's job to validate
         # the caller's input.
-        first_cat_label = self[0].label
+        first_cat_label = self._first_label
         numeric_types = (Number, datetime.date, datetime.datetime)
         if isinstance(first_cat_label, numeric_types):
             return True
@@ -421,6 +466,8 @@ class Categories(Sequence):
         The number of hierarchy levels in this category graph. Returns 0 if
         it contains no categories.
         """
+        if self._labels is not None:
+            return 1 if self._labels else 0
         categories = self._categories
         if not categories:
             return 0
@@ -436,7 +483,7 @@ class Categories(Sequence):
         A non-leaf category gets the index of its first sub-category.
         """
         index = 0
-        for this_category in self._categories:
+        for this_category in self._category_objects:
             if category is this_category:
                 return index
             index += this_category.leaf_count
@@ -449,8 +496,23 @@ class Categories(Sequence):
         value is the same as that of `len()` only when the hierarchy is
         single level.
         """
+        if self._labels is not None:
+            return len(self._labels)
         return sum(c.leaf_count for c in self._categories)
 
+    @property
+    def labels(self):
+        """
+        A sequence containing the label of each top-level category in this
+        collection, in order.
+        """
+        labels = self._labels
+        if labels is None:
+            return [category.label for category in self._categories]
+        if isinstance(labels, list):
+            return ['' if label is None else label for label in labels]
+        return labels[:]
+
     @property
     def levels(self):
         """
@@ -458,6 +520,10 @@ class Categories(Sequence):
         hierarchy from the bottom up. The first level contains all leaf
         categories, and each subsequent is the next level up.
         """
+        if self._labels is not None:
+            yield list(enumerate(self.labels))
+            return
+
         def levels(categories):
             # yield all lower levels
             sub_categories = [
@@ -494,7 +560,7 @@ class Categories(Sequence):
             return GENERAL
 
         # everything except dates gets 'General'
-        first_cat_label = self[0].label
+        first_cat_label = self._first_label
         if isinstance(first_cat_label, (datetime.date, datetime.datetime)):
             return 'yyyy\-mm\-dd'
         return GENERAL
@@ -503,6 +569,42 @@ class Categories(Sequence):
     def number_format(self, value):
         self._number_format = value
 
+    def numeric_str_vals(self, date_1904=False):
+        """
+        A sequence containing the string representation of the numeric (or
+        date) label of each top-level category, as returned by
+        :meth:`.Category.numeric_str_val`.
+        """
+        if self._labels is None:
+            categories = self._categories
+        else:
+            categories = (Category(label, self) for label in self._labels)
+        return [category.numeric_str_val(date_1904) for category in categories]
+
+    @property
+    def _category_objects(self):
+        """
+        The list of top-level |data.Category| objects in this collection,
+        first created from the column of labels when there is one.
+        """
+        if self._labels is not None:
+            self._categories = [
+                Category(label, self) for label in self._labels
+            ]
+            self._labels = None
+        return self._categories
+
+    @property
+    def _first_label(self):
+        """
+        The label of the first category in this collection, which must not
+        be empty.
+        """
+        if self._labels is None:
+            return self._categories[0].label
+        label = self._labels[0]
+        return '' if label is None else label
+
 
 class Category(object):
     """
@@ -635,15 +737,40 @@ class CategorySeriesData(_BaseSeriesData):
     number format to be applied to each data point not having a specified
     number format.
     """
+    def __init__(self, chart_data, name, number_format):
+        super(CategorySeriesData, self).__init__(
+            chart_data, name, number_format
+        )
+        self._values = []
+
+    def __len__(self):
+        return len(self._values)
+
     def add_data_point(self, value, number_format=None):
         """
         Return a CategoryDataPoint object newly created with value *value*,
         an optional *number_format*, and appended to this sequence.
         """
         data_point = CategoryDataPoint(self, value, number_format)
-        self.append(data_point)
+        self._values = _appended(self._values, value)
+        self._add_number_format(number_format)
         return data_point
 
+    def add_data_points(self, values):
+        """
+        Append a data point for each value in *values*, an iterable of
+        numbers or a one-dimensional array of numbers like a NumPy array or
+        `array.array`. The data points have the number format of this series.
+        """
+        self._values = _extended(self._values, _column(values))
+
+    def append(self, data_point):
+        """
+        Append the value and number format of *data_point* to this series.
+        """
+        self._values = _appended(self._values, data_point.value)
+        self._add_number_format(data_point._number_format)
+
     @property
     def categories(self):
         """
@@ -664,9 +791,9 @@ class CategorySeriesData(_BaseSeriesData):
     def values(self):
         """
         A sequence containing the (Y) value of each datapoint in this series,
-        in data point order.
+        in data point order. A new copy is returned on each reference.
         """
-        return [dp.value for dp in self._data_points]
+        return self._values[:]
 
     @property
     def values_ref(self):
@@ -676,6 +803,14 @@ class CategorySeriesData(_BaseSeriesData):
         """
         return self._chart_data.values_ref(self)
 
+    def _data_point(self, idx):
+        """
+        Return a new |CategoryDataPoint| object for the data point at *idx*.
+        """
+        return CategoryDataPoint(
+            self, self._values[idx], self._number_formats.get(idx)
+        )
+
 
 class XyChartData(_BaseChartData):
     """
@@ -745,15 +880,71 @@ class XySeriesData(_BaseSeriesData):
     segment to "travel backward" (implying a multi-valued function). The data
     points are not automatically sorted into increasing order by X value.
     """
+    def __init__(self, chart_data, name, number_format):
+        super(XySeriesData, self).__init__(chart_data, name, number_format)
+        self._x_values = []
+        self._y_values = []
+
+    def __len__(self):
+        return len(self._y_values)
+
     def add_data_point(self, x, y, number_format=None):
         """
         Return an XyDataPoint object newly created with values *x* and *y*,
         and appended to this sequence.
         """
         data_point = XyDataPoint(self, x, y, number_format)
-        self.append(data_point)
+        self._x_values = _appended(self._x_values, x)
+        self._y_values = _appended(self._y_values, y)
+        self._add_number_format(number_format)
         return data_point
 
+    def add_data_points(self, x_values, y_values):
+        """
+        Append a data point for each pair of values in *x_values* and
+        *y_values*, each an iterable of numbers or a one-dimensional array of
+        numbers like a NumPy array or `array.array`. The data points have the
+        number format of this series. Raises |ValueError| when the sequences
+        are not the same length.
+        """
+        self._x_values, self._y_values = _extended_columns(
+            (self._x_values, self._y_values), (x_values, y_values)
+        )
+
+    def append(self, data_point):
+        """
+        Append the X and Y values and number format of *data_point* to this
+        series.
+        """
+        self._x_values = _appended(self._x_values, data_point.x)
+        self._y_values = _appended(self._y_values, data_point.y)
+        self._add_number_format(data_point._number_format)
+
+    @property
+    def x_values(self):
+        """
+        A sequence containing the X value of each datapoint in this series,
+        in data point order. A new copy is returned on each reference.
+        """
+        return self._x_values[:]
+
+    @property
+    def y_values(self):
+        """
+        A sequence containing the Y value of each datapoint in this series,
+        in data point order. A new copy is returned on each reference.
+        """
+        return self._y_values[:]
+
+    def _data_point(self, idx):
+        """
+        Return a new |XyDataPoint| object for the data point at *idx*.
+        """
+        return XyDataPoint(
+            self, self._x_values[idx], self._y_values[idx],
+            self._number_formats.get(idx)
+        )
+
 
 class BubbleSeriesData(XySeriesData):
     """
@@ -766,6 +957,12 @@ class BubbleSeriesData(XySeriesData):
     throughout the chart building process because a data point has no unique
     identifier and can only be retrieved by index.
     """
+    def __init__(self, chart_data, name, number_format):
+        super(BubbleSeriesData, self).__init__(
+            chart_data, name, number_format
+        )
+        self._bubble_sizes = []
+
     def add_data_point(self, x, y, size, number_format=None):
         """
         Append a new BubbleDataPoint object having the values *x*, *y*, and
@@ -773,16 +970,45 @@ class BubbleSeriesData(XySeriesData):
         If not provided, the number format is inherited from the series data.
         """
         data_point = BubbleDataPoint(self, x, y, size, number_format)
-        self.append(data_point)
+        self._x_values = _appended(self._x_values, x)
+        self._y_values = _appended(self._y_values, y)
+        self._bubble_sizes = _appended(self._bubble_sizes, size)
+        self._add_number_format(number_format)
         return data_point
 
+    def add_data_points(self, x_values, y_values, sizes):
+        """
+        Append a data point for each set of values in *x_values*,
+        *y_values*, and *sizes*, each an iterable of numbers or
+        a one-dimensional array of numbers like a NumPy array or
+        `array.array`. The data points have the number format of this series.
+        Raises |ValueError| when the sequences are not the same length.
+        """
+        self._x_values, self._y_values, self._bubble_sizes = (
+            _extended_columns(
+                (self._x_values, self._y_values, self._bubble_sizes),
+                (x_values, y_values, sizes)
+            )
+        )
+
+    def append(self, data_point):
+        """
+        Append the X, Y, and size values and number format of *data_point* to
+        this series.
+        """
+        self._bubble_sizes = _appended(
+            self._bubble_sizes, data_point.bubble_size
+        )
+        super(BubbleSeriesData, self).append(data_point)
+
     @property
     def bubble_sizes(self):
         """
         A sequence containing the bubble size for each datapoint in this
-        series, in data point order.
+        series, in data point order. A new copy is returned on each
+        reference.
         """
-        return [dp.bubble_size for dp in self._data_points]
+        return self._bubble_sizes[:]
 
     @property
     def bubble_sizes_ref(self):
@@ -792,6 +1018,15 @@ class BubbleSeriesData(XySeriesData):
         """
         return self._chart_data.bubble_sizes_ref(self)
 
+    def _data_point(self, idx):
+        """
+        Return a new |BubbleDataPoint| object for the data point at *idx*.
+        """
+        return BubbleDataPoint(
+            self, self._x_values[idx], self._y_values[idx],
+            self._bubble_sizes[idx], self._number_formats.get(idx)
+        )
+
 
 class CategoryDataPoint(_BaseDataPoint):
     """
@@ -851,3 +1086,99 @@ class BubbleDataPoint(XyDataPoint):
         The value representing the size of the bubble for this data point.
         """
         return self._size
+
+
+# ---array.array type codes of the buffer formats kept as an array, rather
+# than as a list of Python numbers---
+_ARRAY_TYPECODES = frozenset('bBhHiIlLqQfd')
+
+_FLOAT32 = struct.Struct('<f')
+
+
+def _appended(column, value):
+    """
+    Return *column* with *value* appended. When *column* is an array that
+    can't hold *value*, like |None| or a float appended to an array of
+    integers, the return value is a new list containing its values.
+    """
+    try:
+        column.append(value)
+    except (OverflowError, TypeError):
+        column = list(column)
+        column.append(value)
+    return column
+
+
+def _column(values):
+    """
+    Return a new column containing *values*. When *values* supports the
+    buffer protocol and is one-dimensional, like a NumPy array or
+    `array.array` of integers or floats, the column is an `array.array` of
+    the same type, holding each value in a few bytes rather than as a Python
+    object. Single-precision floats are held as doubles, each the shortest
+    decimal that reads back as the same single-precision value, so 0.1 is
+    written as `0.1` rather than `0.10000000149011612`. Otherwise the column
+    is a list.
+    """
+    try:
+        view = memoryview(values)
+    except (TypeError, ValueError):
+        return list(values)
+    if view.ndim != 1:
+        raise ValueError(
+            'expected one-dimensional array, got %d dimensions' % view.ndim
+        )
+    if view.format == 'f':
+        return array(str('d'), [_from_float32(v) for v in view.tolist()])
+    if view.format in _ARRAY_TYPECODES:
+        return array(str(view.format), view.tobytes())
+    return list(values)
+
+
+def _from_float32(value):
+    """
+    Return the shortest decimal float that reads back as single-precision
+    *value*, like 0.1 for the single-precision float nearest 0.1. *value*
+    itself is returned when there is none, as for NaN.
+    """
+    for precision in range(1, 10):
+        double = float('%.*g' % (precision, value))
+        try:
+            if _FLOAT32.unpack(_FLOAT32.pack(double))[0] == value:
+                return double
+        except (OverflowError, struct.error):
+            continue
+    return value
+
+
+def _extended(column, new_column):
+    """
+    Return *column* extended with the values in *new_column*, which is
+    returned itself when *column* is empty. When *column* is an array that
+    can't hold those values, the return value is a new list.
+    """
+    if not column:
+        return new_column
+    length = len(column)
+    try:
+        column.extend(new_column)
+    except (OverflowError, TypeError):
+        # ---an array can be left partly extended---
+        column = list(column[:length])
+        column.extend(new_column)
+    return column
+
+
+def _extended_columns(columns, values_seqs):
+    """
+    Return a tuple containing each column in *columns* extended with the
+    values in the corresponding sequence in *values_seqs*. Raises
+    |ValueError| when the sequences are not all the same length.
+    """
+    new_columns = [_column(values) for values in values_seqs]
+    if len(set(len(new_column) for new_column in new_columns)) > 1:
+        raise ValueError('data point value sequences differ in length')
+    return tuple(
+        _extended(column, new_column)
+        for column, new_column in zip(columns, new_columns)
+    )
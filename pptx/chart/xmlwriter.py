@@ -1474,14 +1474,16 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
         labels are numeric (including date type).
         """
         xml = ''
-        for idx, category in enumerate(self._series.categories):
+        categories = self._series.categories
+        for idx, cat_lbl_str in enumerate(
+                categories.numeric_str_vals(self._date_1904)):
             xml += (
                 '                <c:pt idx="{cat_idx}">\n'
                 '                  <c:v>{cat_lbl_str}</c:v>\n'
                 '                </c:pt>\n'
             ).format(**{
                 'cat_idx':     idx,
-                'cat_lbl_str': category.numeric_str_val(self._date_1904),
+                'cat_lbl_str': cat_lbl_str,
             })
         return xml
 
@@ -1492,14 +1494,14 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
         category names for this series.
         """
         xml = ''
-        for idx, category in enumerate(self._series.categories):
+        for idx, label in enumerate(self._series.categories.labels):
             xml += (
                 '                <c:pt idx="{cat_idx}">\n'
                 '                  <c:v>{cat_label}</c:v>\n'
                 '                </c:pt>\n'
             ).format(**{
                 'cat_idx':   idx,
-                'cat_label': escape(to_unicode(category.label)),
+                'cat_label': escape(to_unicode(label)),
             })
         return xml
 
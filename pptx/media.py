@@ -12,11 +12,16 @@ import os
 
 from .compat import is_string
 from .opc.constants import CONTENT_TYPE as CT
+from .opc.phys_pkg import FilePkgMember, PhysPkgMember
 from .util import lazyproperty
 
 
 class Video(object):
-    """Immutable value object representing a video such as MP4."""
+    """Immutable value object representing a video such as MP4.
+
+    *blob* is either the bytes of the video or a |PhysPkgMember| they are read
+    from on demand.
+    """
 
     def __init__(self, blob, mime_type, filename):
         super(Video, self).__init__()
@@ -30,16 +35,22 @@ class Video(object):
         return cls(blob, mime_type, filename)
 
     @classmethod
-    def from_path_or_file_like(cls, movie_file, mime_type):
+    def from_path_or_file_like(cls, movie_file, mime_type, lazy=False):
         """Return a new |Video| object containing video in *movie_file*.
 
         *movie_file* can be either a path (string) or a file-like
-        (e.g. StringIO) object.
+        (e.g. StringIO) object. When *lazy* is |True|, a video file given by
+        path is not read up front; it is hashed in chunks and only read,
+        again in chunks, when the presentation it is added to is saved. So
+        the file must remain available and unchanged until then.
         """
         if is_string(movie_file):
             # treat movie_file as a path
-            with open(movie_file, 'rb') as f:
-                blob = f.read()
+            if lazy:
+                blob = FilePkgMember(movie_file)
+            else:
+                with open(movie_file, 'rb') as f:
+                    blob = f.read()
             filename = os.path.basename(movie_file)
         else:
             # assume movie_file is a file-like object
@@ -51,6 +62,17 @@ class Video(object):
     @property
     def blob(self):
         """The bytestream of the media "file"."""
+        if isinstance(self._blob, PhysPkgMember):
+            return self._blob.blob
+        return self._blob
+
+    @property
+    def blob_source(self):
+        """The bytes of this video or the |PhysPkgMember| they are read from.
+
+        Used as the blob of a part containing this video, so a video file is
+        only read when the part is saved.
+        """
         return self._blob
 
     @property
@@ -98,8 +120,11 @@ class Video(object):
     def sha1(self):
         """The SHA1 hash digest for the binary "file" of this video.
 
-        Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
+        Example: `'1be010ea47803b00e140b852765cdf84f491da47'`. A video file
+        is hashed in chunks, without being loaded.
         """
+        if isinstance(self._blob, PhysPkgMember):
+            return self._blob.sha1
         return hashlib.sha1(self._blob).hexdigest()
 
 
@@ -7,16 +7,34 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import
 
+import heapq
+import os
+import re
+
+from collections import Counter
+from copy import deepcopy
+from multiprocessing.pool import ThreadPool
+
+from pptx.compat import is_string
 from pptx.util import lazyproperty
 
 from .constants import RELATIONSHIP_TYPE as RT
 from .oxml import CT_Relationships, serialize_part_xml
 from ..oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
+from .phys_pkg import CachedPkgMember, PhysPkgMember
 from .pkgreader import PackageReader
 from .pkgwriter import PackageWriter
 
 
+# reltypes of relationships that are only meaningful while referenced by an
+# r:* attribute in the source part XML; candidates for an unreferenced sweep
+_EXPLICIT_RELTYPES = frozenset((
+    RT.AUDIO, RT.CHART, RT.HYPERLINK, RT.IMAGE, RT.MEDIA, RT.OLE_OBJECT,
+    RT.PACKAGE, RT.VIDEO,
+))
+
+
 class OpcPackage(object):
     """
     Main API class for |python-opc|. A new instance is constructed by calling
@@ -25,6 +43,16 @@ class OpcPackage(object):
     """
     def __init__(self):
         super(OpcPackage, self).__init__()
+        # ---physical package a lazily-loaded package still reads parts
+        # from, and the path of the file any part may still depend on---
+        self._phys_reader = None
+        self._source_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def after_unmarshal(self):
         """
@@ -35,25 +63,23 @@ class OpcPackage(object):
         """
         pass
 
-    def iter_parts(self):
+    def close(self):
         """
-        Generate exactly one reference to each of the parts in the package by
-        performing a depth-first traversal of the rels graph.
+        Close the package file this package was lazily loaded from,
+        releasing its file handle. A part not yet read from that file can no
+        longer be used or saved afterward. Has no effect when the package
+        was not loaded lazily.
         """
-        def walk_parts(source, visited=list()):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
+        phys_reader, self._phys_reader = self._phys_reader, None
+        if phys_reader is not None:
+            phys_reader.close()
 
-        for part in walk_parts(self):
+    def iter_parts(self):
+        """
+        Generate exactly one reference to each of the parts in the package,
+        in the order of a depth-first traversal of the rels graph.
+        """
+        for part in self._part_index.parts:
             yield part
 
     def iter_rels(self):
@@ -61,22 +87,21 @@ class OpcPackage(object):
         Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
+        visited = set()
+        stack = [iter(self.rels.values())]
+        while stack:
+            for rel in stack[-1]:
                 yield rel
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
-            yield rel
+                visited.add(part)
+                stack.append(iter(part.rels.values()))
+                break
+            else:
+                stack.pop()
 
     def load_rel(self, reltype, target, rId, is_external=False):
         """
@@ -106,22 +131,34 @@ class OpcPackage(object):
         containing a single replacement item, a '%d' to be used to insert the
         integer portion of the partname. Example: '/ppt/slides/slide%d.xml'
         """
-        partnames = [part.partname for part in self.iter_parts()]
-        for n in range(1, len(partnames)+2):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
-        raise Exception('ProgrammingError: ran out of candidate_partnames')
+        stem = tmpl.split('%d')[0]
+        return PackURI(tmpl % self._part_index.next_available_idx(stem))
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False, workers=None, mmap=False):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        *pkg_file*. When *lazy* is |True|, the blob of each part is not read
+        (and its XML not parsed) until it is first referenced. *pkg_file*
+        must remain available (a stream must not be closed and a file must
+        not be overwritten) for as long as a lazily-loaded package is in use.
+        When *workers* is greater than 1, part XML is parsed on a pool of
+        that many threads. When *mmap* is |True|, *pkg_file* is memory-mapped
+        and the blob of each part stored in it without compression, like
+        most media, is a zero-copy `memoryview` of the mapping until the
+        part is changed. *pkg_file* must then also remain unchanged for as
+        long as the package is in use.
+
+        A package can be saved to the file it was loaded from either way; the
+        contents of its parts still in that file are read into memory first.
+        :meth:`close` releases the file of a lazily-loaded package.
+        """
+        pkg_reader = PackageReader.from_file(pkg_file, lazy, mmap)
         package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        Unmarshaller.unmarshal(pkg_reader, package, PartFactory, workers)
+        package._phys_reader = pkg_reader.phys_reader
+        if (lazy or mmap) and is_string(pkg_file):
+            package._source_path = pkg_file
         return package
 
     def part_related_by(self, reltype):
@@ -146,6 +183,7 @@ class OpcPackage(object):
         relationship if there is one, otherwise a newly created one.
         """
         rel = self.rels.get_or_add(reltype, part)
+        self._part_index.add_related(self, part)
         return rel.rId
 
     @lazyproperty
@@ -156,14 +194,41 @@ class OpcPackage(object):
         """
         return RelationshipCollection(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, workers=None, compression=None):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
-        """
+        a file (a string) or a file-like object. When *workers* is greater
+        than 1, parts are serialized and compressed on a pool of that many
+        threads. *compression* is a |CompressionPolicy| instance or profile
+        name determining how each part is compressed.
+        """
+        source_path = self._source_path
+        if (source_path is not None and is_string(pkg_file) and
+                _is_same_file(pkg_file, source_path)):
+            self._detach_from_source()
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, workers, compression
+        )
+
+    def _detach_from_source(self):
+        """
+        Read the contents of each part still in the file this package was
+        loaded from into memory and close that file, so it can be
+        overwritten.
+        """
+        for part in self.iter_parts():
+            part.detach_from_source()
+        self.close()
+        self._source_path = None
+
+    @lazyproperty
+    def _part_index(self):
+        """
+        |_PartIndex| object indexing the parts in this package.
+        """
+        return _PartIndex(self)
 
 
 class Part(object):
@@ -226,10 +291,39 @@ class Part(object):
         """
         return self._content_type
 
+    def detach_from_source(self):
+        """
+        Hold the contents of this part in memory where they are still read
+        from, or are a view of, the package file it was loaded from, so that
+        file can be closed or overwritten. The part remains unmodified.
+        """
+        if self._member is not None:
+            self._member = self._member.cached()
+        loaded_blob = self._loaded_blob
+        if isinstance(loaded_blob, memoryview):
+            self._loaded_blob = loaded_blob.tobytes()
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    @property
+    def _blob(self):
+        """
+        Bytes of this part. When this part was loaded lazily, these are read
+        from its physical package member on first reference.
+        """
+        if self._loaded_blob is None and self._member is not None:
+            self._loaded_blob = self._member.blob
+        return self._loaded_blob
+
+    @_blob.setter
+    def _blob(self, value):
+        if isinstance(value, PhysPkgMember):
+            self._member, self._loaded_blob = value, None
+        else:
+            self._member, self._loaded_blob = None, value
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -239,7 +333,10 @@ class Part(object):
         methods exist for adding a new relationship to a part when
         manipulating a part.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external and self._package is not None:
+            self._package._part_index.add_related(self, target)
+        return rel
 
     @property
     def package(self):
@@ -248,6 +345,16 @@ class Part(object):
         """
         return self._package
 
+    @property
+    def unmodified_member(self):
+        """
+        |PhysPkgMember| this part was lazily loaded from, or |None| if this
+        part was not loaded lazily or its content may have changed since it
+        was loaded. An unmodified part is copied as-is when the package is
+        saved, without being reserialized or recompressed.
+        """
+        return self._member
+
     @property
     def partname(self):
         """
@@ -261,7 +368,9 @@ class Part(object):
         if not isinstance(partname, PackURI):
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
-        self._partname = partname
+        old_partname, self._partname = self._partname, partname
+        if self._package is not None:
+            self._package._part_index.rename(self, old_partname)
 
     # relationship management interface for child objects ------------
 
@@ -272,7 +381,41 @@ class Part(object):
         implicit relationships.
         """
         if self._rel_ref_count(rId) < 2:
-            del self.rels[rId]
+            self._drop_rels((rId,))
+
+    def drop_unreferenced_rels(self, rIds=None):
+        """
+        Remove each relationship in *rIds* that is no longer referenced from
+        the XML of this part, counting references in a single pass over the
+        XML. Use this after removing many elements, such as pictures, from
+        the part rather than calling :meth:`drop_rel` once for each. When
+        *rIds* is |None|, every relationship of a reltype only ever used by
+        explicit reference (image, hyperlink, chart, media, etc.) is a
+        candidate; implicit relationships, like slide to slide layout, are
+        left in place. When there is only one candidate, just the references
+        to it are counted. Returns the list of rIds dropped.
+        """
+        rels = self.rels
+        if rIds is None:
+            rIds = [
+                rId for rId, rel in rels.items()
+                if rel.reltype in _EXPLICIT_RELTYPES
+            ]
+        candidates, seen = [], set()
+        for rId in rIds:
+            if rId in rels and rId not in seen:
+                candidates.append(rId)
+                seen.add(rId)
+        if not candidates:
+            return []
+        if len(candidates) == 1:
+            rId = candidates[0]
+            ref_counts = {rId: self._rel_ref_count(rId)}
+        else:
+            ref_counts = self._rel_ref_counts()
+        dropped = [rId for rId in candidates if ref_counts[rId] == 0]
+        self._drop_rels(dropped)
+        return dropped
 
     def part_related_by(self, reltype):
         """
@@ -292,6 +435,8 @@ class Part(object):
             return self.rels.get_or_add_ext_rel(reltype, target)
         else:
             rel = self.rels.get_or_add(reltype, target)
+            if self._package is not None:
+                self._package._part_index.add_related(self, target)
             return rel.rId
 
     @property
@@ -319,13 +464,30 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
+    def _drop_rels(self, rIds):
+        """
+        Remove the relationships identified by *rIds* and let the package
+        part index know, so it can drop any target part no longer reachable.
+        """
+        rels = [self.rels.pop(rId) for rId in rIds]
+        if self._package is not None:
+            self._package._part_index.rels_dropped(self, rels)
+
     def _rel_ref_count(self, rId):
         """
-        Return the count of references in this part's XML to the relationship
-        identified by *rId*.
+        Return the number of r:* attributes in this part's XML that reference
+        *rId*. The count is done by the XPath engine, so no Python object is
+        created for the references to other relationships.
         """
-        rIds = self._element.xpath('//@r:id')
-        return len([_rId for _rId in rIds if _rId == rId])
+        return int(self._element.xpath('count(//@r:*[.=$rId])', rId=rId))
+
+    def _rel_ref_counts(self):
+        """
+        Return a |Counter| mapping each rId referenced by an r:* attribute in
+        this part's XML to the number of such references, gathered in a
+        single pass over the XML.
+        """
+        return Counter(self._element.xpath('//@r:*'))
 
 
 class XmlPart(Part):
@@ -347,7 +509,10 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        # ---a lazily-loaded part is parsed on first reference to its XML---
+        if isinstance(blob, PhysPkgMember):
+            return cls(partname, content_type, blob, package)
+        element = _parse_part_xml(blob)
         return cls(partname, content_type, element, package)
 
     @property
@@ -359,6 +524,98 @@ class XmlPart(Part):
         """
         return self
 
+    @property
+    def _element(self):
+        """
+        Root element of the XML of this part. When this part was loaded
+        lazily, its XML is parsed from its physical package member on first
+        reference, after which the part is considered modified.
+        """
+        if self._loaded_element is None and self._member is not None:
+            self._loaded_element = _load_member_xml(self._member)
+            # ---the element may be changed from here on, so the part can no
+            # longer be copied from its member on save---
+            self._member = None
+        return self._loaded_element
+
+    @_element.setter
+    def _element(self, value):
+        if isinstance(value, PhysPkgMember):
+            self._member, self._loaded_element = value, None
+        else:
+            self._loaded_element = value
+
+
+def _is_same_file(path, other_path):
+    """
+    Return |True| if *path* and *other_path* refer to the same file.
+    """
+    try:
+        return os.path.samefile(path, other_path)
+    except (AttributeError, OSError):
+        # ---a file that doesn't exist, or Python 2 on Windows---
+        return (
+            os.path.normcase(os.path.abspath(path)) ==
+            os.path.normcase(os.path.abspath(other_path))
+        )
+
+
+def _load_member_xml(member):
+    """
+    Return the root element of the XML in *member*. The XML of
+    a |CachedPkgMember| is parsed only once; each part loaded from it gets
+    a deep copy of that element, which takes a fraction of the time parsing
+    does.
+    """
+    if not isinstance(member, CachedPkgMember):
+        return _parse_part_xml(member.blob)
+    if member.element is None:
+        member.element = _parse_part_xml(member.blob)
+    return deepcopy(member.element)
+
+
+def _parse_part_xml(blob):
+    """
+    Return the root element of the XML in *blob*, which is a `memoryview`
+    rather than bytes when it is a stored member of a memory-mapped package.
+    """
+    if isinstance(blob, memoryview):
+        blob = blob.tobytes()
+    return parse_xml(blob)
+
+
+class PackageTemplate(object):
+    """
+    Package read once from a file, from which any number of independent
+    packages can be created quickly. Each new package shares the unchanging
+    bytes of the template; the XML of a part, parsed once for the template,
+    is only copied when that part's XML is first referenced, and a part left
+    untouched is saved as-is from its cached compressed form.
+    """
+    def __init__(self, pkg_reader):
+        super(PackageTemplate, self).__init__()
+        self._pkg_reader = pkg_reader
+
+    @classmethod
+    def from_file(cls, pkg_file):
+        """
+        Return a |PackageTemplate| instance loaded with the contents of
+        *pkg_file*, a path or file-like object. *pkg_file* is no longer
+        needed once this method returns.
+        """
+        return cls(PackageReader.cached_from_file(pkg_file))
+
+    def new_package(self, package_cls=OpcPackage):
+        """
+        Return a new instance of *package_cls*, a subclass of |OpcPackage|,
+        containing a copy of the parts of this template. Changes to the new
+        package don't affect this template or other packages created from
+        it.
+        """
+        package = package_cls()
+        Unmarshaller.unmarshal(self._pkg_reader, package, PartFactory)
+        return package
+
 
 class PartFactory(object):
     """
@@ -384,14 +641,285 @@ class PartFactory(object):
         return cls.default_part_type
 
 
+class _PartIndex(object):
+    """
+    Index of the parts in a package, providing iteration in rels-graph order
+    and constant-time lookup by partname. The index is built by a single
+    traversal of the rels graph on first use and kept current as parts are
+    related and renamed. Dropping a relationship can disconnect any number of
+    parts from the graph, so the index is invalidated, causing it to be
+    rebuilt the next time it is used, when a dropped relationship leaves its
+    target part unreachable.
+    """
+    def __init__(self, package):
+        super(_PartIndex, self).__init__()
+        self._package = package
+        self._parts = None
+        self._generation = 0
+
+    _numbered_partname_re = re.compile(r'^(.*?)([1-9][0-9]*)\.[^./]+$')
+
+    def __contains__(self, partname):
+        """
+        True if a part having *partname* is present in the package.
+        """
+        self._ensure_built()
+        return partname in self._parts_by_partname
+
+    def __len__(self):
+        self._ensure_built()
+        return len(self._parts)
+
+    def add_related(self, source, target):
+        """
+        Add *target* and the parts reachable from it to the index, when
+        *source*, the package or one of its parts, has just been related to
+        it. Nothing needs doing when *source* is not (yet) connected to the
+        package, the parts will be indexed when it is.
+        """
+        if self._parts is None:
+            return
+        if target in self._part_set:
+            return
+        if source is not self._package and source not in self._part_set:
+            return
+        self._add(target)
+        for part in self._iter_unvisited_parts(target, self._part_set):
+            self._add(part)
+
+    @property
+    def generation(self):
+        """
+        Integer that changes each time this index is invalidated or the blob
+        of a part is replaced, allowing a dependent index to detect that
+        parts may have been removed or changed since it was built.
+        """
+        return self._generation
+
+    def blob_changed(self):
+        """
+        Note that the blob of a part in the package has been replaced, so an
+        index of part hashes is rebuilt when next used. The partname index
+        itself remains current.
+        """
+        self._generation += 1
+
+    def invalidate(self):
+        """
+        Discard the index, causing it to be rebuilt when next used.
+        """
+        self._parts = None
+        self._generation += 1
+
+    def next_available_idx(self, stem):
+        """
+        Return the lowest partname index not used by a part having a partname
+        of the form *stem* + idx + extension, e.g. 3 when the package
+        contains '/ppt/media/image1.png' and '/ppt/media/image2.jpeg' but no
+        other partname beginning with *stem* '/ppt/media/image' and ending in
+        a number and an extension.
+        """
+        self._ensure_built()
+        allocator = self._idx_allocators.get(stem)
+        if allocator is None:
+            return 1
+        return allocator.next_available
+
+    @property
+    def parts(self):
+        """
+        Sequence of the parts in the package, in depth-first traversal order
+        of the rels graph.
+        """
+        self._ensure_built()
+        return tuple(self._parts)
+
+    def rels_dropped(self, source, rels):
+        """
+        Update the index after *rels* have been dropped from *source*, the
+        package or one of its parts. The index is invalidated only when the
+        target part of one of *rels* is no longer reachable from the
+        package. External relationships, like hyperlinks, and a target part
+        *source* is still related to by another relationship need no
+        traversal at all, otherwise the rels graph is searched until each
+        target part is found again.
+        """
+        if self._parts is None:
+            return
+        if source is not self._package and source not in self._part_set:
+            return
+        still_related = set(
+            rel.target_part for rel in source.rels.values()
+            if not rel.is_external
+        )
+        targets = set(
+            rel.target_part for rel in rels
+            if not rel.is_external and rel.target_part not in still_related
+        )
+        if not targets:
+            return
+        for part in self._iter_unvisited_parts(self._package, set()):
+            targets.discard(part)
+            if not targets:
+                return
+        self.invalidate()
+
+    def rename(self, part, old_partname):
+        """
+        Update the index after *part* has been renamed from *old_partname*.
+        """
+        if self._parts is None or part not in self._part_set:
+            return
+        if self._parts_by_partname.get(old_partname) is part:
+            del self._parts_by_partname[old_partname]
+        self._parts_by_partname[part.partname] = part
+        self._release_idx(old_partname)
+        self._use_idx(part.partname)
+
+    def _add(self, part):
+        self._parts.append(part)
+        self._part_set.add(part)
+        self._parts_by_partname[part.partname] = part
+        self._use_idx(part.partname)
+
+    def _ensure_built(self):
+        """
+        Traverse the rels graph of the package to build the index, unless it
+        is already current.
+        """
+        if self._parts is not None:
+            return
+        self._parts, self._part_set, self._parts_by_partname = [], set(), {}
+        self._idx_allocators = {}
+        for part in self._iter_unvisited_parts(self._package, self._part_set):
+            self._add(part)
+
+    @staticmethod
+    def _iter_unvisited_parts(source, visited):
+        """
+        Generate each part reachable from *source* that is not in *visited*,
+        in depth-first order, adding each to *visited* as it is generated.
+        The traversal is iterative, so graph depth is not limited by the
+        recursion limit.
+        """
+        stack = [iter(source.rels.values())]
+        while stack:
+            for rel in stack[-1]:
+                if rel.is_external:
+                    continue
+                part = rel.target_part
+                if part in visited:
+                    continue
+                visited.add(part)
+                yield part
+                stack.append(iter(part.rels.values()))
+                break
+            else:
+                stack.pop()
+
+    def _release_idx(self, partname):
+        """
+        Make the partname index of *partname*, if it has one, available for
+        reuse.
+        """
+        match = self._numbered_partname_re.match(partname)
+        if match is None:
+            return
+        stem, idx = match.group(1), int(match.group(2))
+        self._idx_allocators[stem].remove(idx)
+
+    def _use_idx(self, partname):
+        """
+        Record the partname index of *partname*, if it has one, as used.
+        """
+        match = self._numbered_partname_re.match(partname)
+        if match is None:
+            return
+        stem, idx = match.group(1), int(match.group(2))
+        allocator = self._idx_allocators.get(stem)
+        if allocator is None:
+            allocator = self._idx_allocators[stem] = _IdxAllocator()
+        allocator.add(idx)
+
+
+class _IdxAllocator(object):
+    """
+    Tracks the indexes in use by the partnames sharing a stem, like 3 for
+    '/ppt/slides/slide3.xml', and finds the lowest unused one, reusing gaps
+    in the sequence, in amortized O(log n) time.
+    """
+    def __init__(self):
+        super(_IdxAllocator, self).__init__()
+        # ---a use count, two parts can briefly share a partname when renamed
+        self._use_counts = {}
+        # ---heap of unused indexes below self._limit, possibly containing
+        # indexes since reused, which are discarded as encountered
+        self._gaps = []
+        # ---each index below this is either used or present in self._gaps
+        self._limit = 1
+
+    def add(self, idx):
+        """
+        Record a use of *idx*.
+        """
+        self._use_counts[idx] = self._use_counts.get(idx, 0) + 1
+
+    @property
+    def next_available(self):
+        """
+        The lowest index not currently in use. The index is not reserved;
+        the same value is returned until it is added.
+        """
+        gaps, use_counts = self._gaps, self._use_counts
+        while gaps and gaps[0] in use_counts:
+            heapq.heappop(gaps)
+        if gaps:
+            return gaps[0]
+        while self._limit in use_counts:
+            self._limit += 1
+        return self._limit
+
+    def remove(self, idx):
+        """
+        Remove a use of *idx*, making it available once no use remains.
+        """
+        count = self._use_counts.get(idx, 0) - 1
+        if count > 0:
+            self._use_counts[idx] = count
+            return
+        self._use_counts.pop(idx, None)
+        if idx < self._limit:
+            heapq.heappush(self._gaps, idx)
+
+
 class RelationshipCollection(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+    Relationships are also indexed by reltype and by reltype and target, so
+    finding or adding a relationship takes constant time regardless of how
+    many relationships the collection contains. The indexes are maintained
+    by every method that adds or removes an item.
     """
+    _rId_re = re.compile(r'^rId([1-9][0-9]*)$')
+
     def __init__(self, baseURI):
         super(RelationshipCollection, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_reltype = {}
+        self._rels_by_match_key = {}
+        self._rId_allocator = _IdxAllocator()
+
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._unindex(rId, rel)
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            del self[rId]
+        super(RelationshipCollection, self).__setitem__(rId, rel)
+        self._index(rId, rel)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -399,10 +927,15 @@ class RelationshipCollection(dict):
         """
         rel = _Relationship(rId, reltype, target, self._baseURI, is_external)
         self[rId] = rel
-        if not is_external:
-            self._target_parts_by_rId[rId] = target
         return rel
 
+    def clear(self):
+        super(RelationshipCollection, self).clear()
+        self._target_parts_by_rId.clear()
+        self._rels_by_reltype.clear()
+        self._rels_by_match_key.clear()
+        self._rId_allocator = _IdxAllocator()
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -436,6 +969,18 @@ class RelationshipCollection(dict):
         rel = self._get_rel_of_type(reltype)
         return rel.target_part
 
+    def pop(self, rId, *default):
+        if rId not in self:
+            return super(RelationshipCollection, self).pop(rId, *default)
+        rel = self[rId]
+        del self[rId]
+        return rel
+
+    def popitem(self):
+        rId, rel = super(RelationshipCollection, self).popitem()
+        self._unindex(rId, rel)
+        return rId, rel
+
     @property
     def related_parts(self):
         """
@@ -444,6 +989,15 @@ class RelationshipCollection(dict):
         """
         return self._target_parts_by_rId
 
+    def setdefault(self, rId, rel):
+        if rId not in self:
+            self[rId] = rel
+        return self[rId]
+
+    def update(self, *args, **kwargs):
+        for rId, rel in dict(*args, **kwargs).items():
+            self[rId] = rel
+
     @property
     def xml(self):
         """
@@ -462,20 +1016,12 @@ class RelationshipCollection(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        matching = self._rels_by_match_key.get(
+            (reltype, target, bool(is_external))
+        )
+        if not matching:
+            return None
+        return matching[0]
 
     def _get_rel_of_type(self, reltype):
         """
@@ -483,7 +1029,7 @@ class RelationshipCollection(dict):
         Raises |KeyError| if no matching relationship is found. Raises
         |ValueError| if more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
+        matching = self._rels_by_reltype.get(reltype, ())
         if len(matching) == 0:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
@@ -492,16 +1038,67 @@ class RelationshipCollection(dict):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    def _index(self, rId, rel):
+        """
+        Add *rel*, having key *rId*, to the indexes of this collection.
+        """
+        if not rel.is_external:
+            self._target_parts_by_rId[rId] = rel.target_part
+        self._rels_by_reltype.setdefault(rel.reltype, []).append(rel)
+        self._rels_by_match_key.setdefault(
+            self._match_key(rel), []
+        ).append(rel)
+        rId_idx = self._rId_idx(rId)
+        if rId_idx is not None:
+            self._rId_allocator.add(rId_idx)
+
+    @staticmethod
+    def _match_key(rel):
+        """
+        Return the `(reltype, target, is_external)` key used to look up
+        a relationship to a particular target, where *target* is the target
+        part or, for an external relationship, the target ref.
+        """
+        target = rel.target_ref if rel.is_external else rel.target_part
+        return (rel.reltype, target, rel.is_external)
+
     @property
     def _next_rId(self):
         """
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        return 'rId%d' % self._rId_allocator.next_available
+
+    @classmethod
+    def _rId_idx(cls, rId):
+        """
+        Return the integer portion of *rId*, e.g. 19 for 'rId19', or |None|
+        if *rId* is not of that form.
+        """
+        if not is_string(rId):
+            return None
+        match = cls._rId_re.match(rId)
+        if match is None:
+            return None
+        return int(match.group(1))
+
+    def _unindex(self, rId, rel):
+        """
+        Remove *rel*, having key *rId*, from the indexes of this collection.
+        """
+        self._target_parts_by_rId.pop(rId, None)
+        for rels_by_key, key in (
+            (self._rels_by_reltype, rel.reltype),
+            (self._rels_by_match_key, self._match_key(rel)),
+        ):
+            rels = rels_by_key[key]
+            rels.remove(rel)
+            if not rels:
+                del rels_by_key[key]
+        rId_idx = self._rId_idx(rId)
+        if rId_idx is not None:
+            self._rId_allocator.remove(rId_idx)
 
 
 class Unmarshaller(object):
@@ -510,14 +1107,16 @@ class Unmarshaller(object):
     instance.
     """
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, workers=None):
         """
         Construct graph of parts and realized relationships based on the
         contents of *pkg_reader*, delegating construction of each part to
-        *part_factory*. Package relationships are added to *pkg*.
+        *part_factory*. Package relationships are added to *pkg*. Parts are
+        constructed on a pool of *workers* threads when *workers* is greater
+        than 1.
         """
         parts = Unmarshaller._unmarshal_parts(
-            pkg_reader, package, part_factory
+            pkg_reader, package, part_factory, workers
         )
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
         for part in parts.values():
@@ -525,17 +1124,34 @@ class Unmarshaller(object):
         package.after_unmarshal()
 
     @staticmethod
-    def _unmarshal_parts(pkg_reader, package, part_factory):
+    def _unmarshal_parts(pkg_reader, package, part_factory, workers=None):
         """
         Return a dictionary of |Part| instances unmarshalled from
         *pkg_reader*, keyed by partname. Side-effect is that each part in
-        *pkg_reader* is constructed using *part_factory*.
+        *pkg_reader* is constructed using *part_factory*. Construction,
+        which for an XML part is dominated by parsing its XML, is spread
+        across a pool of *workers* threads when *workers* is greater than 1;
+        lxml releases the GIL while parsing.
         """
+        sparts = list(pkg_reader.iter_sparts())
+
+        def load_part(spart):
+            partname, content_type, blob = spart
+            return part_factory(partname, content_type, blob, package)
+
+        if workers is None or workers < 2 or len(sparts) < 2:
+            loaded_parts = [load_part(spart) for spart in sparts]
+        else:
+            pool = ThreadPool(min(workers, len(sparts)))
+            try:
+                loaded_parts = pool.map(load_part, sparts)
+            finally:
+                pool.close()
+                pool.join()
+
         parts = {}
-        for partname, content_type, blob in pkg_reader.iter_sparts():
-            parts[partname] = part_factory(
-                partname, content_type, blob, package
-            )
+        for (partname, _, _), part in zip(sparts, loaded_parts):
+            parts[partname] = part
         return parts
 
     @staticmethod
@@ -6,21 +6,60 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import hashlib
+import mmap
 import os
+import platform
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import (
+    BadZipfile, ZipFile, ZipInfo, is_zipfile, ZIP64_LIMIT, ZIP_DEFLATED,
+    ZIP_STORED
+)
 
-from ..compat import is_string
+from ..compat import BytesIO, is_string
 from ..exceptions import PackageNotFoundError
+from ..util import lazyproperty
 
 from .packuri import CONTENT_TYPES_URI
 
+_LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+_LOCAL_FILE_HEADER_SIZE = 30
+
+# ---size of the chunks a member is hashed and streamed in---
+_CHUNK_SIZE = 1024 * 1024
+
+# ---compressed data held in memory up to this size, spooled to a
+# temporary file beyond it---
+_SPOOL_SIZE = 8 * 1024 * 1024
+
+# ---`ZipFile.open()` can write a member from Python 3.6 on---
+_CAN_STREAM_MEMBERS = sys.version_info >= (3, 6)
+
+# ---`ZipFile` has no API to add a member that is already compressed, so
+# copying one relies on its internals; this is limited to the versions of
+# CPython those internals are known for. Elsewhere, members are decompressed
+# and compressed again---
+_CAN_COPY_COMPRESSED = platform.python_implementation() == 'CPython' and (
+    sys.version_info[:2] == (2, 7) or
+    (3, 4) <= sys.version_info[:2] <= (3, 13)
+)
+
+# ---`ZipFile.writestr()` takes a compression level from Python 3.7 on---
+_CAN_SET_COMPRESSLEVEL = sys.version_info >= (3, 7)
+
 
 class PhysPkgReader(object):
     """
     Factory for physical package reader objects.
     """
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, mmap=False):
         # if *pkg_file* is a string, treat it as a path
         if is_string(pkg_file):
             if os.path.isdir(pkg_file):
@@ -45,14 +84,256 @@ class PhysPkgWriter(object):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
+class CompressedBlob(object):
+    """
+    Blob compressed ahead of being written to a zip package, so the
+    compression can be done on a thread other than the one writing the
+    package. *blob* is deflated at *level* when *compress_type* is
+    `ZIP_DEFLATED` and kept as-is when it is `ZIP_STORED`. Provides the
+    |PhysPkgMember| interface used by :meth:`_ZipPkgWriter.write_member`.
+    """
+    def __init__(self, blob, compress_type=ZIP_DEFLATED,
+                 level=zlib.Z_DEFAULT_COMPRESSION):
+        super(CompressedBlob, self).__init__()
+        if compress_type == ZIP_STORED:
+            self._compressed_blob = blob
+        else:
+            compressor = zlib.compressobj(
+                level, zlib.DEFLATED, -zlib.MAX_WBITS
+            )
+            self._compressed_blob = (
+                compressor.compress(blob) + compressor.flush()
+            )
+        self._compress_type = compress_type
+        self._crc = zlib.crc32(blob) & 0xffffffff
+        self._file_size = len(blob)
+
+    @property
+    def blob(self):
+        """
+        The uncompressed bytes of this blob.
+        """
+        if self._compress_type == ZIP_STORED:
+            return self._compressed_blob
+        return zlib.decompress(self._compressed_blob, -zlib.MAX_WBITS)
+
+    @property
+    def compressed(self):
+        """
+        A `(zipinfo, compressed_blob)` 2-tuple containing the zip entry
+        information, the same `ZipFile.writestr()` would produce, and the
+        compressed bytes of this blob.
+        """
+        zipinfo = ZipInfo('', time.localtime(time.time())[:6])
+        zipinfo.compress_type = self._compress_type
+        zipinfo.external_attr = 0o600 << 16
+        zipinfo.CRC = self._crc
+        zipinfo.file_size = self._file_size
+        return zipinfo, self._compressed_blob
+
+
+class PhysPkgMember(object):
+    """
+    Reference to a member of a physical package, such as a zip archive entry,
+    allowing its blob to be read on demand rather than when the package is
+    opened. Used as the blob source of a lazily-loaded part.
+    """
+    def __init__(self, phys_reader, pack_uri):
+        super(PhysPkgMember, self).__init__()
+        self._phys_reader = phys_reader
+        self._pack_uri = pack_uri
+
+    @property
+    def blob(self):
+        """
+        Contents of this member, read from the physical package on each
+        reference.
+        """
+        return self._phys_reader.blob_for(self._pack_uri)
+
+    @property
+    def compressed(self):
+        """
+        A `(zipinfo, compressed_blob)` 2-tuple containing the zip entry
+        information and the still-compressed bytes of this member, or |None|
+        if this member is not stored in compressed form.
+        """
+        return self._phys_reader.compressed_blob_for(self._pack_uri)
+
+    def cached(self):
+        """
+        Return a |CachedPkgMember| holding the contents of this member in
+        memory, so they remain available after its physical package is
+        closed or overwritten.
+        """
+        return CachedPkgMember.from_member(self)
+
+    def open(self):
+        """
+        Return a readable file-like object the contents of this member can
+        be read from in chunks, without reading all of them into memory.
+        """
+        return self._phys_reader.open(self._pack_uri)
+
+    @property
+    def pack_uri(self):
+        """
+        |PackURI| instance identifying this member in its physical package.
+        """
+        return self._pack_uri
+
+    @lazyproperty
+    def sha1(self):
+        """
+        SHA1 hash digest of the contents of this member, like
+        ``'1be010ea47803b00e140b852765cdf84f491da47'``, computed from
+        chunks of the contents read in turn.
+        """
+        sha1 = hashlib.sha1()
+        with self.open() as stream:
+            for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
+
+
+class CachedPkgMember(PhysPkgMember):
+    """
+    |PhysPkgMember| holding the blob of a member in memory, along with its
+    compressed form when it was stored compressed in a zip package, so it
+    remains available after its physical package is closed. Any number of
+    parts, in any number of packages, can be loaded from the same cached
+    member.
+    """
+    def __init__(self, pack_uri, blob, compressed=None):
+        super(CachedPkgMember, self).__init__(None, pack_uri)
+        self._blob = blob
+        self._compressed = compressed
+        # ---root element of the member XML, parsed by the first XML part
+        # to need it and copied by each, |None| until then---
+        self.element = None
+
+    @classmethod
+    def from_member(cls, member):
+        """
+        Return a |CachedPkgMember| instance holding the contents of
+        *member*, a |PhysPkgMember| of a package being read. Contents that
+        are a view of a memory-mapped package are copied.
+        """
+        compressed = member.compressed
+        if compressed is not None:
+            zipinfo, compressed_blob = compressed
+            compressed = (zipinfo, _as_bytes(compressed_blob))
+        return cls(member.pack_uri, _as_bytes(member.blob), compressed)
+
+    @property
+    def blob(self):
+        """
+        Contents of this member.
+        """
+        return self._blob
+
+    def cached(self):
+        """
+        Return this member, its contents are already held in memory.
+        """
+        return self
+
+    @property
+    def compressed(self):
+        """
+        A `(zipinfo, compressed_blob)` 2-tuple containing the zip entry
+        information and compressed bytes of this member, or |None| if it was
+        not stored in compressed form.
+        """
+        return self._compressed
+
+    def open(self):
+        """
+        Return a readable file-like object containing the contents of this
+        member.
+        """
+        return BytesIO(self._blob)
+
+
+class FilePkgMember(PhysPkgMember):
+    """
+    |PhysPkgMember| for a file outside any package, like a video file being
+    added to a presentation. The file is only read when its contents are
+    needed; it is hashed and written to a package being saved in chunks,
+    without all of it being held in memory. The file at *path* must remain
+    available and unchanged for as long as the member is in use; its size
+    and modification time are recorded when the member is created and
+    |IOError| is raised on a read if either has changed since.
+    """
+    def __init__(self, path):
+        super(FilePkgMember, self).__init__(None, None)
+        self._path = path
+        self._stat = self._stat_for(path)
+
+    @property
+    def blob(self):
+        """
+        Contents of the file, read from it on each reference.
+        """
+        with self.open() as f:
+            return f.read()
+
+    def cached(self):
+        """
+        Return this member, the file it reads from is not part of any
+        package.
+        """
+        return self
+
+    @property
+    def compressed(self):
+        """
+        |None|, the file is not stored in compressed form.
+        """
+        return None
+
+    def open(self):
+        """
+        Return the file, opened for reading in binary mode. Raises |IOError|
+        if the file has changed since this member was created.
+        """
+        f = open(self._path, 'rb')
+        if self._stat_for(f.fileno()) != self._stat:
+            f.close()
+            raise IOError(
+                "file '%s' changed after it was added" % self._path
+            )
+        return f
+
+    @property
+    def size(self):
+        """
+        Length in bytes of the file when this member was created.
+        """
+        return self._stat[0]
+
+    @staticmethod
+    def _stat_for(path_or_fd):
+        """
+        Return a `(size, mtime)` 2-tuple for the file at *path_or_fd*.
+        """
+        stat = (
+            os.fstat(path_or_fd) if isinstance(path_or_fd, int)
+            else os.stat(path_or_fd)
+        )
+        return stat.st_size, stat.st_mtime
+
+
 class _DirPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for an OPC package extracted into a
     directory.
     """
-    def __init__(self, path):
+    def __init__(self, path, mmap=False):
         """
         *path* is the path to a directory containing an expanded package.
+        *mmap* is accepted for interface consistency with |_ZipPkgReader|
+        but has no effect; each file is read when its blob is requested.
         """
         super(_DirPkgReader, self).__init__()
         self._path = os.path.abspath(path)
@@ -74,6 +355,20 @@ class _DirPkgReader(PhysPkgReader):
         """
         pass
 
+    def compressed_blob_for(self, pack_uri):
+        """
+        Return |None|; provides interface consistency with |_ZipPkgReader|,
+        but a file in a package directory is not compressed.
+        """
+        return None
+
+    def open(self, pack_uri):
+        """
+        Return the file corresponding to *pack_uri* in package directory,
+        opened for reading in binary mode.
+        """
+        return open(os.path.join(self._path, pack_uri.membername), 'rb')
+
     @property
     def content_types_xml(self):
         """
@@ -95,31 +390,66 @@ class _DirPkgReader(PhysPkgReader):
 
 class _ZipPkgReader(PhysPkgReader):
     """
-    Implements |PhysPkgReader| interface for a zip file OPC package.
+    Implements |PhysPkgReader| interface for a zip file OPC package. When
+    *mmap* is |True| and *pkg_file* is a path or an actual file, the file is
+    memory-mapped and the blob of each member stored without compression is
+    a zero-copy `memoryview` of the mapping rather than bytes read into
+    memory.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, mmap=False):
         super(_ZipPkgReader, self).__init__()
         self._zipf = ZipFile(pkg_file, 'r')
+        self._view = _memory_map(pkg_file) if mmap else None
 
     def blob_for(self, pack_uri):
         """
         Return blob corresponding to *pack_uri*. Raises |ValueError| if no
-        matching member is present in zip archive.
+        matching member is present in zip archive. The blob of a stored
+        member of a memory-mapped package is a `memoryview` instance.
         """
+        if self._view is not None:
+            zipinfo = self._zipf.getinfo(pack_uri.membername)
+            is_encrypted = zipinfo.flag_bits & 0x1
+            if zipinfo.compress_type == ZIP_STORED and not is_encrypted:
+                offset = self._data_offset(zipinfo)
+                return self._view[offset:offset + zipinfo.file_size]
         return self._zipf.read(pack_uri.membername)
 
     def close(self):
         """
-        Close the zip archive, releasing any resources it is using.
+        Close the zip archive, releasing any resources it is using. A memory
+        mapping is released once no blob still refers to it.
         """
         self._zipf.close()
+        self._view = None
+
+    def compressed_blob_for(self, pack_uri):
+        """
+        Return a `(zipinfo, compressed_blob)` 2-tuple for the zip archive
+        member corresponding to *pack_uri*, where *compressed_blob* is the
+        member data exactly as stored, without decompressing it.
+        """
+        zipinfo = self._zipf.getinfo(pack_uri.membername)
+        offset = self._data_offset(zipinfo)
+        if self._view is not None:
+            return zipinfo, self._view[offset:offset + zipinfo.compress_size]
+        fp = self._zipf.fp
+        fp.seek(offset)
+        return zipinfo, fp.read(zipinfo.compress_size)
 
     @property
     def content_types_xml(self):
         """
         Return the `[Content_Types].xml` blob from the zip package.
         """
-        return self.blob_for(CONTENT_TYPES_URI)
+        return self._zipf.read(CONTENT_TYPES_URI.membername)
+
+    def open(self, pack_uri):
+        """
+        Return a readable file-like object the zip archive member
+        corresponding to *pack_uri* is decompressed from as it is read.
+        """
+        return self._zipf.open(pack_uri.membername)
 
     def rels_xml_for(self, source_uri):
         """
@@ -127,11 +457,31 @@ class _ZipPkgReader(PhysPkgReader):
         item is present.
         """
         try:
-            rels_xml = self.blob_for(source_uri.rels_uri)
+            rels_xml = self._zipf.read(source_uri.rels_uri.membername)
         except KeyError:
             rels_xml = None
         return rels_xml
 
+    def _data_offset(self, zipinfo):
+        """
+        Return the offset in the package file of the data of the member
+        described by *zipinfo*, just past its local file header.
+        """
+        header_offset = zipinfo.header_offset
+        header_end = header_offset + _LOCAL_FILE_HEADER_SIZE
+        if self._view is not None:
+            fheader = self._view[header_offset:header_end].tobytes()
+        else:
+            fp = self._zipf.fp
+            fp.seek(header_offset)
+            fheader = fp.read(_LOCAL_FILE_HEADER_SIZE)
+        if fheader[:4] != _LOCAL_FILE_HEADER_SIGNATURE:
+            raise BadZipfile(
+                "bad local file header for '%s'" % zipinfo.filename
+            )
+        filename_len, extra_len = struct.unpack('<HH', fheader[26:30])
+        return header_end + filename_len + extra_len
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
@@ -139,6 +489,12 @@ class _ZipPkgWriter(PhysPkgWriter):
     """
     def __init__(self, pkg_file):
         super(_ZipPkgWriter, self).__init__()
+        # ---a stream that can't report its position, like a pipe or socket,
+        # is written to sequentially; every member is written with its size
+        # and CRC known in advance so nothing written needs revisiting---
+        self._seekable = is_string(pkg_file) or _is_seekable(pkg_file)
+        if not is_string(pkg_file) and not _is_tellable(pkg_file):
+            pkg_file = _TellableStream(pkg_file)
         self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
 
     def close(self):
@@ -154,3 +510,244 @@ class _ZipPkgWriter(PhysPkgWriter):
         *pack_uri*.
         """
         self._zipf.writestr(pack_uri.membername, blob)
+
+    def write_member(self, pack_uri, member, compress_type=ZIP_DEFLATED,
+                     level=None):
+        """
+        Write the contents of *member*, a |PhysPkgMember| of a package being
+        read, to this zip package with the membername corresponding to
+        *pack_uri*. A member of a zip package is copied in its compressed
+        form, without being decompressed and compressed again. Any other
+        member is compressed as *compress_type* and *level* specify while it
+        is written, a chunk at a time. A zip member is also decompressed and
+        compressed again when this Python's :class:`ZipFile` isn't known to
+        support copying it.
+        """
+        compressed = member.compressed
+        if compressed is None:
+            return self._write_stream(pack_uri.membername, member,
+                                      compress_type, level)
+        src_zipinfo, compressed_blob = compressed
+        if not _CAN_COPY_COMPRESSED:
+            return self._write_recompressed(
+                pack_uri.membername, member.blob, src_zipinfo.compress_type,
+                level
+            )
+        self._write_compressed(pack_uri.membername, src_zipinfo,
+                               compressed_blob)
+
+    def _write_compressed(self, membername, src_zipinfo, compressed_blob):
+        """
+        Write *compressed_blob*, already compressed as described by
+        *src_zipinfo*, to this zip package as *membername*.
+        *compressed_blob* can also be a readable file-like object holding
+        the `src_zipinfo.compress_size` compressed bytes, copied a chunk at
+        a time. The :class:`ZipFile` API has no way to add an
+        already-compressed member, so this follows the steps of
+        `ZipFile.writestr()` without the compression, holding the lock
+        `ZipFile` guards its file with. Only called when
+        `_CAN_COPY_COMPRESSED` is True.
+        """
+        zipf = self._zipf
+        is_stream = hasattr(compressed_blob, 'read')
+        zipinfo = ZipInfo(membername, src_zipinfo.date_time)
+        zipinfo.compress_type = src_zipinfo.compress_type
+        zipinfo.external_attr = src_zipinfo.external_attr
+        zipinfo.CRC = src_zipinfo.CRC
+        zipinfo.compress_size = (
+            src_zipinfo.compress_size if is_stream else len(compressed_blob)
+        )
+        zipinfo.file_size = src_zipinfo.file_size
+        with getattr(zipf, '_lock', None) or threading.RLock():
+            if getattr(zipf, '_writing', False):
+                raise ValueError(
+                    "can't write to the package while another member is "
+                    "being written"
+                )
+            # ---Python 3 tracks the end of the last member in `start_dir`---
+            start_dir = getattr(zipf, 'start_dir', None)
+            if start_dir is not None and getattr(zipf, '_seekable', True):
+                zipf.fp.seek(start_dir)
+            zipinfo.header_offset = zipf.fp.tell()
+            zipf._writecheck(zipinfo)
+            zipf._didModify = True
+            zipf.fp.write(zipinfo.FileHeader())
+            if is_stream:
+                shutil.copyfileobj(compressed_blob, zipf.fp, _CHUNK_SIZE)
+            else:
+                zipf.fp.write(compressed_blob)
+            zipf.filelist.append(zipinfo)
+            zipf.NameToInfo[zipinfo.filename] = zipinfo
+            if start_dir is not None:
+                zipf.start_dir = zipf.fp.tell()
+
+    def _write_recompressed(self, membername, blob, compress_type, level):
+        """
+        Write *blob* to this zip package as *membername*, compressed as
+        *compress_type* and *level* specify, using only the public
+        :class:`ZipFile` API. *level* is ignored before Python 3.7, where
+        `ZipFile.writestr()` can't set it.
+        """
+        zipinfo = ZipInfo(membername, time.localtime(time.time())[:6])
+        zipinfo.compress_type = compress_type
+        zipinfo.external_attr = 0o600 << 16
+        if level is None or not _CAN_SET_COMPRESSLEVEL:
+            return self._zipf.writestr(zipinfo, _as_bytes(blob))
+        self._zipf.writestr(zipinfo, _as_bytes(blob), compresslevel=level)
+
+    def _write_stream(self, membername, member, compress_type, level):
+        """
+        Write the contents of *member* to this zip package as *membername*,
+        reading and compressing them a chunk at a time through
+        `ZipFile.open()`. Before Python 3.6, which can't write a member that
+        way, and when this package is written to a stream that can't seek,
+        the member is compressed ahead of being written instead, so it is
+        written with its size and CRC known in advance.
+        """
+        if _CAN_STREAM_MEMBERS and self._seekable:
+            return self._write_opened(membername, member, compress_type,
+                                      level)
+        if not _CAN_COPY_COMPRESSED:
+            return self._write_recompressed(
+                membername, member.blob, compress_type, level
+            )
+        self._write_spooled(membername, member, compress_type, level)
+
+    def _write_opened(self, membername, member, compress_type, level):
+        """
+        Write the contents of *member* to this zip package as *membername*
+        through `ZipFile.open()`, a chunk at a time. `ZipFile.open()` takes
+        the compression of a member named by a string from the `compression`
+        and, from Python 3.7, `compresslevel` attributes of the
+        :class:`ZipFile`, so those are set for the call.
+        """
+        zipf = self._zipf
+        compression = zipf.compression
+        compresslevel = getattr(zipf, 'compresslevel', None)
+        zipf.compression = compress_type
+        if _CAN_SET_COMPRESSLEVEL:
+            zipf.compresslevel = level
+        try:
+            # ---a file member knows its size, which tells `ZipFile` whether
+            # the member needs ZIP64 extensions before it is written---
+            dst = zipf.open(
+                membername, 'w',
+                force_zip64=getattr(member, 'size', 0) > ZIP64_LIMIT
+            )
+        finally:
+            zipf.compression = compression
+            if _CAN_SET_COMPRESSLEVEL:
+                zipf.compresslevel = compresslevel
+        with member.open() as src, dst:
+            shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+    def _write_spooled(self, membername, member, compress_type, level):
+        """
+        Write the contents of *member* to this zip package as *membername*,
+        compressing them a chunk at a time into a temporary file, spooled in
+        memory until it outgrows `_SPOOL_SIZE`, that is then copied in with
+        :meth:`_write_compressed`. Only called when `_CAN_COPY_COMPRESSED` is
+        True.
+        """
+        if level is None:
+            level = zlib.Z_DEFAULT_COMPRESSION
+        compressor = (
+            None if compress_type == ZIP_STORED else
+            zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        )
+        zipinfo = ZipInfo(membername, time.localtime(time.time())[:6])
+        zipinfo.compress_type = compress_type
+        zipinfo.external_attr = 0o600 << 16
+        crc, file_size = 0, 0
+        with tempfile.SpooledTemporaryFile(_SPOOL_SIZE) as spool:
+            with member.open() as src:
+                for chunk in iter(lambda: src.read(_CHUNK_SIZE), b''):
+                    crc = zlib.crc32(chunk, crc)
+                    file_size += len(chunk)
+                    if compressor is not None:
+                        chunk = compressor.compress(chunk)
+                    spool.write(chunk)
+            if compressor is not None:
+                spool.write(compressor.flush())
+            zipinfo.CRC = crc & 0xffffffff
+            zipinfo.file_size = file_size
+            zipinfo.compress_size = spool.tell()
+            spool.seek(0)
+            self._write_compressed(membername, zipinfo, spool)
+
+
+class _TellableStream(object):
+    """
+    Wrapper adding `tell()` to a write-only stream, such as a pipe, socket or
+    HTTP response, which can't report its position. `ZipFile` needs the
+    position of each member to compose the central directory.
+    """
+    def __init__(self, stream):
+        super(_TellableStream, self).__init__()
+        self._stream = stream
+        self._position = 0
+
+    def flush(self):
+        flush = getattr(self._stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        self._stream.write(data)
+        self._position += len(data)
+
+
+def _as_bytes(blob):
+    """
+    Return *blob* as bytes, copied when it is a `memoryview`.
+    """
+    if isinstance(blob, memoryview):
+        return blob.tobytes()
+    return blob
+
+
+def _memory_map(pkg_file):
+    """
+    Return a read-only `memoryview` of a memory mapping of *pkg_file*, a path
+    or file object, or |None| if it can't be mapped, as when it is
+    a file-like object without a file descriptor, like |BytesIO|.
+    """
+    try:
+        if is_string(pkg_file):
+            with open(pkg_file, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            mapping = mmap.mmap(
+                pkg_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+    except (AttributeError, EnvironmentError, ValueError):
+        return None
+    try:
+        return memoryview(mapping)
+    except TypeError:  # ---Python 2 mmap doesn't support memoryview---
+        mapping.close()
+        return None
+
+
+def _is_seekable(stream):
+    """
+    Return |True| if *stream* supports random access.
+    """
+    try:
+        return stream.seekable()
+    except (AttributeError, IOError, OSError, ValueError):
+        return False
+
+
+def _is_tellable(stream):
+    """
+    Return |True| if *stream* can report its current position.
+    """
+    try:
+        stream.tell()
+    except (AttributeError, IOError, OSError):
+        return False
+    return True
@@ -10,7 +10,7 @@ from __future__ import absolute_import
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
-from .phys_pkg import PhysPkgReader
+from .phys_pkg import CachedPkgMember, PhysPkgMember, PhysPkgReader
 from .shared import CaseInsensitiveDict
 
 
@@ -19,29 +19,76 @@ class PackageReader(object):
     Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
     """
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, phys_reader=None):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._phys_reader = phys_reader
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False, mmap=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        When *lazy* is |True|, part blobs are not read; each serialized part
+        instead holds a |PhysPkgMember| reference to its blob and the
+        physical package is left open so the blob can be read on demand.
+        When *mmap* is |True|, the package file is memory-mapped and the blob
+        of each member stored without compression is a view of the mapping.
         """
-        phys_reader = PhysPkgReader(pkg_file)
+        phys_reader = PhysPkgReader(pkg_file, mmap)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, lazy
         )
+        if lazy:
+            return PackageReader(
+                content_types, pkg_srels, sparts, phys_reader
+            )
         phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
+    @staticmethod
+    def cached_from_file(pkg_file):
+        """
+        Return a |PackageReader| instance loaded with contents of *pkg_file*
+        that can be unmarshalled any number of times. The blob of each
+        serialized part is a |CachedPkgMember| holding the bytes read from
+        *pkg_file*, which is closed before this method returns.
+        """
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types = _ContentTypeMap.from_xml(
+                phys_reader.content_types_xml
+            )
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            sparts = tuple(
+                _SerializedPart(
+                    spart.partname, spart.content_type,
+                    CachedPkgMember.from_member(spart.blob), spart.srels
+                )
+                for spart in PackageReader._load_serialized_parts(
+                    phys_reader, pkg_srels, content_types, lazy=True
+                )
+            )
+        finally:
+            phys_reader.close()
+        return PackageReader(content_types, pkg_srels, sparts)
+
+    @property
+    def phys_reader(self):
+        """
+        The physical package reader the blobs of the serialized parts are
+        read from on demand when the package was read lazily, |None|
+        otherwise.
+        """
+        return self._phys_reader
+
     def iter_sparts(self):
         """
         Generate a 3-tuple `(partname, content_type, blob)` for each of the
-        serialized parts in the package.
+        serialized parts in the package. *blob* is a |PhysPkgMember| instance
+        rather than bytes when the package was read lazily.
         """
         for spart in self._sparts:
             yield (spart.partname, spart.content_type, spart.blob)
@@ -58,14 +105,17 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types,
+                               lazy=False):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
         starting with *pkg_srels*.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=lazy
+        )
         for partname, blob, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(partname, content_type, blob, srels)
@@ -83,25 +133,30 @@ class PackageReader(object):
             source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, visited_partnames=None,
+                         lazy=False):
         """
         Generate a 3-tuple `(partname, blob, srels)` for each of the parts in
         *phys_reader* by walking the relationship graph rooted at srels.
+        *blob* is a |PhysPkgMember| reference when *lazy* is |True|.
         """
         if visited_partnames is None:
-            visited_partnames = []
+            visited_partnames = set()
         for srel in srels:
             if srel.is_external:
                 continue
             partname = srel.target_partname
             if partname in visited_partnames:
                 continue
-            visited_partnames.append(partname)
+            visited_partnames.add(partname)
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
+            blob = (
+                PhysPkgMember(phys_reader, partname) if lazy
+                else phys_reader.blob_for(partname)
+            )
             yield (partname, blob, part_srels)
             for partname, blob, srels in PackageReader._walk_phys_parts(
-                    phys_reader, part_srels, visited_partnames):
+                    phys_reader, part_srels, visited_partnames, lazy):
                 yield (partname, blob, srels)
 
 
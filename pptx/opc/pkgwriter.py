@@ -7,10 +7,16 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+import zlib
+
+from collections import deque
+from multiprocessing.pool import ThreadPool
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
-from .phys_pkg import PhysPkgWriter
+from .phys_pkg import CompressedBlob, PhysPkgWriter
 from .shared import CaseInsensitiveDict
 from .spec import default_content_types
 
@@ -23,20 +29,61 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, workers=None, compression=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. When *workers* is greater than 1, part
+        blobs are serialized and compressed on a pool of that many threads.
+        *compression* is a |CompressionPolicy| instance or the name of one of
+        its profiles, like `'fast'`; each member is deflated at the default
+        level when it is |None|.
         """
+        compression = CompressionPolicy.from_spec(compression)
         phys_writer = PhysPkgWriter(pkg_file)
-        PackageWriter._write_content_types_stream(phys_writer, parts)
-        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        PackageWriter._write_content_types_stream(
+            phys_writer, parts, compression
+        )
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels, compression)
+        if workers is not None and workers > 1:
+            PackageWriter._write_parts_in_parallel(
+                phys_writer, parts, workers, compression
+            )
+        else:
+            PackageWriter._write_parts(phys_writer, parts, compression)
         phys_writer.close()
 
     @staticmethod
-    def _write_content_types_stream(phys_writer, parts):
+    def _write_blob(phys_writer, pack_uri, blob, content_type, compression):
+        """
+        Write *blob* to the package as *pack_uri*, compressed as
+        *compression* specifies for *content_type* when *compression* is not
+        |None|.
+        """
+        if compression is None:
+            phys_writer.write(pack_uri, blob)
+        else:
+            phys_writer.write_member(
+                pack_uri, compression.compress(blob, content_type)
+            )
+
+    @staticmethod
+    def _write_member(phys_writer, pack_uri, member, content_type,
+                      compression):
+        """
+        Write *member*, a |PhysPkgMember| or |CompressedBlob|, to the package
+        as *pack_uri*. A member not already compressed is compressed as
+        *compression* specifies for *content_type* as it is written.
+        """
+        if compression is None:
+            phys_writer.write_member(pack_uri, member)
+        else:
+            phys_writer.write_member(
+                pack_uri, member, *compression.zip_params(content_type)
+            )
+
+    @staticmethod
+    def _write_content_types_stream(phys_writer, parts, compression=None):
         """
         Write ``[Content_Types].xml`` part to the physical package with an
         appropriate content type lookup target for each part in *parts*.
@@ -44,26 +91,158 @@ class PackageWriter(object):
         content_types_blob = serialize_part_xml(
             _ContentTypesItem.xml_for(parts)
         )
-        phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
+        PackageWriter._write_blob(
+            phys_writer, CONTENT_TYPES_URI, content_types_blob, CT.XML,
+            compression
+        )
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, compression=None):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. A part
+        unmodified since it was lazily loaded is copied from its original
+        package member instead.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            member = part.unmodified_member
+            if member is None:
+                PackageWriter._write_blob(
+                    phys_writer, part.partname, part.blob, part.content_type,
+                    compression
+                )
+            else:
+                PackageWriter._write_member(
+                    phys_writer, part.partname, member, part.content_type,
+                    compression
+                )
+            if len(part._rels):
+                PackageWriter._write_blob(
+                    phys_writer, part.partname.rels_uri, part._rels.xml,
+                    CT.OPC_RELATIONSHIPS, compression
+                )
+
+    @staticmethod
+    def _write_parts_in_parallel(phys_writer, parts, workers,
+                                 compression=None):
+        """
+        Write *parts* to the package as :meth:`_write_parts` does, but with
+        the blob of each part serialized and compressed on a pool of
+        *workers* threads. lxml and zlib release the GIL for most of that
+        work. Members are still written in the order of *parts*, each as
+        soon as it is ready. No more than two parts per worker are held in
+        compressed form waiting to be written, so a slow output stream
+        doesn't cause the whole package to accumulate in memory.
+        """
+        policy = CompressionPolicy() if compression is None else compression
+
+        def compress(part):
+            member = part.unmodified_member
+            if member is not None:
+                return member
+            return policy.compress(part.blob, part.content_type)
+
+        def write(part, result):
+            PackageWriter._write_member(
+                phys_writer, part.partname, result.get(), part.content_type,
+                compression
+            )
             if len(part._rels):
-                phys_writer.write(part.partname.rels_uri, part._rels.xml)
+                PackageWriter._write_blob(
+                    phys_writer, part.partname.rels_uri, part._rels.xml,
+                    CT.OPC_RELATIONSHIPS, compression
+                )
+
+        pool = ThreadPool(workers)
+        try:
+            pending = deque()
+            for part in parts:
+                pending.append((part, pool.apply_async(compress, (part,))))
+                if len(pending) > 2 * workers:
+                    write(*pending.popleft())
+            while pending:
+                write(*pending.popleft())
+        finally:
+            pool.terminate()
+            pool.join()
 
     @staticmethod
-    def _write_pkg_rels(phys_writer, pkg_rels):
+    def _write_pkg_rels(phys_writer, pkg_rels, compression=None):
         """
         Write the XML rels item for *pkg_rels* ('/_rels/.rels') to the
         package.
         """
-        phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
+        PackageWriter._write_blob(
+            phys_writer, PACKAGE_URI.rels_uri, pkg_rels.xml,
+            CT.OPC_RELATIONSHIPS, compression
+        )
+
+
+class CompressionPolicy(object):
+    """
+    Determines how each member of a package is compressed when the package
+    is saved, based on its content type. Members having a content type in
+    *stored_content_types* are stored without compression. All others are
+    deflated at *level*, from 1 (fastest) to 9 (smallest), unless *levels*,
+    a dict, maps their content type to a level of its own.
+    """
+    def __init__(self, level=zlib.Z_DEFAULT_COMPRESSION,
+                 stored_content_types=(), levels=None):
+        super(CompressionPolicy, self).__init__()
+        self._level = level
+        self._stored_content_types = frozenset(stored_content_types)
+        self._levels = {} if levels is None else dict(levels)
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Return the |CompressionPolicy| instance specified by *spec*, which is
+        either such an instance or the name of a predefined profile:
+
+        * `'default'` deflates every member at the default level.
+        * `'fast'` stores already-compressed media, like JPEG, PNG and MP4,
+          without compression and deflates the rest at level 1.
+        * `'small'` also stores already-compressed media but deflates the
+          rest at level 9.
+
+        Returns |None| when *spec* is |None|. Raises |ValueError| on an
+        unknown profile name.
+        """
+        if spec is None or isinstance(spec, CompressionPolicy):
+            return spec
+        if spec == 'default':
+            return cls()
+        if spec == 'fast':
+            return cls(1, PRECOMPRESSED_CONTENT_TYPES)
+        if spec == 'small':
+            return cls(9, PRECOMPRESSED_CONTENT_TYPES)
+        raise ValueError("no compression profile named '%s'" % spec)
+
+    def compress(self, blob, content_type):
+        """
+        Return a |CompressedBlob| instance containing *blob*, compressed as
+        this policy specifies for *content_type*.
+        """
+        return CompressedBlob(blob, *self.zip_params(content_type))
+
+    def zip_params(self, content_type):
+        """
+        Return a `(compress_type, level)` 2-tuple describing how this policy
+        compresses a member having *content_type*, like
+        `(ZIP_DEFLATED, 6)`. *level* is |None| for a stored member.
+        """
+        if content_type in self._stored_content_types:
+            return ZIP_STORED, None
+        return ZIP_DEFLATED, self._levels.get(content_type, self._level)
+
+
+# content types of media already compressed in their own format, which
+# shrink negligibly, if at all, when deflated
+PRECOMPRESSED_CONTENT_TYPES = frozenset((
+    CT.ASF, CT.AVI, CT.GIF, CT.JPEG, CT.MOV, CT.MP4, CT.MPG, CT.MS_PHOTO,
+    CT.MS_VIDEO, CT.PNG, CT.SML_SHEET, CT.SWF, CT.VIDEO, CT.WMV,
+    CT.X_MS_VIDEO,
+))
 
 
 class _ContentTypesItem(object):
@@ -10,7 +10,10 @@ from __future__ import (
 )
 
 import os
+import re
+import threading
 
+from copy import deepcopy
 from lxml import etree
 
 from .ns import NamespacePrefixedTag
@@ -18,8 +21,20 @@ from .ns import NamespacePrefixedTag
 
 # configure etree XML parser -------------------------------
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+
+
+def _new_oxml_parser():
+    parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+    parser.set_element_class_lookup(element_class_lookup)
+    return parser
+
+
+oxml_parser = _new_oxml_parser()
+
+# lxml serializes concurrent use of a single parser, so each thread other
+# than the one loading this module gets a parser of its own
+_oxml_parser_thread = threading.current_thread()
+_thread_parsers = threading.local()
 
 
 def parse_from_template(template_name):
@@ -41,10 +56,139 @@ def parse_xml(xml):
     Return root lxml element obtained by parsing XML character string in
     *xml*, which can be either a Python 2.x string or unicode.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    root_element = etree.fromstring(xml, _current_parser())
     return root_element
 
 
+def parse_xml_template(tmpl, *args):
+    """
+    Return root lxml element equivalent to ``parse_xml(tmpl % args)``.
+
+    *tmpl* is an XML template string containing a ``%s`` or ``%d``
+    placeholder for each of *args*, each one appearing in an attribute value
+    or as the text of an element. The template is parsed only once; each
+    call thereafter produces its element by copying the parsed prototype
+    and setting the affected attribute values and element text. Note that
+    unlike with `parse_xml()`, argument values are not interpreted as XML,
+    so they need no escaping.
+    """
+    template = _xml_templates.get(tmpl)
+    if template is None:
+        template = _xml_templates[tmpl] = _XmlTemplate(tmpl)
+    return template.new_element(args)
+
+
+class _XmlTemplate(object):
+    """
+    An XML template string parsed once into a prototype element, along with
+    the locations in it of the values substituted for the placeholders.
+    """
+
+    _placeholder_re = re.compile(r'%%|%[sd]')
+    _marker_re = re.compile('\ue000(\\d+)\ue001')
+
+    def __init__(self, tmpl):
+        super(_XmlTemplate, self).__init__()
+        self._tmpl = tmpl
+        self._conversions = conversions = []
+
+        def mark_placeholder(match):
+            if match.group() == '%%':
+                return '%%'
+            conversions.append(match.group())
+            return '\ue000%d\ue001' % (len(conversions) - 1)
+
+        marked_xml = self._placeholder_re.sub(mark_placeholder, tmpl)
+        self._prototype = parse_xml(marked_xml.replace('%%', '%'))
+        self._steps, self._slots = self._locate_slots(self._prototype)
+
+    def new_element(self, args):
+        """
+        Return a new element having *args* substituted for the
+        placeholders in this template.
+        """
+        conversions = self._conversions
+        if len(args) != len(conversions):
+            raise TypeError(
+                'template takes %d arguments (%d given)' %
+                (len(conversions), len(args))
+            )
+        if self._slots is None:
+            return parse_xml(self._tmpl % args)
+
+        values = [conv % arg for conv, arg in zip(conversions, args)]
+        elms = [deepcopy(self._prototype)]
+        for parent_idx, child_idx in self._steps:
+            elms.append(elms[parent_idx][child_idx])
+        for elm_idx, attr_name, pattern, arg_idxs in self._slots:
+            value = pattern % tuple(values[i] for i in arg_idxs)
+            if attr_name is None:
+                elms[elm_idx].text = value
+            else:
+                elms[elm_idx].set(attr_name, value)
+        return elms[0]
+
+    def _locate_slots(self, prototype):
+        """
+        Return a `(steps, slots)` pair locating the placeholder values in
+        *prototype*. *steps* is a sequence of `(parent_idx, child_idx)` pairs
+        that, applied in order, reach each element having a placeholder from
+        the root, itself at index 0. Each slot is an `(elm_idx, attr_name,
+        pattern, arg_idxs)` tuple where *attr_name* is |None| for element
+        text. *slots* is |None| when a placeholder appears anywhere else,
+        like in a tail, in which case elements are parsed for each use.
+        """
+        marker_re = self._marker_re
+        steps, slots, elm_idxs = [], [], {(): 0}
+        placeholder_count = 0
+
+        def elm_idx_for(path):
+            if path not in elm_idxs:
+                parent_idx = elm_idx_for(path[:-1])
+                steps.append((parent_idx, path[-1]))
+                elm_idxs[path] = len(steps)
+            return elm_idxs[path]
+
+        def add_slot(path, attr_name, value):
+            arg_idxs = [int(i) for i in marker_re.findall(value)]
+            pattern = marker_re.sub('%s', value.replace('%', '%%'))
+            slots.append((elm_idx_for(path), attr_name, pattern, arg_idxs))
+            return len(arg_idxs)
+
+        def visit(elm, path):
+            count = 0
+            for attr_name, value in elm.attrib.items():
+                if marker_re.search(value):
+                    count += add_slot(path, attr_name, value)
+            if elm.text and marker_re.search(elm.text):
+                count += add_slot(path, None, elm.text)
+            for idx, child in enumerate(elm):
+                count += visit(child, path + (idx,))
+            return count
+
+        placeholder_count = visit(prototype, ())
+        if placeholder_count != len(self._conversions):
+            return None, None
+        return steps, slots
+
+
+_xml_templates = {}
+
+
+def _current_parser():
+    """
+    Return the oxml parser to use on the current thread, `oxml_parser` for
+    the thread that loaded this module and a per-thread parser configured
+    the same way for any other, such as a worker parsing parts in parallel.
+    """
+    if threading.current_thread() is _oxml_parser_thread:
+        return oxml_parser
+    parser = getattr(_thread_parsers, 'parser', None)
+    if parser is None:
+        parser = _thread_parsers.parser = _new_oxml_parser()
+    return parser
+
+
 def register_element_cls(nsptagname, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
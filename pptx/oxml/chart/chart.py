@@ -6,7 +6,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml_template
 from pptx.oxml.chart.shared import CT_Title
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.simpletypes import ST_Style, XsdString
@@ -64,9 +64,7 @@ class CT_Chart(BaseOxmlElement):
         """
         Return a new ``<c:chart>`` element
         """
-        xml = CT_Chart._chart_tmpl % (rId)
-        chart = parse_xml(xml)
-        return chart
+        return parse_xml_template(CT_Chart._chart_tmpl, rId)
 
     def _new_title(self):
         return CT_Title.new_title()
@@ -6,7 +6,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml_template
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
     ST_LayoutMode, XsdBoolean, XsdDouble, XsdString, XsdUnsignedInt
@@ -169,7 +169,7 @@ class CT_Title(BaseOxmlElement):
     @staticmethod
     def new_title():
         """Return "loose" `c:title` element containing default children."""
-        return parse_xml(
+        return parse_xml_template(
             '<c:title %s>'
             '  <c:layout/>'
             '  <c:overlay val="0"/>'
@@ -186,7 +186,7 @@ class CT_Tx(BaseOxmlElement):
     rich = ZeroOrOne('c:rich')
 
     def _new_rich(self):
-        return parse_xml(
+        return parse_xml_template(
             '<c:rich %s>'
             '  <a:bodyPr/>'
             '  <a:lstStyle/>'
@@ -7,7 +7,7 @@ lxml custom element classes for DrawingML-related XML elements.
 from __future__ import absolute_import
 
 from pptx.enum.dml import MSO_PATTERN_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml_template
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
     ST_Percentage, ST_PositiveFixedAngle, ST_PositiveFixedPercentage,
@@ -55,7 +55,7 @@ class CT_GradientFillProperties(BaseOxmlElement):
     @classmethod
     def new_gradFill(cls):
         """Return newly-created "loose" default gradient subtree."""
-        return parse_xml(
+        return parse_xml_template(
             '<a:gradFill %s rotWithShape="1">\n'
             '  <a:gsLst>\n'
             '    <a:gs pos="0">\n'
@@ -105,7 +105,7 @@ class CT_GradientStopList(BaseOxmlElement):
         An `a:gsLst` element must have at least two `a:gs` children. These
         are the default from the PowerPoint built-in "White" template.
         """
-        return parse_xml(
+        return parse_xml_template(
             '<a:gsLst %s>\n'
             '  <a:gs pos="0">\n'
             '    <a:schemeClr val="accent1">\n'
@@ -149,23 +149,19 @@ class CT_PatternFillProperties(BaseOxmlElement):
 
     def _new_bgClr(self):
         """Override default to add minimum subtree."""
-        xml = (
+        return parse_xml_template(
             '<a:bgClr %s>\n'
             ' <a:srgbClr val="FFFFFF"/>\n'
-            '</a:bgClr>\n'
-        ) % nsdecls('a')
-        bgClr = parse_xml(xml)
-        return bgClr
+            '</a:bgClr>\n' % nsdecls('a')
+        )
 
     def _new_fgClr(self):
         """Override default to add minimum subtree."""
-        xml = (
+        return parse_xml_template(
             '<a:fgClr %s>\n'
             ' <a:srgbClr val="000000"/>\n'
-            '</a:fgClr>\n'
-        ) % nsdecls('a')
-        fgClr = parse_xml(xml)
-        return fgClr
+            '</a:fgClr>\n' % nsdecls('a')
+        )
 
 
 class CT_RelativeRect(BaseOxmlElement):
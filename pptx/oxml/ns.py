@@ -132,5 +132,12 @@ def qn(namespace_prefixed_tag):
     *qualified name*. As an example, ``qn('p:cSld')`` returns
     ``'{http://schemas.../main}cSld'``.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _clark_names[namespace_prefixed_tag]
+    except KeyError:
+        nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
+        clark_name = _clark_names[namespace_prefixed_tag] = nsptag.clark_name
+        return clark_name
+
+
+_clark_names = {}
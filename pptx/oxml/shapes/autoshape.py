@@ -7,7 +7,7 @@ lxml custom element classes for shape-related XML elements.
 from __future__ import absolute_import
 
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml_template
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import (
@@ -224,10 +224,10 @@ class CT_Shape(BaseShapeElement):
         """
         Return a new ``<p:sp>`` element tree configured as a base auto shape.
         """
-        tmpl = CT_Shape._autoshape_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height, prst)
-        sp = parse_xml(xml)
-        return sp
+        return parse_xml_template(
+            CT_Shape._autoshape_sp_tmpl(),
+            id_, name, left, top, width, height, prst
+        )
 
     @staticmethod
     def new_freeform_sp(shape_id, name, x, y, cx, cy):
@@ -236,10 +236,9 @@ class CT_Shape(BaseShapeElement):
         The returned shape has a `a:custGeom` subtree but no paths in its
         path list.
         """
-        tmpl = CT_Shape._freeform_sp_tmpl()
-        xml = tmpl % (shape_id, name, x, y, cx, cy)
-        sp = parse_xml(xml)
-        return sp
+        return parse_xml_template(
+            CT_Shape._freeform_sp_tmpl(), shape_id, name, x, y, cx, cy
+        )
 
     @staticmethod
     def new_placeholder_sp(id_, name, ph_type, orient, sz, idx):
@@ -247,9 +246,7 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a placeholder
         shape.
         """
-        tmpl = CT_Shape._ph_sp_tmpl()
-        xml = tmpl % (id_, name)
-        sp = parse_xml(xml)
+        sp = parse_xml_template(CT_Shape._ph_sp_tmpl(), id_, name)
 
         ph = sp.nvSpPr.nvPr.get_or_add_ph()
         ph.type = ph_type
@@ -274,10 +271,9 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a base textbox
         shape.
         """
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
-        sp = parse_xml(xml)
-        return sp
+        return parse_xml_template(
+            CT_Shape._textbox_sp_tmpl(), id_, name, left, top, width, height
+        )
 
     @property
     def prst(self):
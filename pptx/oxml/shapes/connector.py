@@ -6,7 +6,7 @@ lxml custom element classes for shape-related XML elements.
 
 from __future__ import absolute_import
 
-from .. import parse_xml
+from .. import parse_xml_template
 from ..ns import nsdecls
 from .shared import BaseShapeElement
 from ..simpletypes import ST_DrawingElementId, XsdUnsignedInt
@@ -41,38 +41,31 @@ class CT_Connector(BaseShapeElement):
         Return a new ``<p:cxnSp>`` element tree configured as a base
         connector.
         """
-        tmpl = cls._cxnSp_tmpl()
-        flip = (
-            (' flipH="1"' if flipH else '') + (' flipV="1"' if flipV else '')
+        cxnSp = parse_xml_template(
+            cls._cxnSp_tmpl(), id_, name, x, y, cx, cy, prst
         )
-        xml = tmpl.format(**{
-            'nsdecls': nsdecls('a', 'p'),
-            'id':      id_,
-            'name':    name,
-            'x':       x,
-            'y':       y,
-            'cx':      cx,
-            'cy':      cy,
-            'prst':    prst,
-            'flip':    flip,
-        })
-        return parse_xml(xml)
+        xfrm = cxnSp.spPr.xfrm
+        if flipH:
+            xfrm.set('flipH', '1')
+        if flipV:
+            xfrm.set('flipV', '1')
+        return cxnSp
 
     @staticmethod
     def _cxnSp_tmpl():
         return (
-            '<p:cxnSp {nsdecls}>\n'
+            '<p:cxnSp %s>\n'
             '  <p:nvCxnSpPr>\n'
-            '    <p:cNvPr id="{id}" name="{name}"/>\n'
+            '    <p:cNvPr id="%%d" name="%%s"/>\n'
             '    <p:cNvCxnSpPr/>\n'
             '    <p:nvPr/>\n'
             '  </p:nvCxnSpPr>\n'
             '  <p:spPr>\n'
-            '    <a:xfrm{flip}>\n'
-            '      <a:off x="{x}" y="{y}"/>\n'
-            '      <a:ext cx="{cx}" cy="{cy}"/>\n'
+            '    <a:xfrm>\n'
+            '      <a:off x="%%d" y="%%d"/>\n'
+            '      <a:ext cx="%%d" cy="%%d"/>\n'
             '    </a:xfrm>\n'
-            '    <a:prstGeom prst="{prst}">\n'
+            '    <a:prstGeom prst="%%s">\n'
             '      <a:avLst/>\n'
             '    </a:prstGeom>\n'
             '  </p:spPr>\n'
@@ -90,7 +83,7 @@ class CT_Connector(BaseShapeElement):
             '      <a:schemeClr val="tx1"/>\n'
             '    </a:fontRef>\n'
             '  </p:style>\n'
-            '</p:cxnSp>'
+            '</p:cxnSp>' % nsdecls('a', 'p')
         )
 
 
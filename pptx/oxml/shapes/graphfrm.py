@@ -6,7 +6,7 @@ lxml custom element class for CT_GraphicalObjectFrame XML element.
 
 from __future__ import absolute_import
 
-from .. import parse_xml
+from .. import parse_xml_template
 from ..chart.chart import CT_Chart
 from ..ns import nsdecls
 from .shared import BaseShapeElement
@@ -112,20 +112,21 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         containing a table or chart. Note that a graphicFrame element is not
         a valid shape until it contains a graphical object such as a table.
         """
-        xml = cls._graphicFrame_tmpl() % (id_, name, x, y, cx, cy)
-        graphicFrame = parse_xml(xml)
-        return graphicFrame
+        return parse_xml_template(
+            cls._graphicFrame_tmpl(), id_, name, x, y, cx, cy
+        )
 
     @classmethod
-    def new_table_graphicFrame(cls, id_, name, rows, cols, x, y, cx, cy):
+    def new_table_graphicFrame(cls, id_, name, rows, cols, x, y, cx, cy,
+                               texts=None):
         """
         Return a ``<p:graphicFrame>`` element tree populated with a table
-        element.
+        element. The table cells contain *texts* when it is not |None|.
         """
         graphicFrame = cls.new_graphicFrame(id_, name, x, y, cx, cy)
         graphicFrame.graphic.graphicData.uri = GRAPHIC_DATA_URI_TABLE
         graphicFrame.graphic.graphicData.append(
-            CT_Table.new_tbl(rows, cols, cx, cy)
+            CT_Table.new_tbl(rows, cols, cx, cy, texts=texts)
         )
         return graphicFrame
 
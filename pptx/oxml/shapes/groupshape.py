@@ -7,13 +7,14 @@ from __future__ import (
 )
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml, parse_xml_template
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement
+from pptx.oxml.text import CT_TextParagraph
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
 from pptx.util import Emu
 
@@ -31,6 +32,9 @@ class CT_GroupShape(BaseShapeElement):
         qn('p:pic'), qn('p:contentPart')
     )
 
+    #: incremented by :meth:`shapes_changed`
+    generation = 0
+
     def add_autoshape(self, id_, name, prst, x, y, cx, cy):
         """
         Append a new ``<p:sp>`` shape to the group/shapetree having the
@@ -40,6 +44,48 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
+    def add_autoshapes(self, sp_specs):
+        """
+        Append a new ``<p:sp>`` shape for each of *sp_specs* and return the
+        new elements in a list. Each spec is an ``(id_, name, prst, x, y,
+        cx, cy, text, rgb)`` tuple. A *prst* of |None| produces a textbox.
+        When not |None|, *text* becomes the text of the single paragraph of
+        the shape, each line feed becoming a line break, and *rgb* is the
+        hex string of a solid fill color. The new elements are parsed
+        together from a single XML string.
+        """
+        autoshape_tmpl = CT_Shape._autoshape_sp_tmpl()
+        textbox_tmpl = CT_Shape._textbox_sp_tmpl()
+        sp_xmls = []
+        for id_, name, prst, x, y, cx, cy, text, rgb in sp_specs:
+            if prst is None:
+                sp_xml = textbox_tmpl % (id_, name, x, y, cx, cy)
+                fill_old, fill_new = '<a:noFill/>', '%s'
+                p_old, p_new = '<a:p/>', '<a:p>%s</a:p>'
+            else:
+                sp_xml = autoshape_tmpl % (id_, name, x, y, cx, cy, prst)
+                fill_old, fill_new = '</a:prstGeom>', '</a:prstGeom>%s'
+                p_old, p_new = '</a:p>', '%s</a:p>'
+            if rgb is not None:
+                sp_xml = sp_xml.replace(fill_old, fill_new % (
+                    '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % rgb
+                ))
+            if text:
+                runs_xml = CT_TextParagraph.runs_xml(text)
+                sp_xml = sp_xml.replace(p_old, p_new % runs_xml)
+            sp_xmls.append(sp_xml)
+        container = parse_xml(
+            '<p:grpSp %s>%s</p:grpSp>' % (nsdecls('p'), ''.join(sp_xmls))
+        )
+        sps = list(container)
+        extLst = self.find(qn('p:extLst'))
+        for sp in sps:
+            if extLst is None:
+                self.append(sp)
+            else:
+                extLst.addprevious(sp)
+        return sps
+
     def add_cxnSp(self, id_, name, type_member, x, y, cx, cy, flipH, flipV):
         """
         Append a new ``<p:cxnSp>`` shape to the group/shapetree having the
@@ -52,23 +98,19 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(cxnSp, 'p:extLst')
         return cxnSp
 
-    def add_freeform_sp(self, x, y, cx, cy):
+    def add_freeform_sp(self, id_, name, x, y, cx, cy):
         """Append a new freeform `p:sp` with specified position and size."""
-        shape_id = self._next_shape_id
-        name = 'Freeform %d' % (shape_id-1,)
-        sp = CT_Shape.new_freeform_sp(shape_id, name, x, y, cx, cy)
+        sp = CT_Shape.new_freeform_sp(id_, name, x, y, cx, cy)
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
-    def add_grpSp(self):
+    def add_grpSp(self, id_, name):
         """Return `p:grpSp` element newly appended to this shape tree.
 
-        The element contains no sub-shapes, is positioned at (0, 0), and has
-        width and height of zero.
+        The element has *id_* and *name*, contains no sub-shapes, is
+        positioned at (0, 0), and has width and height of zero.
         """
-        shape_id = self._next_shape_id
-        name = 'Group %d' % (shape_id-1,)
-        grpSp = CT_GroupShape.new_grpSp(shape_id, name)
+        grpSp = CT_GroupShape.new_grpSp(id_, name)
         self.insert_element_before(grpSp, 'p:extLst')
         return grpSp
 
@@ -92,13 +134,13 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
-    def add_table(self, id_, name, rows, cols, x, y, cx, cy):
+    def add_table(self, id_, name, rows, cols, x, y, cx, cy, texts=None):
         """
         Append a ``<p:graphicFrame>`` shape containing a table as specified
         in call.
         """
         graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(
-            id_, name, rows, cols, x, y, cx, cy
+            id_, name, rows, cols, x, y, cx, cy, texts
         )
         self.insert_element_before(graphicFrame, 'p:extLst')
         return graphicFrame
@@ -137,34 +179,44 @@ class CT_GroupShape(BaseShapeElement):
             if e.has_ph_elm:
                 yield e
 
-    def iter_shape_elms(self):
+    def iter_shape_elms(self, reverse=False):
         """
         Generate each child of this ``<p:spTree>`` element that corresponds
-        to a shape, in the sequence they appear in the XML.
+        to a shape, in the sequence they appear in the XML, or in reverse
+        order when *reverse* is True.
         """
-        for elm in self.iterchildren():
+        for elm in self.iterchildren(reversed=reverse):
             if elm.tag in self._shape_tags:
                 yield elm
 
-    @property
-    def max_shape_id(self):
-        """Maximum int value assigned as @id in this slide.
+    @staticmethod
+    def shapes_changed():
+        """
+        Note that shapes have been added to, removed from or moved within
+        a shape tree, so a cached sequence of its shapes may be out of date.
+        """
+        CT_GroupShape.generation += 1
 
-        This is generally a shape-id, but ids can be assigned to other
-        objects so we just check all @id values anywhere in the document
-        (XML id-values have document scope).
+    @property
+    def last_child(self):
+        """
+        The last child element of this ``<p:spTree>`` element, or |None| if
+        it has none, found without visiting the other children.
+        """
+        return next(self.iterchildren(reversed=True), None)
 
-        In practice, its minimum value is 1 because the spTree element itself
-        is always assigned id="1".
+    @property
+    def last_shape_elm(self):
+        """
+        The last child of this ``<p:spTree>`` element that corresponds to
+        a shape, or |None| if it contains no shapes.
         """
-        id_str_lst = self.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        return max(used_ids) if used_ids else 0
+        return next(self.iter_shape_elms(reverse=True), None)
 
     @classmethod
     def new_grpSp(cls, id_, name):
         """Return new "loose" `p:grpSp` element having *id_* and *name*."""
-        xml = (
+        return parse_xml_template(
             '<p:grpSp %s>\n'
             '  <p:nvGrpSpPr>\n'
             '    <p:cNvPr id="%%d" name="%%s"/>\n'
@@ -179,10 +231,8 @@ class CT_GroupShape(BaseShapeElement):
             '      <a:chExt cx="0" cy="0"/>\n'
             '    </a:xfrm>\n'
             '  </p:grpSpPr>\n'
-            '</p:grpSp>' % nsdecls('a', 'p', 'r')
-        ) % (id_, name)
-        grpSp = parse_xml(xml)
-        return grpSp
+            '</p:grpSp>' % nsdecls('a', 'p', 'r'), id_, name
+        )
 
     def recalculate_extents(self):
         """Adjust x, y, cx, and cy to incorporate all contained shapes.
@@ -234,21 +284,6 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
-    @property
-    def _next_shape_id(self):
-        """Return unique shape id suitable for use with a new shape element.
-
-        The returned id is the next available positive integer drawing object
-        id in shape tree, starting from 1 and making use of any gaps in
-        numbering. In practice, the minimum id is 2 because the spTree
-        element itself is always assigned id="1".
-        """
-        id_str_lst = self.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
-
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
     """
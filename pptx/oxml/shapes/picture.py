@@ -6,7 +6,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from .. import parse_xml
+from .. import parse_xml_template
 from ..ns import nsdecls
 from .shared import BaseShapeElement
 from ..xmlchemy import BaseOxmlElement, OneAndOnlyOne
@@ -59,8 +59,8 @@ class CT_Picture(BaseShapeElement):
         Return a new `p:pic` placeholder element populated with the supplied
         parameters.
         """
-        return parse_xml(
-            cls._pic_ph_tmpl() % (id_, name, desc, rId)
+        return parse_xml_template(
+            cls._pic_ph_tmpl(), id_, name, desc, rId
         )
 
     @classmethod
@@ -69,21 +69,17 @@ class CT_Picture(BaseShapeElement):
         Return a new ``<p:pic>`` element tree configured with the supplied
         parameters.
         """
-        xml = cls._pic_tmpl() % (
-            id_, name, desc, rId, left, top, width, height
+        return parse_xml_template(
+            cls._pic_tmpl(), id_, name, desc, rId, left, top, width, height
         )
-        pic = parse_xml(xml)
-        return pic
 
     @classmethod
     def new_video_pic(cls, shape_id, shape_name, video_rId, media_rId,
                       poster_frame_rId, x, y, cx, cy):
         """Return a new `p:pic` populated with the specified video."""
-        return parse_xml(
-            cls._pic_video_tmpl() % (
-                shape_id, shape_name, video_rId, media_rId, poster_frame_rId,
-                x, y, cx, cy
-            )
+        return parse_xml_template(
+            cls._pic_video_tmpl(), shape_id, shape_name, video_rId,
+            media_rId, poster_frame_rId, x, y, cx, cy
         )
 
     @property
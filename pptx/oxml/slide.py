@@ -6,7 +6,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from pptx.oxml import parse_from_template, parse_xml
+from pptx.oxml import parse_from_template, parse_xml_template
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import XsdString
@@ -42,13 +42,12 @@ class CT_Background(BaseOxmlElement):
 
     def add_noFill_bgPr(self):
         """Return a new `p:bgPr` element with noFill properties."""
-        xml = (
+        bgPr = parse_xml_template(
             '<p:bgPr %s>\n'
             '  <a:noFill/>\n'
             '  <a:effectLst/>\n'
             '</p:bgPr>' % nsdecls('a', 'p')
         )
-        bgPr = parse_xml(xml)
         self._insert_bgPr(bgPr)
         return bgPr
 
@@ -156,7 +155,7 @@ class CT_Slide(_BaseSlideElement):
     @classmethod
     def new(cls):
         """Return new `p:sld` element configured as base slide shape."""
-        return parse_xml(cls._sld_xml())
+        return parse_xml_template(cls._sld_xml())
 
     @property
     def bg(self):
@@ -188,7 +187,7 @@ class CT_Slide(_BaseSlideElement):
         replaced.
         """
         self.remove(self.get_or_add_timing())
-        timing = parse_xml(self._childTnLst_timing_xml())
+        timing = parse_xml_template(self._childTnLst_timing_xml())
         self._insert_timing(timing)
         return timing.xpath('./p:tnLst/p:par/p:cTn/p:childTnLst')[0]
 
@@ -295,21 +294,20 @@ class CT_TimeNodeList(BaseOxmlElement):
 
     def add_video(self, shape_id):
         """Add a new `p:video` child element for movie having *shape_id*."""
-        video_xml = (
+        video = parse_xml_template(
             '<p:video %s>\n'
             '  <p:cMediaNode vol="80000">\n'
-            '    <p:cTn id="%d" fill="hold" display="0">\n'
+            '    <p:cTn id="%%d" fill="hold" display="0">\n'
             '      <p:stCondLst>\n'
             '        <p:cond delay="indefinite"/>\n'
             '      </p:stCondLst>\n'
             '    </p:cTn>\n'
             '    <p:tgtEl>\n'
-            '      <p:spTgt spid="%d"/>\n'
+            '      <p:spTgt spid="%%d"/>\n'
             '    </p:tgtEl>\n'
             '  </p:cMediaNode>\n'
-            '</p:video>\n' % (nsdecls('p'), self._next_cTn_id, shape_id)
+            '</p:video>\n' % nsdecls('p'), self._next_cTn_id, shape_id
         )
-        video = parse_xml(video_xml)
         self.append(video)
 
     @property
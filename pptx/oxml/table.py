@@ -6,14 +6,16 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from xml.sax.saxutils import escape
+
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml, parse_xml_template
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
     ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
 )
-from pptx.oxml.text import CT_TextBody
+from pptx.oxml.text import CT_TextBody, CT_TextParagraph
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OptionalAttribute,
     RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
@@ -35,6 +37,7 @@ class CT_Table(BaseOxmlElement):
         Return a reference to a newly created <a:tr> child element having its
         ``h`` attribute set to *height*.
         """
+        TcGrid.structure_changed()
         return self._add_tr(h=height)
 
     @property
@@ -93,34 +96,51 @@ class CT_Table(BaseOxmlElement):
         self._set_boolean_property('lastRow', value)
 
     @classmethod
-    def new_tbl(cls, rows, cols, width, height, tableStyleId=None):
-        """Return a new ``<p:tbl>`` element tree."""
+    def new_tbl(cls, rows, cols, width, height, tableStyleId=None,
+                texts=None):
+        """Return a new ``<p:tbl>`` element tree.
+
+        When *texts* is not |None|, it is a sequence of *rows* rows, each
+        a sequence of *cols* str values or |None|, and each cell is
+        populated with its text, as assigning to `_Cell.text` would. The
+        whole tree is produced by a single XML parse.
+        """
         # working hypothesis is this is the default table style GUID
         if tableStyleId is None:
             tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
-
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
-
-        # add specified number of rows and columns
-        rowheight = height//rows
-        colwidth = width//cols
-
-        for col in range(cols):
-            # adjust width of last col to absorb any div error
-            if col == cols-1:
-                colwidth = width - ((cols-1) * colwidth)
-            tbl.tblGrid.add_gridCol(width=colwidth)
-
-        for row in range(rows):
-            # adjust height of last row to absorb any div error
-            if row == rows-1:
-                rowheight = height - ((rows-1) * rowheight)
-            tr = tbl.add_tr(height=rowheight)
-            for col in range(cols):
-                tr.add_tc()
-
-        return tbl
+        if texts is None:
+            texts = [[None] * cols] * rows
+
+        # width and height are evenly distributed among the columns and
+        # rows, the last column and row absorbing any division error
+        colwidth, rowheight = width//cols, height//rows
+        gridCol_xmls = ['<a:gridCol w="%d"/>' % colwidth] * (cols-1) + [
+            '<a:gridCol w="%d"/>' % (width - ((cols-1) * colwidth))
+        ]
+        row_heights = [rowheight] * (rows-1) + [
+            height - ((rows-1) * rowheight)
+        ]
+        empty_tc_xml = cls._tc_xml('')
+        tr_xmls = [
+            '<a:tr h="%d">%s</a:tr>' % (h, ''.join(
+                empty_tc_xml if not text else cls._tc_xml(text)
+                for text in row_texts
+            ))
+            for h, row_texts in zip(row_heights, texts)
+        ]
+
+        return parse_xml(
+            '<a:tbl %s>'
+            '<a:tblPr firstRow="1" bandRow="1">'
+            '<a:tableStyleId>%s</a:tableStyleId>'
+            '</a:tblPr>'
+            '<a:tblGrid>%s</a:tblGrid>'
+            '%s'
+            '</a:tbl>' % (
+                nsdecls('a'), escape(tableStyleId), ''.join(gridCol_xmls),
+                ''.join(tr_xmls)
+            )
+        )
 
     def tc(self, row_idx, col_idx):
         """Return `a:tc` element at *row_idx*, *col_idx*."""
@@ -159,15 +179,17 @@ class CT_Table(BaseOxmlElement):
         tblPr = self.get_or_add_tblPr()
         setattr(tblPr, propname, value)
 
-    @classmethod
-    def _tbl_tmpl(cls):
+    @staticmethod
+    def _tc_xml(text):
+        """
+        Return the XML of an `a:tc` element, without namespace declarations,
+        containing a single paragraph having *text*.
+        """
         return (
-            '<a:tbl %s>\n'
-            '  <a:tblPr firstRow="1" bandRow="1">\n'
-            '    <a:tableStyleId>%s</a:tableStyleId>\n'
-            '  </a:tblPr>\n'
-            '  <a:tblGrid/>\n'
-            '</a:tbl>' % (nsdecls('a'), '%s')
+            '<a:tc>'
+            '<a:txBody><a:bodyPr/><a:lstStyle/><a:p>%s</a:p></a:txBody>'
+            '<a:tcPr/>'
+            '</a:tc>' % CT_TextParagraph.runs_xml(text)
         )
 
 
@@ -303,9 +325,7 @@ class CT_TableCell(BaseOxmlElement):
     @classmethod
     def new(cls):
         """Return a new `a:tc` element subtree."""
-        xml = cls._tc_tmpl()
-        tc = parse_xml(xml)
-        return tc
+        return parse_xml_template(cls._tc_tmpl())
 
     @property
     def row_idx(self):
@@ -315,7 +335,8 @@ class CT_TableCell(BaseOxmlElement):
     @property
     def tbl(self):
         """Table element this cell belongs to."""
-        return self.xpath('ancestor::a:tbl')[0]
+        # ---a:tc is always a child of a:tr, itself a child of a:tbl---
+        return self.getparent().getparent()
 
     @property
     def text(self):
@@ -425,6 +446,7 @@ class CT_TableRow(BaseOxmlElement):
         Return a reference to a newly added minimal valid ``<a:tc>`` child
         element.
         """
+        TcGrid.structure_changed()
         return self._add_tc()
 
     @property
@@ -436,6 +458,63 @@ class CT_TableRow(BaseOxmlElement):
         return CT_TableCell.new()
 
 
+class TcGrid(object):
+    """Index of the `a:tc` elements of a table by their grid position.
+
+    The index is built in a single pass over the table and thereafter
+    provides the `a:tc` element at a grid position, and the grid position of
+    an `a:tc` element, in constant time.
+
+    Like |TcRange|, this object assumes the structure of the table does not
+    change during its lifetime. A client keeping an instance across
+    operations is expected to replace it when :attr:`generation` changes,
+    which it does each time |pp| adds a row or cell to any table.
+    """
+
+    #: incremented by :meth:`structure_changed`
+    generation = 0
+
+    def __init__(self, tbl):
+        self._tbl = tbl
+        self._rows = rows = [tr.tc_lst for tr in tbl.tr_lst]
+        self._positions = dict(
+            (tc, (row_idx, col_idx))
+            for row_idx, tcs in enumerate(rows)
+            for col_idx, tc in enumerate(tcs)
+        )
+
+    def __contains__(self, tc):
+        """True if *tc* is a cell of the indexed table."""
+        return tc in self._positions
+
+    @classmethod
+    def structure_changed(cls):
+        """Note that rows or cells have been added to a table."""
+        cls.generation += 1
+
+    def iter_tcs(self):
+        """Generate each `a:tc` element, left-to-right, top-to-bottom."""
+        return (tc for tcs in self._rows for tc in tcs)
+
+    def position(self, tc):
+        """Return (row_idx, col_idx) pair locating *tc* in the grid."""
+        return self._positions[tc]
+
+    @property
+    def rows(self):
+        """Sequence of the rows of the grid, each a list of `a:tc`."""
+        return self._rows
+
+    @property
+    def tbl(self):
+        """The `a:tbl` element this grid indexes."""
+        return self._tbl
+
+    def tc(self, row_idx, col_idx):
+        """Return `a:tc` element at *row_idx*, *col_idx*."""
+        return self._rows[row_idx][col_idx]
+
+
 class TcRange(object):
     """A 2D block of `a:tc` cell elements in a table.
 
@@ -446,20 +525,27 @@ class TcRange(object):
     The client is expected to create, use, and then abandon an instance in
     the context of a single user operation that is known to have no
     structural side-effects of this type.
+
+    Cell positions are looked up in *tc_grid*, the |TcGrid| of the table,
+    when one is provided. Otherwise one is built on first use.
     """
 
-    def __init__(self, tc, other_tc):
+    def __init__(self, tc, other_tc, tc_grid=None):
         self._tc = tc
         self._other_tc = other_tc
+        self._tc_grid = tc_grid
 
     @classmethod
-    def from_merge_origin(cls, tc):
+    def from_merge_origin(cls, tc, tc_grid=None):
         """Return instance created from merge-origin tc element."""
-        other_tc = tc.tbl.tc(
-            tc.row_idx + tc.rowSpan - 1,  # ---other_row_idx
-            tc.col_idx + tc.gridSpan - 1  # ---other_col_idx
+        if tc_grid is None:
+            tc_grid = TcGrid(tc.tbl)
+        row_idx, col_idx = tc_grid.position(tc)
+        other_tc = tc_grid.tc(
+            row_idx + tc.rowSpan - 1,  # ---other_row_idx
+            col_idx + tc.gridSpan - 1  # ---other_col_idx
         )
-        return cls(tc, other_tc)
+        return cls(tc, other_tc, tc_grid)
 
     @lazyproperty
     def contains_merged_cell(self):
@@ -484,27 +570,27 @@ class TcRange(object):
     @lazyproperty
     def in_same_table(self):
         """True if both cells provided to constructor are in same table."""
-        if self._tc.tbl is self._other_tc.tbl:
+        if self._tc in self._grid and self._other_tc in self._grid:
             return True
         return False
 
     def iter_except_left_col_tcs(self):
         """Generate each `a:tc` element not in leftmost column of range."""
-        for tr in self._tbl.tr_lst[self._top:self._bottom]:
-            for tc in tr.tc_lst[self._left + 1:self._right]:
+        for tcs in self._grid.rows[self._top:self._bottom]:
+            for tc in tcs[self._left + 1:self._right]:
                 yield tc
 
     def iter_except_top_row_tcs(self):
         """Generate each `a:tc` element in non-first rows of range."""
-        for tr in self._tbl.tr_lst[self._top + 1:self._bottom]:
-            for tc in tr.tc_lst[self._left:self._right]:
+        for tcs in self._grid.rows[self._top + 1:self._bottom]:
+            for tc in tcs[self._left:self._right]:
                 yield tc
 
     def iter_left_col_tcs(self):
         """Generate each `a:tc` element in leftmost column of range."""
         col_idx = self._left
-        for tr in self._tbl.tr_lst[self._top:self._bottom]:
-            yield tr.tc_lst[col_idx]
+        for tcs in self._grid.rows[self._top:self._bottom]:
+            yield tcs[col_idx]
 
     def iter_tcs(self):
         """Generate each `a:tc` element in this range.
@@ -513,14 +599,14 @@ class TcRange(object):
         """
         return (
             tc
-            for tr in self._tbl.tr_lst[self._top:self._bottom]
-            for tc in tr.tc_lst[self._left:self._right]
+            for tcs in self._grid.rows[self._top:self._bottom]
+            for tc in tcs[self._left:self._right]
         )
 
     def iter_top_row_tcs(self):
         """Generate each `a:tc` element in topmost row of range."""
-        tr = self._tbl.tr_lst[self._top]
-        for tc in tr.tc_lst[self._left:self._right]:
+        tcs = self._grid.rows[self._top]
+        for tc in tcs[self._left:self._right]:
             yield tc
 
     def move_content_to_origin(self):
@@ -549,13 +635,21 @@ class TcRange(object):
             """Return beginning and length of range based on two indexes."""
             return min(idx, other_idx), abs(idx - other_idx) + 1
 
-        tc, other_tc = self._tc, self._other_tc
+        row_idx, col_idx = self._grid.position(self._tc)
+        other_row_idx, other_col_idx = self._grid.position(self._other_tc)
 
-        left, width = start_and_size(tc.col_idx, other_tc.col_idx)
-        top, height = start_and_size(tc.row_idx, other_tc.row_idx)
+        left, width = start_and_size(col_idx, other_col_idx)
+        top, height = start_and_size(row_idx, other_row_idx)
 
         return left, top, width, height
 
+    @lazyproperty
+    def _grid(self):
+        """|TcGrid| of the table containing this cell range."""
+        if self._tc_grid is not None:
+            return self._tc_grid
+        return TcGrid(self._tc.tbl)
+
     @lazyproperty
     def _left(self):
         """Index of leftmost column in range"""
@@ -568,11 +662,6 @@ class TcRange(object):
         left, _, width, _ = self._extents
         return left + width
 
-    @lazyproperty
-    def _tbl(self):
-        """`a:tbl` element containing this cell range"""
-        return self._tc.tbl
-
     @lazyproperty
     def _top(self):
         """Index of topmost row in range"""
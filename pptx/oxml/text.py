@@ -6,6 +6,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from xml.sax.saxutils import escape
+
 from pptx.compat import to_unicode
 from pptx.enum.lang import MSO_LANGUAGE_ID
 from pptx.enum.text import (
@@ -13,7 +15,7 @@ from pptx.enum.text import (
     PP_PARAGRAPH_ALIGNMENT
 )
 from pptx.exc import InvalidXmlError
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_xml_template
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
@@ -91,9 +93,7 @@ class CT_TextBody(BaseOxmlElement):
         """
         Return a new ``<p:txBody>`` element tree
         """
-        xml = cls._txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return parse_xml_template(cls._txBody_tmpl())
 
     @classmethod
     def new_a_txBody(cls):
@@ -101,9 +101,7 @@ class CT_TextBody(BaseOxmlElement):
         Return a new ``<a:txBody>`` element tree, suitable for use in a table
         cell and possibly other situations.
         """
-        xml = cls._a_txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return parse_xml_template(cls._a_txBody_tmpl())
 
     @classmethod
     def new_p_txBody(cls):
@@ -111,8 +109,7 @@ class CT_TextBody(BaseOxmlElement):
         Return a new ``<p:txBody>`` element tree, suitable for use in an
         ``<p:sp>`` element.
         """
-        xml = cls._p_txBody_tmpl()
-        return parse_xml(xml)
+        return parse_xml_template(cls._p_txBody_tmpl())
 
     @classmethod
     def new_txPr(cls):
@@ -120,7 +117,7 @@ class CT_TextBody(BaseOxmlElement):
         Return a ``<c:txPr>`` element tree suitable for use in a chart object
         like data labels or tick labels.
         """
-        xml = (
+        return parse_xml_template(
             '<c:txPr %s>\n'
             '  <a:bodyPr/>\n'
             '  <a:lstStyle/>\n'
@@ -129,10 +126,8 @@ class CT_TextBody(BaseOxmlElement):
             '      <a:defRPr/>\n'
             '    </a:pPr>\n'
             '  </a:p>\n'
-            '</c:txPr>\n'
-        ) % nsdecls('c', 'a')
-        txPr = parse_xml(xml)
-        return txPr
+            '</c:txPr>\n' % nsdecls('c', 'a')
+        )
 
     def unclear_content(self):
         """Ensure p:txBody has at least one a:p child.
@@ -361,6 +356,17 @@ class CT_TextParagraph(BaseOxmlElement):
         text_types = {CT_RegularTextRun, CT_TextLineBreak, CT_TextField}
         return tuple(elm for elm in self if type(elm) in text_types)
 
+    @staticmethod
+    def runs_xml(text):
+        """
+        Return the XML of the `a:r` and `a:br` elements representing *text*
+        in a paragraph, the same elements `.append_text()` adds.
+        """
+        return '<a:br/>'.join(
+            '<a:r><a:t>%s</a:t></a:r>' % escape(r_str) if r_str else ''
+            for r_str in text.split('\n')
+        )
+
     @property
     def text(self):
         """str text contained in this paragraph."""
@@ -368,8 +374,7 @@ class CT_TextParagraph(BaseOxmlElement):
         return ''.join([child.text for child in self.content_children])
 
     def _new_r(self):
-        r_xml = '<a:r %s><a:t/></a:r>' % nsdecls('a')
-        return parse_xml(r_xml)
+        return parse_xml_template('<a:r %s><a:t/></a:r>' % nsdecls('a'))
 
 
 class CT_TextParagraphProperties(BaseOxmlElement):
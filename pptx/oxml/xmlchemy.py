@@ -147,7 +147,7 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
+    @lazyproperty
     def _clark_name(self):
         if ':' in self._attr_name:
             return qn(self._attr_name)
@@ -183,11 +183,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -222,14 +225,16 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, from_xml = self._clark_name, self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
                     (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -320,8 +325,10 @@ class _BaseChildElement(object):
         Add an ``_insert_x()`` method to the element class for this child
         element.
         """
+        successor_clark_names = self._successor_clark_names
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            obj._insert_before_first_of(child, successor_clark_names)
             return child
 
         _insert_child.__doc__ = (
@@ -343,6 +350,15 @@ class _BaseChildElement(object):
     def _add_method_name(self):
         return '_add_%s' % self._prop_name
 
+    @lazyproperty
+    def _clark_name(self):
+        """
+        Clark-notation name of this child element, like
+        ``'{http://schemas.../main}tbl'``, computed once when the element
+        class is created rather than on each access.
+        """
+        return qn(self._nsptagname)
+
     def _add_to_class(self, name, method):
         """
         Add *method* to the target class as *name*, unless *name* is already
@@ -369,8 +385,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -387,8 +405,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -403,6 +423,15 @@ class _BaseChildElement(object):
     def _new_method_name(self):
         return '_new_%s' % self._prop_name
 
+    @lazyproperty
+    def _successor_clark_names(self):
+        """
+        Tuple of the Clark-notation names of the elements that follow this
+        child element in the sequence, any of which it must be inserted
+        before.
+        """
+        return tuple(qn(tagname) for tagname in self._successors)
+
 
 class Choice(_BaseChildElement):
     """
@@ -495,8 +524,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
@@ -678,8 +709,12 @@ class ZeroOrOneChoice(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        member_clark_names = tuple(
+            qn(tagname) for tagname in self._member_nsptagnames
+        )
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            return next(obj.iterchildren(*member_clark_names), None)
         get_group_member_element.__doc__ = (
             'Return the child element belonging to this element group, or '
             '|None| if no member child is present.'
@@ -729,12 +764,13 @@ class _OxmlElementBase(etree.ElementBase):
         return None
 
     def insert_element_before(self, elm, *tagnames):
-        successor = self.first_child_found_in(*tagnames)
-        if successor is not None:
-            successor.addprevious(elm)
-        else:
-            self.append(elm)
-        return elm
+        """
+        Return *elm* after inserting it as a child before the first child
+        having a tag in *tagnames*, or appending it when there is none.
+        """
+        return self._insert_before_first_of(
+            elm, tuple(qn(tagname) for tagname in tagnames)
+        )
 
     def remove_all(self, tagname):
         """
@@ -762,15 +798,32 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping in centralized location.
+        XML namespace mapping in centralized location. Keyword arguments are
+        passed along as XPath variables, e.g. ``$rId``.
         """
         return super(BaseOxmlElement, self).xpath(
-            xpath_str, namespaces=_nsmap
+            xpath_str, namespaces=_nsmap, **variables
         )
 
+    def _insert_before_first_of(self, elm, clark_names):
+        """
+        Insert *elm* before the first child having a tag in *clark_names*,
+        a sequence of Clark-notation tag names, or append it when there is
+        none. The successor is located in a single pass over the children.
+        """
+        successor = (
+            next(self.iterchildren(*clark_names), None) if clark_names
+            else None
+        )
+        if successor is not None:
+            successor.addprevious(elm)
+        else:
+            self.append(elm)
+        return elm
+
 
 BaseOxmlElement = MetaOxmlElement(
     'BaseOxmlElement', (etree.ElementBase,), dict(_OxmlElementBase.__dict__)
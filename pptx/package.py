@@ -9,6 +9,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from .compat import is_string
 from .opc.constants import RELATIONSHIP_TYPE as RT
 from .opc.package import OpcPackage
 from .opc.packuri import PackURI
@@ -63,19 +64,7 @@ class Package(OpcPackage):
         partname, by sequence number. *ext* is used as the extention on the
         returned partname.
         """
-        def first_available_image_idx():
-            image_idxs = sorted([
-                part.partname.idx for part in self.iter_parts()
-                if part.partname.startswith('/ppt/media/image')
-                and part.partname.idx is not None
-            ])
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs)+1
-
-        idx = first_available_image_idx()
+        idx = self._part_index.next_available_idx('/ppt/media/image')
         return PackURI('/ppt/media/image%d.%s' % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -85,18 +74,7 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-        def first_available_media_idx():
-            media_idxs = sorted([
-                part.partname.idx for part in self.iter_parts()
-                if part.partname.startswith('/ppt/media/media')
-            ])
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs)+1
-
-        idx = first_available_media_idx()
+        idx = self._part_index.next_available_idx('/ppt/media/media')
         return PackURI('/ppt/media/media%d.%s' % (idx, ext))
 
     @property
@@ -130,12 +108,13 @@ class _ImageParts(object):
     def __init__(self, package):
         super(_ImageParts, self).__init__()
         self._package = package
+        self._sha1_index = _Sha1Index(package, self)
 
     def __iter__(self):
         """
         Generate a reference to each |ImagePart| object in the package.
         """
-        image_parts = []
+        image_parts = set()
         for rel in self._package.iter_rels():
             if rel.is_external:
                 continue
@@ -144,21 +123,26 @@ class _ImageParts(object):
             image_part = rel.target_part
             if image_part in image_parts:
                 continue
-            image_parts.append(image_part)
+            image_parts.add(image_part)
             yield image_part
 
     def get_or_add_image_part(self, image_file):
         """
         Return an |ImagePart| object containing the image in *image_file*,
-        which is either a path to an image file or a file-like object
-        containing an image. If an image part containing this same image
-        already exists, that instance is returned, otherwise a new image part
-        is created.
-        """
-        image = Image.from_file(image_file)
+        which is either a path to an image file, a file-like object
+        containing an image or an |Image| object. If an image part containing
+        this same image already exists, that instance is returned, otherwise
+        a new image part is created.
+        """
+        image = (
+            Image.from_file(image_file)
+            if is_string(image_file) or hasattr(image_file, 'read')
+            else image_file
+        )
         image_part = self._find_by_sha1(image.sha1)
         if image_part is None:
             image_part = ImagePart.new(self._package, image)
+            self._sha1_index.add(image.sha1, image_part)
         return image_part
 
     def _find_by_sha1(self, sha1):
@@ -167,13 +151,7 @@ class _ImageParts(object):
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
-        for image_part in self:
-            # ---skip unknown/unsupported image types, like SVG---
-            if not hasattr(image_part, 'sha1'):
-                continue
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        return self._sha1_index.get(sha1)
 
 
 class _MediaParts(object):
@@ -186,13 +164,14 @@ class _MediaParts(object):
     def __init__(self, package):
         super(_MediaParts, self).__init__()
         self._package = package
+        self._sha1_index = _Sha1Index(package, self)
 
     def __iter__(self):
         """Generate a reference to each |MediaPart| object in the package."""
         # A media part can appear in more than one relationship (and commonly
         # does in the case of video). Use media_parts to keep track of those
         # that have been "yielded"; they can be skipped if they occur again.
-        media_parts = []
+        media_parts = set()
         for rel in self._package.iter_rels():
             if rel.is_external:
                 continue
@@ -201,7 +180,7 @@ class _MediaParts(object):
             media_part = rel.target_part
             if media_part in media_parts:
                 continue
-            media_parts.append(media_part)
+            media_parts.add(media_part)
             yield media_part
 
     def get_or_add_media_part(self, media):
@@ -214,6 +193,7 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            self._sha1_index.add(media.sha1, media_part)
         return media_part
 
     def _find_by_sha1(self, sha1):
@@ -223,7 +203,45 @@ class _MediaParts(object):
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
-        for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+        return self._sha1_index.get(sha1)
+
+
+class _Sha1Index(object):
+    """Maps SHA1 hash digest to part for the image or media parts in a package.
+
+    Allows a part containing a duplicate image or media file to be found
+    without hashing the blob of each part on every lookup. The index is
+    built from *parts*, an iterable of image or media parts, on first use and
+    rebuilt when parts may have been removed from *package*. Part hashes are
+    cached on the part, so a rebuild does not hash any blob a second time.
+    """
+
+    def __init__(self, package, parts):
+        super(_Sha1Index, self).__init__()
+        self._package = package
+        self._parts = parts
+        self._parts_by_sha1 = None
+        self._generation = None
+
+    def add(self, sha1, part):
+        """Add *part*, having blob hash *sha1*, to the index."""
+        self._index[sha1] = part
+
+    def get(self, sha1):
+        """Return the part having blob hash *sha1*, or None if not present."""
+        return self._index.get(sha1)
+
+    @property
+    def _index(self):
+        """dict mapping SHA1 hash to part, rebuilt when no longer current."""
+        generation = self._package._part_index.generation
+        if self._parts_by_sha1 is None or generation != self._generation:
+            parts_by_sha1 = {}
+            for part in self._parts:
+                # ---skip unknown/unsupported image types, like SVG---
+                if not hasattr(part, 'sha1'):
+                    continue
+                parts_by_sha1.setdefault(part.sha1, part)
+            self._parts_by_sha1 = parts_by_sha1
+            self._generation = generation
+        return self._parts_by_sha1
@@ -9,15 +9,12 @@ from __future__ import (
 import hashlib
 import os
 
-try:
-    from PIL import Image as PIL_Image
-except ImportError:
-    import Image as PIL_Image
-
 from ..compat import BytesIO, is_string
 from ..opc.package import Part
+from ..opc.phys_pkg import FilePkgMember, PhysPkgMember
 from ..opc.spec import image_content_types
 from ..util import lazyproperty
+from .imageheader import image_header_props
 
 
 class ImagePart(Part):
@@ -43,9 +40,38 @@ class ImagePart(Part):
         """
         partname = package.next_image_partname(image.ext)
         return cls(
-            partname, image.content_type, image.blob, package, image.filename
+            partname, image.content_type, image.blob_source, package,
+            image.filename
         )
 
+    def detach_from_source(self):
+        """
+        Hold the contents of this part in memory where they are still read
+        from the package file it was loaded from, dropping the |Image| object
+        that reads them from there.
+        """
+        super(ImagePart, self).detach_from_source()
+        self.__dict__.pop('__image', None)
+
+    @property
+    def blob(self):
+        """
+        The bytes of the image in this part.
+        """
+        return self._blob
+
+    @blob.setter
+    def blob(self, bytes_):
+        """
+        Replace the image in this part with *bytes_*, discarding its hash and
+        |Image| object so both describe the new image.
+        """
+        self._blob = bytes_
+        self.__dict__.pop('_sha1', None)
+        self.__dict__.pop('__image', None)
+        if self._package is not None:
+            self._package._part_index.blob_changed()
+
     @property
     def desc(self):
         """
@@ -76,60 +102,32 @@ class ImagePart(Part):
 
     def scale(self, scaled_cx, scaled_cy):
         """
-        Return scaled image dimensions in EMU based on the combination of
-        parameters supplied. If *scaled_cx* and *scaled_cy* are both |None|,
-        the native image size is returned. If neither *scaled_cx* nor
-        *scaled_cy* is |None|, their values are returned unchanged. If
-        a value is provided for either *scaled_cx* or *scaled_cy* and the
-        other is |None|, the missing value is calculated such that the
-        image's aspect ratio is preserved.
+        Return scaled image dimensions in EMU for the image in this part, as
+        :meth:`Image.scale` does.
         """
-        image_cx, image_cy = self._native_size
-
-        if scaled_cx is None and scaled_cy is None:
-            scaled_cx = image_cx
-            scaled_cy = image_cy
-        elif scaled_cx is None:
-            scaling_factor = float(scaled_cy) / float(image_cy)
-            scaled_cx = int(round(image_cx * scaling_factor))
-        elif scaled_cy is None:
-            scaling_factor = float(scaled_cx) / float(image_cx)
-            scaled_cy = int(round(image_cy * scaling_factor))
-
-        return scaled_cx, scaled_cy
+        return self._image.scale(scaled_cx, scaled_cy)
 
     @lazyproperty
     def sha1(self):
         """
         The SHA1 hash digest for the image binary of this image part, like:
-        ``'1be010ea47803b00e140b852765cdf84f491da47'``.
+        ``'1be010ea47803b00e140b852765cdf84f491da47'``. The image is hashed
+        in chunks, without being loaded, when this part is backed by a file
+        or package member.
         """
+        member = self.unmodified_member
+        if member is not None:
+            return member.sha1
         return hashlib.sha1(self._blob).hexdigest()
 
-    @property
-    def _dpi(self):
+    @lazyproperty
+    def _image(self):
         """
-        A (horz_dpi, vert_dpi) 2-tuple (ints) representing the dots-per-inch
-        property of this image.
+        |Image| object for the blob of this part, kept so its header is only
+        read once however many times this image is placed and scaled.
         """
-        image = Image.from_blob(self.blob)
-        return image.dpi
-
-    @property
-    def _native_size(self):
-        """
-        A (width, height) 2-tuple representing the native dimensions of the
-        image in EMU, calculated based on the image DPI value, if present,
-        assuming 72 dpi as a default.
-        """
-        EMU_PER_INCH = 914400
-        horz_dpi, vert_dpi = self._dpi
-        width_px, height_px = self._px_size
-
-        width = EMU_PER_INCH * width_px / horz_dpi
-        height = EMU_PER_INCH * height_px / vert_dpi
-
-        return width, height
+        member = self.unmodified_member
+        return Image.from_blob(self.blob if member is None else member)
 
     @property
     def _px_size(self):
@@ -137,13 +135,14 @@ class ImagePart(Part):
         A (width, height) 2-tuple representing the dimensions of this image
         in pixels.
         """
-        image = Image.from_blob(self.blob)
-        return image.size
+        return self._image.size
 
 
 class Image(object):
     """
     Immutable value object representing an image such as a JPEG, PNG, or GIF.
+    *blob* is either the bytes of the image or a |PhysPkgMember| they are read
+    from on demand.
     """
     def __init__(self, blob, filename):
         super(Image, self).__init__()
@@ -158,15 +157,21 @@ class Image(object):
         return cls(blob, filename)
 
     @classmethod
-    def from_file(cls, image_file):
+    def from_file(cls, image_file, lazy=False):
         """
         Return a new |Image| object loaded from *image_file*, which can be
-        either a path (string) or a file-like object.
+        either a path (string) or a file-like object. When *lazy* is |True|,
+        an image file given by path is not read up front; only its header is
+        read until the whole image is needed, so the file must remain
+        available and unchanged until the image is no longer in use.
         """
         if is_string(image_file):
             # treat image_file as a path
-            with open(image_file, 'rb') as f:
-                blob = f.read()
+            if lazy:
+                blob = FilePkgMember(image_file)
+            else:
+                with open(image_file, 'rb') as f:
+                    blob = f.read()
             filename = os.path.basename(image_file)
         else:
             # assume image_file is a file-like object
@@ -183,6 +188,17 @@ class Image(object):
         """
         The binary image bytestream of this image.
         """
+        if isinstance(self._blob, PhysPkgMember):
+            return self._blob.blob
+        return self._blob
+
+    @property
+    def blob_source(self):
+        """
+        The bytes of this image, or the |PhysPkgMember| they are read from
+        when this image was loaded from a file. Used as the blob of a part
+        containing this image, so the file is only read when it is saved.
+        """
         return self._blob
 
     @lazyproperty
@@ -224,7 +240,7 @@ class Image(object):
                 return (int_dpi(pil_dpi[0]), int_dpi(pil_dpi[1]))
             return (72, 72)
 
-        return normalize_pil_dpi(self._pil_props[2])
+        return normalize_pil_dpi(self._props[2])
 
     @lazyproperty
     def ext(self):
@@ -253,11 +269,38 @@ class Image(object):
         """
         return self._filename
 
+    def scale(self, scaled_cx, scaled_cy):
+        """
+        Return scaled image dimensions in EMU based on the combination of
+        parameters supplied. If *scaled_cx* and *scaled_cy* are both |None|,
+        the native image size is returned. If neither *scaled_cx* nor
+        *scaled_cy* is |None|, their values are returned unchanged. If
+        a value is provided for either *scaled_cx* or *scaled_cy* and the
+        other is |None|, the missing value is calculated such that the
+        image's aspect ratio is preserved.
+        """
+        image_cx, image_cy = self._native_size
+
+        if scaled_cx is None and scaled_cy is None:
+            scaled_cx = image_cx
+            scaled_cy = image_cy
+        elif scaled_cx is None:
+            scaling_factor = float(scaled_cy) / float(image_cy)
+            scaled_cx = int(round(image_cx * scaling_factor))
+        elif scaled_cy is None:
+            scaling_factor = float(scaled_cx) / float(image_cx)
+            scaled_cy = int(round(image_cy * scaling_factor))
+
+        return scaled_cx, scaled_cy
+
     @lazyproperty
     def sha1(self):
         """
-        SHA1 hash digest of the image blob
+        SHA1 hash digest of the image blob, computed in chunks when the image
+        is read from a file.
         """
+        if isinstance(self._blob, PhysPkgMember):
+            return self._blob.sha1
         return hashlib.sha1(self._blob).hexdigest()
 
     @lazyproperty
@@ -266,14 +309,30 @@ class Image(object):
         A (width, height) 2-tuple specifying the dimensions of this image in
         pixels.
         """
-        return self._pil_props[1]
+        return self._props[1]
+
+    @property
+    def _native_size(self):
+        """
+        A (width, height) 2-tuple representing the native dimensions of the
+        image in EMU, calculated based on the image DPI value, if present,
+        assuming 72 dpi as a default.
+        """
+        EMU_PER_INCH = 914400
+        horz_dpi, vert_dpi = self.dpi
+        width_px, height_px = self.size
+
+        width = EMU_PER_INCH * width_px / horz_dpi
+        height = EMU_PER_INCH * height_px / vert_dpi
+
+        return width, height
 
     @property
     def _format(self):
         """
         The PIL Image format of this image, e.g. 'PNG'.
         """
-        return self._pil_props[0]
+        return self._props[0]
 
     @lazyproperty
     def _pil_props(self):
@@ -281,10 +340,39 @@ class Image(object):
         A tuple containing useful image properties extracted from this image
         using Pillow (Python Imaging Library, or 'PIL').
         """
-        stream = BytesIO(self._blob)
+        try:
+            from PIL import Image as PIL_Image
+        except ImportError:
+            import Image as PIL_Image
+
+        stream = BytesIO(self.blob)
         pil_image = PIL_Image.open(stream)
         format = pil_image.format
         width_px, height_px = pil_image.size
         dpi = pil_image.info.get('dpi')
         stream.close()
         return (format, (width_px, height_px), dpi)
+
+    @lazyproperty
+    def _props(self):
+        """
+        A `(format, (width_px, height_px), dpi)` tuple of the properties of
+        this image, read from the image header without decoding the image
+        when it is a PNG, JPEG, GIF, BMP or TIFF image. Other images, like
+        WMF, are opened with PIL. Only the leading bytes of an image read
+        from a file are read for its header, unless they are not enough.
+        """
+        if isinstance(self._blob, PhysPkgMember):
+            with self._blob.open() as f:
+                props = image_header_props(f.read(_HEADER_READ_SIZE))
+            if props is not None:
+                return props
+        props = image_header_props(self.blob)
+        if props is None:
+            return self._pil_props
+        return props
+
+
+# ---number of leading bytes of an image file read for its header, enough for
+# all but a JPEG image carrying a very large EXIF segment---
+_HEADER_READ_SIZE = 64 * 1024
@@ -0,0 +1,216 @@
+# encoding: utf-8
+
+"""
+Reading of image format, pixel size and resolution from the header of a PNG,
+JPEG, GIF, BMP or TIFF image, without decoding the image.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from struct import error as StructError, unpack_from
+
+
+def image_header_props(blob):
+    """
+    Return a `(format, (width_px, height_px), dpi)` 3-tuple describing the
+    image in *blob*, read from its header. *format* is the name PIL uses for
+    the format of the image, like `'PNG'`. *dpi* is a (horz_dpi, vert_dpi)
+    2-tuple of numbers, or |None| when the image doesn't specify its
+    resolution. Returns |None| when *blob* is not a PNG, JPEG, GIF, BMP or
+    TIFF image or its header can't be read.
+    """
+    for signature, read_props in _header_readers:
+        if blob[:len(signature)] != signature:
+            continue
+        try:
+            return read_props(blob)
+        except (KeyError, StructError, ValueError, ZeroDivisionError):
+            return None
+    return None
+
+
+def _bmp_props(blob):
+    """
+    Return the `(format, size, dpi)` props of the BMP image in *blob*.
+    """
+    header_size = unpack_from('<I', blob, 14)[0]
+    if header_size == 12:
+        width, height = unpack_from('<HH', blob, 18)
+        return 'BMP', (width, height), None
+    if header_size not in (40, 52, 56, 64, 108, 124):
+        raise ValueError('unsupported BMP header size %d' % header_size)
+    width, height = unpack_from('<ii', blob, 18)
+    horz_ppm, vert_ppm = unpack_from('<ii', blob, 38)
+    dpi = (horz_ppm / 39.3701, vert_ppm / 39.3701)
+    return 'BMP', (width, abs(height)), dpi
+
+
+def _gif_props(blob):
+    """
+    Return the `(format, size, dpi)` props of the GIF image in *blob*.
+    """
+    width, height = unpack_from('<HH', blob, 6)
+    return 'GIF', (width, height), None
+
+
+def _jpeg_props(blob):
+    """
+    Return the `(format, size, dpi)` props of the JPEG image in *blob*. The
+    resolution comes from the JFIF segment when it specifies one and from
+    the EXIF segment otherwise. Segments are skipped over by their length up
+    to the first start-of-frame marker, which holds the pixel size.
+    """
+    dpi, exif_offset = None, None
+    offset = 2
+    while True:
+        fill, marker = unpack_from('BB', blob, offset)
+        if fill != 0xFF:
+            raise ValueError('expected JPEG marker at offset %d' % offset)
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            raise ValueError('no JPEG start-of-frame before image data')
+        segment_len = unpack_from('>H', blob, offset + 2)[0]
+        segment = offset + 4
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = unpack_from('>HH', blob, segment + 1)
+            break
+        if marker == 0xE0 and blob[segment:segment + 5] == b'JFIF\x00':
+            unit, horz, vert = unpack_from('>BHH', blob, segment + 7)
+            if unit == 1:
+                dpi = (horz, vert)
+            elif unit == 2:
+                dpi = (horz * 2.54, vert * 2.54)
+        elif marker == 0xE1 and blob[segment:segment + 6] == b'Exif\x00\x00':
+            if exif_offset is None:
+                exif_offset = segment + 6
+        offset += 2 + segment_len
+
+    if dpi is None and exif_offset is not None:
+        dpi = _exif_dpi(blob, exif_offset)
+    return 'JPEG', (width, height), dpi
+
+
+def _exif_dpi(blob, offset):
+    """
+    Return the (horz_dpi, vert_dpi) resolution recorded in the EXIF TIFF
+    structure at *offset* in *blob*. Like PIL, the horizontal resolution is
+    used for both directions and (72, 72) is returned when the resolution or
+    its unit is missing or invalid.
+    """
+    try:
+        tags = _tiff_tags(blob, offset)
+        dpi = tags[_TIFF_X_RESOLUTION]
+        if tags[_TIFF_RESOLUTION_UNIT] == 3:
+            dpi *= 2.54
+    except (KeyError, StructError, ValueError, ZeroDivisionError):
+        return (72, 72)
+    return (dpi, dpi)
+
+
+def _png_props(blob):
+    """
+    Return the `(format, size, dpi)` props of the PNG image in *blob*. The
+    resolution comes from the `pHYs` chunk, which must precede the image
+    data when present.
+    """
+    if blob[12:16] != b'IHDR':
+        raise ValueError('PNG image has no IHDR chunk')
+    width, height = unpack_from('>II', blob, 16)
+    dpi = None
+    offset = 8
+    while True:
+        chunk_len, chunk_type = unpack_from('>I4s', blob, offset)
+        if chunk_type == b'pHYs':
+            horz_ppu, vert_ppu, unit = unpack_from('>IIB', blob, offset + 8)
+            if unit == 1:  # ---pixels per meter---
+                dpi = (horz_ppu * 0.0254, vert_ppu * 0.0254)
+            break
+        if chunk_type in (b'IDAT', b'IEND'):
+            break
+        offset += chunk_len + 12
+    return 'PNG', (width, height), dpi
+
+
+def _tiff_props(blob):
+    """
+    Return the `(format, size, dpi)` props of the TIFF image in *blob*, read
+    from its first image file directory (IFD).
+    """
+    tags = _tiff_tags(blob, 0)
+    size = (tags[_TIFF_IMAGE_WIDTH], tags[_TIFF_IMAGE_LENGTH])
+    horz = tags.get(_TIFF_X_RESOLUTION)
+    vert = tags.get(_TIFF_Y_RESOLUTION)
+    unit = tags.get(_TIFF_RESOLUTION_UNIT, 2)
+    if not (horz and vert) or unit not in (2, 3):
+        return 'TIFF', size, None
+    if unit == 3:  # ---dots per centimeter---
+        return 'TIFF', size, (horz * 2.54, vert * 2.54)
+    return 'TIFF', size, (horz, vert)
+
+
+def _tiff_tags(blob, offset):
+    """
+    Return a dict mapping the tag of each SHORT, LONG and RATIONAL field in
+    the first IFD of the TIFF structure at *offset* in *blob* to its value,
+    the first one when the field has more than one. Offsets in a TIFF
+    structure are relative to its start, which is not the start of *blob*
+    for the EXIF segment of a JPEG image.
+    """
+    byte_order = blob[offset:offset + 2]
+    if byte_order == b'II':
+        endian = '<'
+    elif byte_order == b'MM':
+        endian = '>'
+    else:
+        raise ValueError('invalid TIFF byte order mark')
+
+    ifd_offset = offset + unpack_from(endian + 'I', blob, offset + 4)[0]
+    field_count = unpack_from(endian + 'H', blob, ifd_offset)[0]
+    tags = {}
+    first_field = ifd_offset + 2
+    for field_offset in range(first_field, first_field + 12 * field_count, 12):
+        tag, field_type = unpack_from(endian + 'HH', blob, field_offset)
+        value_offset = field_offset + 8
+        if field_type == 3:
+            tags[tag] = unpack_from(endian + 'H', blob, value_offset)[0]
+        elif field_type == 4:
+            tags[tag] = unpack_from(endian + 'I', blob, value_offset)[0]
+        elif field_type == 5:
+            rational_offset = (
+                offset + unpack_from(endian + 'I', blob, value_offset)[0]
+            )
+            numerator, denominator = unpack_from(
+                endian + 'II', blob, rational_offset
+            )
+            tags[tag] = numerator / denominator
+    return tags
+
+
+_JPEG_SOF_MARKERS = frozenset(
+    marker for marker in range(0xC0, 0xD0)
+    if marker not in (0xC4, 0xC8, 0xCC)
+)
+_JPEG_STANDALONE_MARKERS = frozenset([0x01] + list(range(0xD0, 0xD8)))
+
+_TIFF_IMAGE_WIDTH = 256
+_TIFF_IMAGE_LENGTH = 257
+_TIFF_X_RESOLUTION = 282
+_TIFF_Y_RESOLUTION = 283
+_TIFF_RESOLUTION_UNIT = 296
+
+_header_readers = (
+    (b'\x89PNG\r\n\x1a\n', _png_props),
+    (b'\xff\xd8', _jpeg_props),
+    (b'GIF87a', _gif_props),
+    (b'GIF89a', _gif_props),
+    (b'BM', _bmp_props),
+    (b'II*\x00', _tiff_props),
+    (b'MM\x00*', _tiff_props),
+)
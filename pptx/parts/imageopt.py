@@ -0,0 +1,338 @@
+# encoding: utf-8
+
+"""
+Downsampling and recompression of images to suit the size they are displayed
+at in a presentation.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import math
+
+from collections import Counter, OrderedDict
+from itertools import chain
+from multiprocessing import Pool
+
+from ..compat import BytesIO
+from ..opc.constants import CONTENT_TYPE as CT
+from ..oxml.ns import qn
+from .image import Image, ImagePart
+
+EMU_PER_INCH = 914400
+
+# ---an image is only resampled when that reduces its width and height by
+# more than this factor; a slight reduction isn't worth the quality loss of
+# resampling and recompressing it---
+_MAX_SCALE = 0.9
+
+_OPTIMIZED_CONTENT_TYPES = (CT.JPEG, CT.PNG)
+
+# ---number of most recently used optimized blobs an optimizer keeps, so
+# reusing one doesn't hold every image it ever optimized in memory---
+_CACHED_BLOBS = 32
+
+
+class ImageOptimizer(object):
+    """
+    Determines how JPEG and PNG images are downsampled and recompressed to
+    suit the size they are displayed at. An image having more than *dpi*
+    pixels per inch at the largest size it is displayed at is resampled to
+    *dpi* and saved again in its own format, a JPEG image at
+    *jpeg_quality*, from 1 (smallest) to 95 (best). The result replaces the
+    image only when it is smaller. Images in other formats are left as they
+    are.
+
+    Each image is optimized once for each size it is optimized for, however
+    many pictures display it. The most recently optimized images are kept
+    for as long as the optimizer is in use, so adding the same image at the
+    same size again doesn't optimize it again. Because an optimized image is
+    added to a presentation like any other, pictures that display the same
+    image at the same size share one image part.
+    """
+    def __init__(self, dpi=150, jpeg_quality=85):
+        super(ImageOptimizer, self).__init__()
+        self._dpi = dpi
+        self._jpeg_quality = jpeg_quality
+        self._blobs = OrderedDict()
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Return the |ImageOptimizer| instance specified by *spec*, which is
+        either such an instance or a number of dots per inch to optimize
+        images for. Returns |None| when *spec* is |None|. Raises |ValueError|
+        on any other value.
+        """
+        if spec is None or isinstance(spec, ImageOptimizer):
+            return spec
+        if isinstance(spec, (int, float)) and not isinstance(spec, bool):
+            return cls(dpi=spec)
+        raise ValueError(
+            'expected ImageOptimizer or dpi number, got %r' % (spec,)
+        )
+
+    def optimize_image(self, image, cx, cy):
+        """
+        Return an |Image| object containing *image* optimized to be displayed
+        at *cx* by *cy* EMU, or *image* itself when it needs no optimizing.
+        """
+        if image.content_type not in _OPTIMIZED_CONTENT_TYPES:
+            return image
+        size = self._target_size(image.size, [(cx, cy)])
+        if size is None:
+            return image
+        blob = self._downsample_all([(image, size)])[0]
+        if blob is None:
+            return image
+        return Image.from_blob(blob, image.filename)
+
+    def optimize_package(self, package, workers=None):
+        """
+        Replace each JPEG or PNG image in *package* with a version optimized
+        for the largest size it is displayed at. Only an image displayed
+        exclusively by pictures, each having its size set, is optimized; one
+        used in any other way, like as a background fill, is left as it is.
+        Images are resampled on a pool of *workers* processes when *workers*
+        is greater than 1.
+
+        Return a list of `(source, rId, image_part)` 3-tuples, one for each
+        relationship now referring to an optimized image, that can be passed
+        to :meth:`restore_package` to undo the replacement.
+        """
+        uses_by_part = _picture_uses(package)
+
+        jobs = []
+        for image_part, uses in uses_by_part.items():
+            if uses is None:
+                continue
+            if image_part.content_type not in _OPTIMIZED_CONTENT_TYPES:
+                continue
+            size = self._target_size(
+                image_part._px_size, [extents for _, _, extents in uses]
+            )
+            if size is not None:
+                jobs.append((image_part, size))
+
+        blobs = self._downsample_all(jobs, workers)
+
+        replaced = []
+        for (image_part, _), blob in zip(jobs, blobs):
+            if blob is None:
+                continue
+            optimized_part = package.get_or_add_image_part(
+                Image.from_blob(blob)
+            )
+            for source, rId, _ in uses_by_part[image_part]:
+                source.load_rel(
+                    source.rels[rId].reltype, optimized_part, rId
+                )
+                replaced.append((source, rId, image_part))
+        if replaced:
+            package._part_index.invalidate()
+        return replaced
+
+    @staticmethod
+    def restore_package(package, replaced):
+        """
+        Relate each part in *replaced*, as returned by
+        :meth:`optimize_package`, to its original image again, leaving the
+        optimized image parts unreferenced.
+        """
+        for source, rId, image_part in replaced:
+            source.load_rel(source.rels[rId].reltype, image_part, rId)
+        if replaced:
+            package._part_index.invalidate()
+
+    def _downsample_all(self, jobs, workers=None):
+        """
+        Return a list containing the optimized blob for each
+        `(image, size)` 2-tuple in *jobs*, or |None| where optimizing would
+        not make the image smaller. *image* is an |Image| or |ImagePart|
+        object. Each distinct image and size is resampled once, on a pool of
+        *workers* processes when *workers* is greater than 1, and the most
+        recent results kept for later requests.
+        """
+        results, pending = {}, {}
+        for image, size in jobs:
+            key = (image.sha1, size)
+            if key in results or key in pending:
+                continue
+            if key in self._blobs:
+                results[key] = self._blobs.pop(key)
+                continue
+            pending[key] = (
+                image.blob, size, image.content_type, self._dpi,
+                self._jpeg_quality
+            )
+
+        keys = list(pending)
+        args = [pending[key] for key in keys]
+        if workers is not None and workers > 1 and len(args) > 1:
+            pool = Pool(min(workers, len(args)))
+            try:
+                blobs = pool.map(_downsample_image, args)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            blobs = [_downsample_image(a) for a in args]
+
+        for key, a, blob in zip(keys, args, blobs):
+            results[key] = self._smaller_blob(a[0], blob)
+        self._cache_blobs(results)
+        return [results[(image.sha1, size)] for image, size in jobs]
+
+    def _cache_blobs(self, blobs_by_key):
+        """
+        Keep the optimized blobs in *blobs_by_key* as the most recently
+        used, discarding the least recently used beyond `_CACHED_BLOBS`.
+        """
+        for key, blob in blobs_by_key.items():
+            self._blobs[key] = blob
+        while len(self._blobs) > _CACHED_BLOBS:
+            self._blobs.popitem(last=False)
+
+    @staticmethod
+    def _smaller_blob(original_blob, blob):
+        """
+        Return *blob*, or |None| when it is no smaller than *original_blob*.
+        """
+        if len(blob) < len(original_blob):
+            return blob
+        return None
+
+    def _target_size(self, px_size, extents):
+        """
+        Return the `(width_px, height_px)` size an image of *px_size* pixels
+        is resampled to for display at each `(cx, cy)` size in *extents*, or
+        |None| when it doesn't need resampling. The aspect ratio of the image
+        is preserved.
+        """
+        width_px, height_px = px_size
+        scale = max(
+            max(cx * self._dpi / EMU_PER_INCH / width_px,
+                cy * self._dpi / EMU_PER_INCH / height_px)
+            for cx, cy in extents
+        )
+        if scale > _MAX_SCALE:
+            return None
+        return (
+            max(1, int(math.ceil(width_px * scale))),
+            max(1, int(math.ceil(height_px * scale)))
+        )
+
+
+def downsample_image(blob, size, content_type, dpi, jpeg_quality=85):
+    """
+    Return the bytes of the JPEG or PNG image in *blob*, as specified by
+    *content_type*, resampled to *size* pixels and saved in the same format,
+    recording a resolution of *dpi*.
+    """
+    try:
+        from PIL import Image as PIL_Image
+    except ImportError:
+        import Image as PIL_Image
+
+    pil_image = PIL_Image.open(BytesIO(blob))
+    info = pil_image.info
+    if content_type == CT.JPEG:
+        # ---decode a large JPEG at a fraction of its size, still larger than
+        # *size*, which is much faster than decoding it in full---
+        pil_image.draft(pil_image.mode, size)
+    if pil_image.mode not in ('L', 'RGB', 'RGBA', 'CMYK'):
+        pil_image = pil_image.convert('RGBA')
+    resized = pil_image.resize(size, PIL_Image.LANCZOS)
+
+    kwargs = {'dpi': (dpi, dpi)}
+    if info.get('icc_profile'):
+        kwargs['icc_profile'] = info['icc_profile']
+    stream = BytesIO()
+    if content_type == CT.JPEG:
+        if info.get('exif'):
+            kwargs['exif'] = info['exif']
+        resized.save(
+            stream, 'JPEG', quality=jpeg_quality, optimize=True, **kwargs
+        )
+    else:
+        resized.save(stream, 'PNG', optimize=True, **kwargs)
+    return stream.getvalue()
+
+
+def _downsample_image(args):
+    """
+    Call :func:`downsample_image` with the arguments in *args*, a tuple, so
+    it can be mapped over a process pool.
+    """
+    return downsample_image(*args)
+
+
+def _picture_uses(package):
+    """
+    Return a dict mapping each image part in *package* to a list of
+    `(source, rId, (cx, cy))` 3-tuples, one for each picture displaying it,
+    where *source* is the part relating to the image part as *rId* and
+    *(cx, cy)* is the size in EMU the whole image is displayed at, which is
+    larger than the picture when the picture is cropped or scaled by a group
+    shape. An image part is mapped to |None| when it is used other than by
+    pictures having a size or its relationships are not all from XML parts.
+    """
+    uses_by_part = {}
+    for source in chain((package,), package.iter_parts()):
+        image_rels = [
+            rel for rel in source.rels.values()
+            if not rel.is_external and isinstance(rel.target_part, ImagePart)
+        ]
+        if not image_rels:
+            continue
+        element = getattr(source, '_element', None)
+        if element is None:
+            for rel in image_rels:
+                uses_by_part[rel.target_part] = None
+            continue
+
+        extents_by_rId = {}
+        for pic in element.xpath('//p:pic'):
+            rId = pic.blip_rId
+            if rId is not None:
+                extents_by_rId.setdefault(rId, []).append(_full_extents(pic))
+        ref_counts = Counter(element.xpath('//@r:*'))
+
+        for rel in image_rels:
+            image_part, rId = rel.target_part, rel.rId
+            if uses_by_part.get(image_part, []) is None:
+                continue
+            extents = extents_by_rId.get(rId, [])
+            if (not extents or None in extents or
+                    len(extents) < ref_counts[rId]):
+                uses_by_part[image_part] = None
+                continue
+            uses_by_part.setdefault(image_part, []).extend(
+                (source, rId, e) for e in extents
+            )
+    return uses_by_part
+
+
+def _full_extents(pic):
+    """
+    Return the `(cx, cy)` size in EMU at which the whole image of the
+    `p:pic` element *pic* is displayed, or |None| if the picture has no size
+    of its own, like one inheriting its size from a placeholder.
+    """
+    cx, cy = pic.cx, pic.cy
+    if not cx or not cy:
+        return None
+    visible_width = 1.0 - pic.srcRect_l - pic.srcRect_r
+    visible_height = 1.0 - pic.srcRect_t - pic.srcRect_b
+    if visible_width <= 0.0 or visible_height <= 0.0:
+        return None
+    cx, cy = cx / visible_width, cy / visible_height
+    for grpSp in pic.iterancestors(qn('p:grpSp')):
+        xfrm = grpSp.xfrm
+        if xfrm is None or xfrm.ext is None or xfrm.chExt is None:
+            continue
+        if xfrm.chExt.cx and xfrm.chExt.cy:
+            cx *= xfrm.ext.cx / xfrm.chExt.cx
+            cy *= xfrm.ext.cy / xfrm.chExt.cy
+    return cx, cy
@@ -26,12 +26,30 @@ class MediaPart(Part):
         *media* must be a |Media| object.
         """
         partname = package.next_media_partname(media.ext)
-        return cls(partname, media.content_type, media.blob, package)
+        return cls(partname, media.content_type, media.blob_source, package)
+
+    @property
+    def blob(self):
+        """The bytes of the media in this part."""
+        return self._blob
+
+    @blob.setter
+    def blob(self, bytes_):
+        """Replace the media in this part with *bytes_*, dropping its hash."""
+        self._blob = bytes_
+        self.__dict__.pop('_sha1', None)
+        if self._package is not None:
+            self._package._part_index.blob_changed()
 
     @lazyproperty
     def sha1(self):
         """The SHA1 hash digest for the media binary of this media part.
 
-        Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
+        Example: `'1be010ea47803b00e140b852765cdf84f491da47'`. The media is
+        hashed in chunks, without being loaded, when this part is backed by
+        a file or package member.
         """
+        member = self.unmodified_member
+        if member is not None:
+            return member.sha1
         return hashlib.sha1(self._blob).hexdigest()
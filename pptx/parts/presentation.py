@@ -109,13 +109,14 @@ class PresentationPart(XmlPart):
                 '/ppt/slides/slide%d.xml' % (idx+1)
             )
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, workers=None, compression=None):
         """
         Save this presentation package to *path_or_stream*, which can be
         either a path to a filesystem location (a string) or a file-like
-        object.
+        object. Parts are serialized and compressed on *workers* threads when
+        *workers* is greater than 1, as specified by *compression*.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, workers, compression)
 
     def slide_id(self, slide_part):
         """
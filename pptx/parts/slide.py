@@ -50,6 +50,38 @@ class BaseSlidePart(XmlPart):
         """
         return self._element.cSld.name
 
+    @lazyproperty
+    def shape_names(self):
+        """
+        |_ShapeNames| object holding the shape names used in this slide, so
+        a new name can be checked for uniqueness without scanning the XML.
+        """
+        return _ShapeNames(self)
+
+    def next_shape_id(self):
+        """
+        Return a shape id not yet used in this slide, reserving it for a new
+        shape. Ids are issued by a single allocator kept by this part, so no
+        two new shapes get the same id however many shape collection objects
+        are used to add them.
+        """
+        return self._shape_id_allocator.next_id()
+
+    def next_shape_ids(self, count):
+        """
+        Return a list of *count* consecutive shape ids not yet used in this
+        slide, reserving them all, like *count* calls to
+        :meth:`next_shape_id` but without the cost of the calls.
+        """
+        return self._shape_id_allocator.next_ids(count)
+
+    @lazyproperty
+    def _shape_id_allocator(self):
+        """
+        |_ShapeIdAllocator| object issuing the shape ids of this slide.
+        """
+        return _ShapeIdAllocator(self)
+
 
 class NotesMasterPart(BaseSlidePart):
     """
@@ -290,3 +322,173 @@ class SlideMasterPart(BaseSlidePart):
         The |SlideMaster| object representing this part.
         """
         return SlideMaster(self._element, self)
+
+
+class _ShapeTreeWatcher(object):
+    """
+    Base class for an index of the shapes of a slide-type part that is built
+    by scanning the XML once, then kept up to date without scanning it again.
+    A shape element appended to the shape tree other than through |pp|, like
+    one copied from another slide, is noticed as a new last shape directly
+    following the last one seen and is added to the index. Any other change
+    to the children of the shape tree that alters their number or the last
+    shape, or a change to the root element of the part, causes the index to
+    be rebuilt. Subclasses implement :meth:`_rebuild` and
+    :meth:`_add_shape_elm`.
+    """
+    def __init__(self, part):
+        super(_ShapeTreeWatcher, self).__init__()
+        self._part = part
+        self._element = None
+        self._spTree_len = None
+        self._last_shape_elm = None
+
+    def _add_shape_elm(self, shape_elm):
+        """
+        Add *shape_elm*, just appended to the shape tree, to this index.
+        """
+        raise NotImplementedError('must be implemented by each subclass')
+
+    @property
+    def _is_built(self):
+        """
+        True if this index has been built from the part XML.
+        """
+        return self._spTree_len is not None
+
+    def _is_appended(self, spTree, spTree_len, last_shape_elm):
+        """
+        True if the only change to *spTree* since the last refresh is
+        *last_shape_elm* having been added after the last shape then present.
+        """
+        if spTree_len != self._spTree_len + 1 or last_shape_elm is None:
+            return False
+        previous = last_shape_elm.getprevious()
+        if previous is not None and previous.tag not in spTree._shape_tags:
+            previous = None
+        return previous is self._last_shape_elm
+
+    def _rebuild(self, element):
+        """
+        Build this index from scratch from *element*, the part XML.
+        """
+        raise NotImplementedError('must be implemented by each subclass')
+
+    def _refresh(self):
+        """
+        Bring this index up to date with any change made to the part XML
+        since it was last refreshed.
+        """
+        element = self._part._element
+        spTree = element.cSld.spTree
+        spTree_len = len(spTree)
+        last_shape_elm = spTree.last_shape_elm
+        if element is not self._element or not self._is_built:
+            self._rebuild(element)
+        elif spTree_len == self._spTree_len:
+            if last_shape_elm is not self._last_shape_elm:
+                self._rebuild(element)
+        elif self._is_appended(spTree, spTree_len, last_shape_elm):
+            self._add_shape_elm(last_shape_elm)
+        else:
+            self._rebuild(element)
+        self._element = element
+        self._spTree_len = spTree_len
+        self._last_shape_elm = last_shape_elm
+
+
+class _ShapeIdAllocator(_ShapeTreeWatcher):
+    """
+    Issues the shape ids of a slide-type part, each 1 greater than the
+    largest id yet used in the part XML. Before ids are issued, the part XML
+    is checked for any element already having one of them, as when a shape
+    is copied into a group shape or an id is edited in place, in which case
+    the largest id is found again by scanning the whole part.
+    """
+    def __init__(self, part):
+        super(_ShapeIdAllocator, self).__init__(part)
+        self._max_id = 0
+
+    def next_id(self):
+        """
+        Return the next available shape id, reserving it.
+        """
+        return self.next_ids(1)[0]
+
+    def next_ids(self, count):
+        """
+        Return a list of the next *count* available shape ids, reserving
+        them.
+        """
+        if count < 1:
+            return []
+        self._refresh()
+        first_id, last_id = self._max_id + 1, self._max_id + count
+        if self._is_used(first_id, last_id):
+            self._rebuild(self._part._element)
+            first_id, last_id = self._max_id + 1, self._max_id + count
+        self._max_id = last_id
+        return list(range(first_id, last_id + 1))
+
+    def _add_shape_elm(self, shape_elm):
+        self._max_id = max(self._max_id, _max_id(shape_elm))
+
+    def _is_used(self, first_id, last_id):
+        """
+        True if an element of the part XML has an `id` attribute between
+        *first_id* and *last_id* inclusive.
+        """
+        return bool(self._part._element.xpath(
+            '//@id[number(.) >= %d and number(.) <= %d]' % (first_id, last_id)
+        ))
+
+    def _rebuild(self, element):
+        self._max_id = _max_id(element)
+
+
+class _ShapeNames(_ShapeTreeWatcher):
+    """
+    The shape names used in a slide-type part. Shapes appended to the shape
+    tree of the part are noticed on their own; a shape added anywhere else,
+    like inside a group shape, and a shape renamed in place are reported
+    with :meth:`add_shape` and :meth:`add_name` by the code doing it. A name
+    no longer used remains until the next rebuild, which can only cause
+    a number to be skipped when a unique name is made.
+    """
+    def __init__(self, part):
+        super(_ShapeNames, self).__init__(part)
+        self._names = set()
+
+    def __contains__(self, name):
+        self._refresh()
+        return name in self._names
+
+    def add_name(self, name):
+        """
+        Note that a shape in the part has been given *name*.
+        """
+        if self._is_built:
+            self._names.add(name)
+
+    def add_shape(self, shape_elm):
+        """
+        Note that *shape_elm* has been added to the part XML, adding the
+        names of it and any shapes it contains.
+        """
+        if self._is_built:
+            self._add_shape_elm(shape_elm)
+
+    def _add_shape_elm(self, shape_elm):
+        self._names.update(shape_elm.xpath('.//p:cNvPr/@name'))
+
+    def _rebuild(self, element):
+        self._names = set(element.xpath('//p:cNvPr/@name'))
+
+
+def _max_id(elm):
+    """
+    Return the largest integer value of an `id` attribute of *elm* or any of
+    its descendants, or 0 if there is none.
+    """
+    ids = [int(id_str) for id_str in elm.xpath('.//@id') if id_str.isdigit()]
+    return max(ids) if ids else 0
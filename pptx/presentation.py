@@ -8,6 +8,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from .parts.imageopt import ImageOptimizer
 from .shared import PartElementProxy
 from .slide import SlideMasters, Slides
 from .util import lazyproperty
@@ -21,6 +22,22 @@ class Presentation(PartElementProxy):
 
     __slots__ = ('_slide_masters', '_slides')
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the file this presentation was lazily loaded from, releasing
+        its file handle. A slide, image or other part not yet read from it
+        can no longer be used or saved afterward. Has no effect on
+        a presentation not loaded lazily. A presentation can also be used as
+        a context manager, which closes it on exit.
+        """
+        self.part.package.close()
+
     @property
     def core_properties(self):
         """
@@ -38,12 +55,42 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    def save(self, file, workers=None, compression=None,
+             optimize_images=None):
         """
         Save this presentation to *file*, where *file* can be either a path
-        to a file (a string) or a file-like object.
-        """
-        self.part.save(file)
+        to a file (a string) or a file-like object. A file-like object need
+        not be seekable, so a presentation can be written directly to a pipe,
+        socket or HTTP response as it is serialized. When *workers* is an
+        integer greater than 1, the XML of each part is serialized and
+        compressed on a pool of that many threads, which can make saving
+        a large presentation substantially faster on a multi-core machine.
+
+        *compression* determines how each part is compressed. It can be the
+        name of a profile: `'fast'` stores already-compressed media, such as
+        JPEG and PNG images and MP4 video, without compressing them again and
+        deflates XML at the fastest level, `'small'` deflates XML at the
+        highest level instead, and `'default'` deflates every part at the
+        default level, as is done when *compression* is |None|. It can also
+        be a |CompressionPolicy| object specifying the compression for each
+        content type.
+
+        When *optimize_images* is an |ImageOptimizer| object or a number of
+        dots per inch, each JPEG or PNG image having a higher resolution than
+        that at the largest size a picture displays it is saved as
+        a downsampled and recompressed version. Images are resampled on
+        a pool of *workers* processes. The images of this presentation are
+        left as they are; only the saved file is optimized.
+        """
+        optimizer = ImageOptimizer.from_spec(optimize_images)
+        if optimizer is None:
+            return self.part.save(file, workers, compression)
+        package = self.part.package
+        replaced = optimizer.optimize_package(package, workers)
+        try:
+            self.part.save(file, workers, compression)
+        finally:
+            optimizer.restore_package(package, replaced)
 
     @property
     def slide_height(self):
@@ -133,6 +133,7 @@ class BaseShape(object):
     @name.setter
     def name(self, value):
         self._element._nvXxPr.cNvPr.name = value
+        self.part.shape_names.add_name(value)
 
     @property
     def part(self):
@@ -85,6 +85,7 @@ class FreeformBuilder(Sequence):
         path = self._start_path(sp)
         for drawing_operation in self:
             drawing_operation.apply_operation_to(path)
+        self._shapes._shapes_added(sp)
         return self._shapes._shape_factory(sp)
 
     def move_to(self, x, y):
@@ -135,7 +136,10 @@ class FreeformBuilder(Sequence):
         represent the location of the local coordinates origin on the slide.
         """
         spTree = self._shapes._spTree
+        shape_id = self._shapes._next_shape_id()
         return spTree.add_freeform_sp(
+            shape_id,
+            'Freeform %d' % (shape_id-1),
             origin_x + self._left,
             origin_y + self._top,
             self._width,
@@ -166,7 +166,9 @@ class _BaseSlidePlaceholder(_InheritsDimensions, Shape):
         """
         element._nvXxPr.nvPr._insert_ph(self._element.ph)
         self._element.addprevious(element)
-        self._element.getparent().remove(self._element)
+        spTree = self._element.getparent()
+        spTree.remove(self._element)
+        spTree.shapes_changed()
         self._element = None
 
 
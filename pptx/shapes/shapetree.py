@@ -6,14 +6,17 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from pptx.compat import BytesIO
+from pptx.compat import BytesIO, is_string, to_unicode, Unicode
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.simpletypes import ST_Direction
+from pptx.parts.image import Image
+from pptx.parts.imageopt import ImageOptimizer
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -63,15 +66,20 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree, parent):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._turbo_add_enabled = False
+        self._member_elms_cache = None
+        self._member_elms_key = None
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
         try:
-            shape_elm = shape_elms[idx]
+            shape_elm = self._member_elms[idx]
+            # ---a shape moved out of the tree other than by |pp|---
+            if shape_elm.getparent() is not self._spTree:
+                self._member_elms_cache = None
+                shape_elm = self._member_elms[idx]
         except IndexError:
             raise IndexError('shape index out of range')
         return self._shape_factory(shape_elm)
@@ -89,8 +97,7 @@ class _BaseShapes(ParentedElementProxy):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._member_elms)
 
     def clone_placeholder(self, placeholder):
         """
@@ -100,7 +107,7 @@ class _BaseShapes(ParentedElementProxy):
         ph_type, orient, sz, idx = (
             sp.ph_type, sp.ph_orient, sp.ph_sz, sp.ph_idx
         )
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
@@ -131,34 +138,19 @@ class _BaseShapes(ParentedElementProxy):
 
     @property
     def turbo_add_enabled(self):
-        """True if "turbo-add" mode is enabled. Read/Write.
+        """True if "turbo-add" mode has been enabled. Read/Write.
 
-        EXPERIMENTAL: This feature can radically improve performance when
-        adding large numbers (hundreds of shapes) to a slide. It works by
-        caching the last shape ID used and incrementing that value to assign
-        the next shape id. This avoids repeatedly searching all shape ids in
-        the slide each time a new ID is required.
-
-        Performance is not noticeably improved for a slide with a relatively
-        small number of shapes, but because the search time rises with the
-        square of the shape count, this option can be useful for optimizing
-        generation of a slide composed of many shapes.
-
-        Shape-id collisions can occur (causing a repair error on load) if
-        more than one |Slide| object is used to interact with the same slide
-        in the presentation. Note that the |Slides| collection creates a new
-        |Slide| object each time a slide is accessed
-        (e.g. `slide = prs.slides[0]`, so you must be careful to limit use to
-        a single |Slide| object.
+        DEPRECATED: This setting no longer has any effect. Shape ids are now
+        always assigned by an allocator kept by the slide part, so adding
+        a large number of shapes to a slide is fast without it and shape-id
+        collisions can't occur no matter how many |Slide| objects are used
+        to interact with the same slide.
         """
-        return self._cached_max_shape_id is not None
+        return self._turbo_add_enabled
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value):
-        enable = bool(value)
-        self._cached_max_shape_id = (
-            self._spTree.max_shape_id if enable else None
-        )
+        self._turbo_add_enabled = bool(value)
 
     @staticmethod
     def _is_member_elm(shape_elm):
@@ -168,15 +160,32 @@ class _BaseShapes(ParentedElementProxy):
         """
         return True
 
-    def _iter_member_elms(self):
+    def _iter_member_elms(self, reverse=False):
         """
         Generate each child of the ``<p:spTree>`` element that corresponds to
-        a shape, in the sequence they appear in the XML.
+        a shape, in the sequence they appear in the XML, or in reverse order
+        when *reverse* is True.
         """
-        for shape_elm in self._spTree.iter_shape_elms():
+        for shape_elm in self._spTree.iter_shape_elms(reverse):
             if self._is_member_elm(shape_elm):
                 yield shape_elm
 
+    @property
+    def _member_elms(self):
+        """
+        Sequence of the member shape elements of this collection, cached so
+        indexed access and :func:`len` don't walk the shape tree each time.
+        The sequence is rebuilt when |pp| has changed the shapes of any shape
+        tree since, as noted by :meth:`CT_GroupShape.shapes_changed`, or when
+        the last child of this shape tree is no longer the same, as after
+        a shape is appended or removed directly in the XML.
+        """
+        key = (CT_GroupShape.generation, self._spTree.last_child)
+        if self._member_elms_cache is None or key != self._member_elms_key:
+            self._member_elms_cache = list(self._iter_member_elms())
+            self._member_elms_key = key
+        return self._member_elms_cache
+
     def _next_ph_name(self, ph_type, id, orient):
         """
         Next unique placeholder name for placeholder shape of type *ph_type*,
@@ -195,7 +204,7 @@ class _BaseShapes(ParentedElementProxy):
 
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath('//p:cNvPr/@name')
+        names = self.part.shape_names
         while True:
             name = '%s %d' % (basename, numpart)
             if name not in names:
@@ -204,20 +213,22 @@ class _BaseShapes(ParentedElementProxy):
 
         return name
 
-    @property
     def _next_shape_id(self):
         """Return a unique shape id suitable for use with a new shape.
 
-        The returned id is 1 greater than the maximum shape id used so far.
-        In practice, the minimum id is 2 because the spTree element is always
-        assigned id="1".
+        The returned id is 1 greater than the maximum shape id used so far,
+        and is reserved, so each call produces a different id. In practice,
+        the minimum id is 2 because the spTree element is always assigned
+        id="1".
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
+        return self.part.next_shape_id()
 
-        return self._spTree.max_shape_id + 1
+    def _next_shape_ids(self, count):
+        """Return a list of *count* unique shape ids for new shapes.
+
+        The ids are reserved, like those produced by :meth:`_next_shape_id`.
+        """
+        return self.part.next_shape_ids(count)
 
     def _shape_factory(self, shape_elm):
         """
@@ -249,7 +260,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         rId = self.part.add_chart_part(chart_type, chart_data)
         graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
-        self._recalculate_extents()
+        self._shapes_added(graphicFrame)
         return self._shape_factory(graphicFrame)
 
     def add_connector(self, connector_type, begin_x, begin_y, end_x, end_y):
@@ -263,7 +274,7 @@ class _BaseGroupShapes(_BaseShapes):
         cxnSp = self._add_cxnSp(
             connector_type, begin_x, begin_y, end_x, end_y
         )
-        self._recalculate_extents()
+        self._shapes_added(cxnSp)
         return self._shape_factory(cxnSp)
 
     def add_group_shape(self, shapes=[]):
@@ -275,14 +286,17 @@ class _BaseGroupShapes(_BaseShapes):
         it contains; its position and extents are recalculated each time
         a shape is added to it.
         """
-        grpSp = self._element.add_grpSp()
+        id_ = self._next_shape_id()
+        grpSp = self._element.add_grpSp(id_, 'Group %d' % (id_-1))
         for shape in shapes:
             grpSp.insert_element_before(shape._element, 'p:extLst')
         if shapes:
             grpSp.recalculate_extents()
+        self._shapes_added(grpSp)
         return self._shape_factory(grpSp)
 
-    def add_picture(self, image_file, left, top, width=None, height=None):
+    def add_picture(self, image_file, left, top, width=None, height=None,
+                    optimize=None, lazy=False):
         """Add picture shape displaying image in *image_file*.
 
         *image_file* can be either a path to a file (a string) or a file-like
@@ -292,12 +306,30 @@ class _BaseGroupShapes(_BaseShapes):
         unspecified dimension is calculated to preserve the aspect ratio of
         the image. If both are specified, the picture is stretched to fit,
         without regard to its native aspect ratio.
-        """
+
+        When *lazy* is |True|, an image file given by path is not read into
+        memory; it is read in chunks when the presentation is saved, so it
+        must remain available and unchanged until then. |IOError| is raised
+        on save if its size or modification time has changed.
+
+        When *optimize* is an |ImageOptimizer| object or a number of dots per
+        inch, a JPEG or PNG image having a higher resolution than that at the
+        size of the picture is downsampled and recompressed before it is
+        added. Reusing an |ImageOptimizer| object avoids optimizing the same
+        image for the same size twice.
+        """
+        optimizer = ImageOptimizer.from_spec(optimize)
+        if optimizer is not None:
+            image = Image.from_file(image_file)
+            width, height = image.scale(width, height)
+            image_file = optimizer.optimize_image(image, width, height)
+        elif lazy and is_string(image_file):
+            image_file = Image.from_file(image_file, lazy=True)
         image_part, rId = self.part.get_or_add_image_part(image_file)
         pic = self._add_pic_from_image_part(
             image_part, rId, left, top, width, height
         )
-        self._recalculate_extents()
+        self._shapes_added(pic)
         return self._shape_factory(pic)
 
     def add_shape(self, autoshape_type_id, left, top, width, height):
@@ -309,9 +341,66 @@ class _BaseGroupShapes(_BaseShapes):
         """
         autoshape_type = AutoShapeType(autoshape_type_id)
         sp = self._add_sp(autoshape_type, left, top, width, height)
-        self._recalculate_extents()
+        self._shapes_added(sp)
         return self._shape_factory(sp)
 
+    def add_shapes_bulk(self, specs=None, autoshape_type_id=None, lefts=None,
+                        tops=None, widths=None, heights=None, texts=None,
+                        fills=None):
+        """Return list of new |Shape| objects appended to this shape tree.
+
+        *specs* is an iterable of records, one for each shape to add, in the
+        order they are to appear. Each record is a sequence like
+        ``(autoshape_type_id, left, top, width, height, text, fill)`` in
+        which the last two items are optional. *autoshape_type_id* is
+        a member of :ref:`MsoAutoShapeType` as for :meth:`add_shape`, or
+        |None| to add a text box. *text*, when not |None|, is assigned to
+        the shape's text frame. *fill*, when not |None|, is an |RGBColor|
+        the shape is solid-filled with. Position and size can be any
+        integral number type, so the rows of a NumPy array can be used for
+        them.
+
+        Instead of *specs*, the shapes can be given as columns: *lefts*,
+        *tops*, *widths* and *heights* are sequences of equal length, like
+        NumPy arrays, with one item for each shape, and *texts* and *fills*
+        are optional sequences of the same length. Every shape is of the one
+        *autoshape_type_id*, a text box when it is |None|.
+
+        The shape elements are all produced by a single XML parse and
+        appended in one pass, which is much faster than calling
+        :meth:`add_shape` for each when adding thousands of shapes.
+        """
+        columns = (lefts, tops, widths, heights)
+        if specs is None:
+            specs = self._bulk_specs_from_columns(
+                autoshape_type_id, columns, texts, fills
+            )
+        elif any(c is not None for c in columns + (texts, fills)):
+            raise ValueError('specs and shape columns cannot both be given')
+        specs = list(specs)
+        sp_specs = []
+        for spec, id_ in zip(specs, self._next_shape_ids(len(specs))):
+            autoshape_type_id, x, y, cx, cy = spec[:5]
+            text = spec[5] if len(spec) > 5 else None
+            fill = spec[6] if len(spec) > 6 else None
+            if autoshape_type_id is None:
+                name, prst = 'TextBox %d' % (id_-1), None
+            else:
+                autoshape_type = AutoShapeType(autoshape_type_id)
+                name = '%s %d' % (autoshape_type.basename, id_-1)
+                prst = autoshape_type.prst
+            sp_specs.append((
+                id_, name, prst, x, y, cx, cy,
+                None if text is None else to_unicode(text),
+                None if fill is None else str(fill),
+            ))
+
+        sps = self._spTree.add_autoshapes(sp_specs)
+        self._shapes_added(*sps)
+        # ---a new autoshape or textbox is never a placeholder, so it is
+        #    always proxied by |Shape|, whatever this collection's factory---
+        return [Shape(sp, self) for sp in sps]
+
     def add_textbox(self, left, top, width, height):
         """Return newly added text box shape appended to this shape tree.
 
@@ -319,7 +408,7 @@ class _BaseGroupShapes(_BaseShapes):
         position on the slide.
         """
         sp = self._add_textbox_sp(left, top, width, height)
-        self._recalculate_extents()
+        self._shapes_added(sp)
         return self._shape_factory(sp)
 
     def build_freeform(self, start_x=0, start_y=0, scale=1.0):
@@ -362,7 +451,7 @@ class _BaseGroupShapes(_BaseShapes):
         The `p:graphicFrame` element has the specified position and size and
         refers to the chart part identified by *rId*.
         """
-        shape_id = self._next_shape_id
+        shape_id = self._next_shape_id()
         name = 'Chart %d' % (shape_id-1)
         graphicFrame = CT_GraphicalObjectFrame.new_chart_graphicFrame(
             shape_id, name, rId, x, y, cx, cy
@@ -377,7 +466,7 @@ class _BaseGroupShapes(_BaseShapes):
         beginning at (*begin_x*, *begin_y*) and extending to
         (*end_x*, *end_y*).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = 'Connector %d' % (id_-1)
 
         flipH, flipV = begin_x > end_x, begin_y > end_y
@@ -396,7 +485,7 @@ class _BaseGroupShapes(_BaseShapes):
         appended to the shape tree, causing it to be displayed first in
         z-order on the slide.
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         scaled_cx, scaled_cy = image_part.scale(cx, cy)
         name = 'Picture %d' % (id_-1)
         desc = image_part.desc
@@ -411,7 +500,7 @@ class _BaseGroupShapes(_BaseShapes):
         `p:sp` element is of *autoshape_type* at position (*x*, *y*) and of
         size (*cx*, *cy*).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = '%s %d' % (autoshape_type.basename, id_-1)
         sp = self._grpSp.add_autoshape(
             id_, name, autoshape_type.prst, x, y, cx, cy
@@ -423,11 +512,34 @@ class _BaseGroupShapes(_BaseShapes):
 
         Element has position (*x*, *y*) and size (*cx*, *cy*).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = 'TextBox %d' % (id_-1)
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
         return sp
 
+    @staticmethod
+    def _bulk_specs_from_columns(autoshape_type_id, columns, texts, fills):
+        """Return list of :meth:`add_shapes_bulk` records for shape columns.
+
+        *columns* is a `(lefts, tops, widths, heights)` 4-tuple of sequences
+        and *texts* and *fills* are each a sequence or |None|. Raises
+        |ValueError| when a column is missing or they differ in length.
+        """
+        if any(c is None for c in columns):
+            raise ValueError(
+                'lefts, tops, widths and heights are required without specs'
+            )
+        shape_count = len(columns[0])
+        optional_columns = [
+            [None] * shape_count if c is None else c for c in (texts, fills)
+        ]
+        columns = list(columns) + optional_columns
+        if any(len(c) != shape_count for c in columns):
+            raise ValueError('shape columns must all have the same length')
+        return [
+            (autoshape_type_id,) + record for record in zip(*columns)
+        ]
+
     def _recalculate_extents(self):
         """Adjust position and size to incorporate all contained shapes.
 
@@ -438,6 +550,15 @@ class _BaseGroupShapes(_BaseShapes):
         #    produce the distinctive behavior of groups and subgroups.---
         pass
 
+    def _shapes_added(self, *shape_elms):
+        """Update this shape tree after *shape_elms* are added to it.
+
+        Called by each method adding a shape, after the shape element is in
+        the XML.
+        """
+        CT_GroupShape.shapes_changed()
+        self._recalculate_extents()
+
 
 class GroupShapes(_BaseGroupShapes):
     """The sequence of child shapes belonging to a group shape.
@@ -454,6 +575,18 @@ class GroupShapes(_BaseGroupShapes):
         """
         self._grpSp.recalculate_extents()
 
+    def _shapes_added(self, *shape_elms):
+        """Update this shape tree after *shape_elms* are added to it.
+
+        Besides the extents of the group being recalculated, the names of the
+        new shapes are noted as used in the slide, which only notices shapes
+        added to the shape tree of the slide itself without being told.
+        """
+        super(GroupShapes, self)._shapes_added(*shape_elms)
+        shape_names = self.part.shape_names
+        for shape_elm in shape_elms:
+            shape_names.add_shape(shape_elm)
+
 
 class SlideShapes(_BaseGroupShapes):
     """Sequence of shapes appearing on a slide.
@@ -463,7 +596,7 @@ class SlideShapes(_BaseGroupShapes):
     """
 
     def add_movie(self, movie_file, left, top, width, height,
-                  poster_frame_image=None, mime_type=CT.VIDEO):
+                  poster_frame_image=None, mime_type=CT.VIDEO, lazy=False):
         """Return newly added movie shape displaying video in *movie_file*.
 
         **EXPERIMENTAL.** This method has important limitations:
@@ -481,11 +614,14 @@ class SlideShapes(_BaseGroupShapes):
         Return a newly added movie shape to the slide, positioned at (*left*,
         *top*), having size (*width*, *height*), and containing *movie_file*.
         Before the video is started, *poster_frame_image* is displayed as
-        a placeholder for the video.
+        a placeholder for the video. When *lazy* is |True|, a video file
+        given by path is not read into memory; it is read in chunks when the
+        presentation is saved, so it must remain available and unchanged
+        until then.
         """
         movie_pic = _MoviePicElementCreator.new_movie_pic(
-            self, self._next_shape_id, movie_file, left, top, width, height,
-            poster_frame_image, mime_type
+            self, self._next_shape_id(), movie_file, left, top, width, height,
+            poster_frame_image, mime_type, lazy
         )
         self._spTree.append(movie_pic)
         self._add_video_timing(movie_pic)
@@ -506,6 +642,32 @@ class SlideShapes(_BaseGroupShapes):
         graphic_frame = self._shape_factory(graphicFrame)
         return graphic_frame
 
+    def add_table_from_data(self, data, left, top, width, height,
+                            col_formats=None):
+        """Add a |GraphicFrame| object containing a table populated by *data*.
+
+        *data* is a 2-D data source, a sequence of rows each being
+        a sequence of cell values, such as a list of lists or a NumPy array.
+        A pandas DataFrame can also be used, in which case only its values
+        appear, not its index or column labels. The table has a row for
+        each row and a column for each column in *data*, and is positioned
+        and sized as for :meth:`add_table`.
+
+        Each cell contains the text of its value, or is empty when the
+        value is |None|. The optional *col_formats* is a sequence having
+        an item for each column, each either a format specification like
+        ``',.2f'`` as accepted by the built-in :func:`format`, a callable
+        returning the text for a value, or |None| to use the value's str
+        form. The table is produced in a single pass, which is much faster
+        than assigning the text of each cell of a table from
+        :meth:`add_table`.
+        """
+        texts = self._table_cell_texts(data, col_formats)
+        graphicFrame = self._add_graphicFrame_containing_table(
+            len(texts), len(texts[0]), left, top, width, height, texts
+        )
+        return self._shape_factory(graphicFrame)
+
     def clone_layout_placeholders(self, slide_layout):
         """
         Add placeholder shapes based on those in *slide_layout*. Z-order of
@@ -534,15 +696,16 @@ class SlideShapes(_BaseGroupShapes):
                 return self._shape_factory(elm)
         return None
 
-    def _add_graphicFrame_containing_table(self, rows, cols, x, y, cx, cy):
+    def _add_graphicFrame_containing_table(self, rows, cols, x, y, cx, cy,
+                                           texts=None):
         """
         Return a newly added ``<p:graphicFrame>`` element containing a table
         as specified by the parameters.
         """
-        _id = self._next_shape_id
+        _id = self._next_shape_id()
         name = 'Table %d' % (_id-1)
         graphicFrame = self._spTree.add_table(
-            _id, name, rows, cols, x, y, cx, cy
+            _id, name, rows, cols, x, y, cx, cy, texts
         )
         return graphicFrame
 
@@ -563,6 +726,52 @@ class SlideShapes(_BaseGroupShapes):
         """
         return SlideShapeFactory(shape_elm, self)
 
+    @staticmethod
+    def _table_cell_texts(data, col_formats):
+        """Return list of rows of cell text for a table depicting *data*.
+
+        A cell text is |None| when its value is |None|. Raises |ValueError|
+        when *data* is empty or its rows are not all the same length as
+        each other and *col_formats*.
+        """
+        # ---a pandas DataFrame iterates its column labels, so its values
+        #    are used; a NumPy array is made a list of lists of Python
+        #    scalars in one step---
+        if hasattr(data, 'to_numpy'):
+            data = data.to_numpy()
+        if hasattr(data, 'tolist'):
+            data = data.tolist()
+        rows = [list(row) for row in data]
+
+        cols = len(rows[0]) if rows else 0
+        if cols == 0:
+            raise ValueError('table data must have at least one cell')
+        if any(len(row) != cols for row in rows):
+            raise ValueError('table data rows must all be the same length')
+        if col_formats is None:
+            col_formats = [None] * cols
+        if len(col_formats) != cols:
+            raise ValueError(
+                'expected %d column formats, got %d' %
+                (cols, len(col_formats))
+            )
+
+        def text(value, fmt):
+            if value is None:
+                return None
+            if fmt is None and is_string(value):
+                return to_unicode(value)
+            if fmt is None:
+                return Unicode(value)
+            if callable(fmt):
+                return to_unicode(fmt(value))
+            return format(value, fmt)
+
+        return [
+            [text(value, fmt) for value, fmt in zip(row, col_formats)]
+            for row in rows
+        ]
+
 
 class LayoutShapes(_BaseShapes):
     """
@@ -703,7 +912,12 @@ class SlidePlaceholders(ParentedElementProxy):
     placeholders it contains.
     """
 
-    __slots__ = ()
+    __slots__ = ('_ph_elms_cache', '_ph_elms_key')
+
+    def __init__(self, spTree, parent):
+        super(SlidePlaceholders, self).__init__(spTree, parent)
+        self._ph_elms_cache = None
+        self._ph_elms_key = None
 
     def __getitem__(self, idx):
         """
@@ -712,25 +926,46 @@ class SlidePlaceholders(ParentedElementProxy):
         |KeyError| if no placeholder with that idx value is in the
         collection.
         """
-        for e in self._element.iter_ph_elms():
-            if e.ph_idx == idx:
-                return SlideShapeFactory(e, self)
-        raise KeyError('no placeholder on this slide with idx == %d' % idx)
+        e = self._ph_elm_index[1].get(idx)
+        # ---a placeholder moved out of the tree other than by |pp|---
+        if e is not None and e.getparent() is not self._element:
+            self._ph_elms_cache = None
+            e = self._ph_elm_index[1].get(idx)
+        if e is None:
+            raise KeyError('no placeholder on this slide with idx == %d' % idx)
+        return SlideShapeFactory(e, self)
 
     def __iter__(self):
         """
         Generate placeholder shapes in `idx` order.
         """
-        ph_elms = sorted(
-            [e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx
-        )
+        ph_elms = sorted(self._ph_elm_index[0], key=lambda e: e.ph_idx)
         return (SlideShapeFactory(e, self) for e in ph_elms)
 
     def __len__(self):
         """
         Return count of placeholder shapes.
         """
-        return len(list(self._element.iter_ph_elms()))
+        return len(self._ph_elm_index[0])
+
+    @property
+    def _ph_elm_index(self):
+        """
+        `(ph_elms, ph_elms_by_idx)` 2-tuple for the placeholders on this
+        slide. *ph_elms* is the sequence of placeholder elements in document
+        order and *ph_elms_by_idx* maps each `idx` value to the first
+        placeholder element having it. The pair is cached and rebuilt on the
+        same terms as the member elements of a shape collection.
+        """
+        key = (CT_GroupShape.generation, self._element.last_child)
+        if self._ph_elms_cache is None or key != self._ph_elms_key:
+            ph_elms = list(self._element.iter_ph_elms())
+            ph_elms_by_idx = {}
+            for e in reversed(ph_elms):
+                ph_elms_by_idx[e.ph_idx] = e
+            self._ph_elms_cache = (ph_elms, ph_elms_by_idx)
+            self._ph_elms_key = key
+        return self._ph_elms_cache
 
 
 def BaseShapeFactory(shape_elm, parent):
@@ -830,7 +1065,7 @@ class _MoviePicElementCreator(object):
     """
 
     def __init__(self, shapes, shape_id, movie_file, x, y, cx, cy,
-                 poster_frame_file, mime_type):
+                 poster_frame_file, mime_type, lazy=False):
         super(_MoviePicElementCreator, self).__init__()
         self._shapes = shapes
         self._shape_id = shape_id
@@ -838,19 +1073,21 @@ class _MoviePicElementCreator(object):
         self._x, self._y, self._cx, self._cy = x, y, cx, cy
         self._poster_frame_file = poster_frame_file
         self._mime_type = mime_type
+        self._lazy = lazy
 
     @classmethod
     def new_movie_pic(cls, shapes, shape_id, movie_file, x, y, cx, cy,
-                      poster_frame_image, mime_type):
+                      poster_frame_image, mime_type, lazy=False):
         """Return a new `p:pic` element containing video in *movie_file*.
 
         If *mime_type* is None, 'video/unknown' is used. If
         *poster_frame_file* is None, the default "media loudspeaker" image is
-        used.
+        used. When *lazy* is |True|, a video file given by path is read only
+        when it is saved.
         """
         return cls(
             shapes, shape_id, movie_file, x, y, cx, cy, poster_frame_image,
-            mime_type
+            mime_type, lazy
         )._pic
         return
 
@@ -913,7 +1150,7 @@ class _MoviePicElementCreator(object):
     def _video(self):
         """Return a |Video| object containing the movie file."""
         return Video.from_path_or_file_like(
-            self._movie_file, self._mime_type
+            self._movie_file, self._mime_type, self._lazy
         )
 
     @lazyproperty
@@ -8,7 +8,7 @@ from __future__ import (
 
 from pptx.compat import is_integer, to_unicode
 from pptx.dml.fill import FillFormat
-from pptx.oxml.table import TcRange
+from pptx.oxml.table import TcGrid, TcRange
 from pptx.shapes import Subshape
 from pptx.text.text import TextFrame
 from pptx.util import lazyproperty
@@ -25,6 +25,8 @@ class Table(object):
         super(Table, self).__init__()
         self._tbl = tbl
         self._graphic_frame = graphic_frame
+        self._tc_grid_cache = None
+        self._tc_grid_generation = None
 
     def cell(self, row_idx, col_idx):
         """Return cell at *row_idx*, *col_idx*.
@@ -32,7 +34,17 @@ class Table(object):
         Return value is an instance of |_Cell|. *row_idx* and *col_idx* are
         zero-based, e.g. cell(0, 0) is the top, left cell in the table.
         """
-        return _Cell(self._tbl.tc(row_idx, col_idx), self)
+        try:
+            tc = self.tc_grid.tc(row_idx, col_idx)
+            tr = tc.getparent()
+        except IndexError:
+            tr = None
+        # ---a row or cell added or removed other than by |pp| leaves the
+        # index out of date---
+        if tr is None or tr.getparent() is not self._tbl:
+            self._tc_grid_cache = None
+            tc = self.tc_grid.tc(row_idx, col_idx)
+        return _Cell(tc, self)
 
     @lazyproperty
     def columns(self):
@@ -85,7 +97,7 @@ class Table(object):
 
         Each grid cell is generated in left-to-right, top-to-bottom order.
         """
-        return (_Cell(tc, self) for tc in self._tbl.iter_tcs())
+        return (_Cell(tc, self) for tc in self.tc_grid.iter_tcs())
 
     @property
     def last_col(self):
@@ -146,6 +158,22 @@ class Table(object):
         """
         return _RowCollection(self._tbl, self)
 
+    @property
+    def tc_grid(self):
+        """
+        |TcGrid| object indexing the cell elements of this table by grid
+        position, used for constant-time cell access and merge operations.
+        The index is cached and rebuilt after |pp| adds a row or cell to
+        a table. :meth:`cell` also rebuilds it when the cell it finds is no
+        longer in this table, as after a row is removed directly in the XML.
+        """
+        generation = TcGrid.generation
+        if (self._tc_grid_cache is None or
+                generation != self._tc_grid_generation):
+            self._tc_grid_cache = TcGrid(self._tbl)
+            self._tc_grid_generation = generation
+        return self._tc_grid_cache
+
     @property
     def vert_banding(self):
         """
@@ -268,7 +296,7 @@ class _Cell(Subshape):
         cells anywhere within its extents or if *other_cell* is not in the
         same table as *self*.
         """
-        tc_range = TcRange(self._tc, other_cell._tc)
+        tc_range = TcRange(self._tc, other_cell._tc, self._parent.tc_grid)
 
         if not tc_range.in_same_table:
             raise ValueError('other_cell from different table')
@@ -328,7 +356,9 @@ class _Cell(Subshape):
                 'lit'
             )
 
-        tc_range = TcRange.from_merge_origin(self._tc)
+        tc_range = TcRange.from_merge_origin(
+            self._tc, self._parent.tc_grid
+        )
 
         for tc in tc_range.iter_tcs():
             tc.rowSpan = tc.gridSpan = 1
@@ -440,6 +470,14 @@ class _Row(Subshape):
         self._tr.h = height
         self._parent.notify_height_changed()
 
+    @property
+    def tc_grid(self):
+        """
+        |TcGrid| object of the table containing this row. Pass along to
+        parent.
+        """
+        return self._parent.tc_grid
+
 
 class _CellCollection(Subshape):
     """Horizontal sequence of row cells"""
@@ -463,6 +501,14 @@ class _CellCollection(Subshape):
         """Supports len() function (e.g. 'len(cells) == 1')."""
         return len(self._tr.tc_lst)
 
+    @property
+    def tc_grid(self):
+        """
+        |TcGrid| object of the table containing these cells. Pass along to
+        parent.
+        """
+        return self._parent.tc_grid
+
 
 class _ColumnCollection(Subshape):
     """Sequence of table columns."""
@@ -520,3 +566,11 @@ class _RowCollection(Subshape):
         Called by a row when its height changes. Pass along to parent.
         """
         self._parent.notify_height_changed()
+
+    @property
+    def tc_grid(self):
+        """
+        |TcGrid| object of the table containing these rows. Pass along to
+        parent.
+        """
+        return self._parent.tc_grid
@@ -6,8 +6,6 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
-from PIL import ImageFont
-
 
 class TextFitter(tuple):
     """
@@ -292,6 +290,8 @@ class _Fonts(object):
     @classmethod
     def font(cls, font_path, point_size):
         if (font_path, point_size) not in cls.fonts:
+            # ---Pillow is only imported when text is actually fitted---
+            from PIL import ImageFont
             cls.fonts[(font_path, point_size)] = ImageFont.truetype(
                 font_path, point_size
             )
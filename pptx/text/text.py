@@ -54,10 +54,15 @@ class TextFrame(Subshape):
 
     def clear(self):
         """
-        Remove all paragraphs except one empty one.
+        Remove all paragraphs except one empty one. Any relationship, such
+        as a hyperlink, referenced only by the removed text is dropped.
         """
-        for p in self._txBody.p_lst[1:]:
+        removed = self._txBody.p_lst[1:]
+        rIds = [rId for p in removed for rId in p.xpath('.//@r:*')]
+        for p in removed:
             self._txBody.remove(p)
+        if rIds:
+            self.part.drop_unreferenced_rels(rIds)
         p = self.paragraphs[0]
         p.clear()
 
@@ -457,8 +462,9 @@ class _Hyperlink(Subshape):
 
     def _remove_hlinkClick(self):
         assert self._hlinkClick is not None
-        self.part.drop_rel(self._hlinkClick.rId)
+        rId = self._hlinkClick.rId
         self._rPr._remove_hlinkClick()
+        self.part.drop_unreferenced_rels([rId])
 
 
 class _Paragraph(Subshape):
@@ -498,10 +504,16 @@ class _Paragraph(Subshape):
     def clear(self):
         """
         Remove all content from this paragraph. Paragraph properties are
-        preserved. Content includes runs, line breaks, and fields.
+        preserved. Content includes runs, line breaks, and fields. Any
+        relationship, such as a hyperlink, referenced only by the removed
+        content is dropped.
         """
-        for elm in self._element.content_children:
+        removed = self._element.content_children
+        rIds = [rId for elm in removed for rId in elm.xpath('.//@r:*')]
+        for elm in removed:
             self._element.remove(elm)
+        if rIds:
+            self.part.drop_unreferenced_rels(rIds)
         return self
 
     @property
@@ -6,6 +6,7 @@ Test suite for pptx.chart.data module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from array import array
 from datetime import date, datetime
 
 import pytest
@@ -19,7 +20,7 @@ from pptx.chart.data import (
 from pptx.chart.xlsx import CategoryWorkbookWriter
 from pptx.enum.base import EnumValue
 
-from ..unitutil.mock import call, class_mock, instance_mock, property_mock
+from ..unitutil.mock import class_mock, instance_mock, property_mock
 
 
 class DescribeChartData(object):
@@ -173,22 +174,20 @@ class DescribeCategoryChartData(object):
 
     def it_can_add_a_series(self, add_ser_fixture):
         chart_data, name, values, number_format = add_ser_fixture[:4]
-        CategorySeriesData_, calls, series_ = add_ser_fixture[4:]
+        CategorySeriesData_, series_ = add_ser_fixture[4:]
         series = chart_data.add_series(name, values, number_format)
         CategorySeriesData_.assert_called_once_with(
             chart_data, name, number_format
         )
         assert chart_data[-1] is series
-        assert series.add_data_point.call_args_list == calls
+        series.add_data_points.assert_called_once_with(values)
         assert series is series_
 
     def it_can_set_its_categories(self, categories_set_fixture):
-        chart_data, names, Categories_, categories_, calls = (
-            categories_set_fixture
-        )
+        chart_data, names, Categories_, categories_ = categories_set_fixture
         chart_data.categories = names
         Categories_.assert_called_once_with()
-        assert categories_.add_category.call_args_list == calls
+        categories_.add_categories.assert_called_once_with(names)
         assert chart_data._categories is categories_
 
     # fixtures -------------------------------------------------------
@@ -204,10 +203,9 @@ class DescribeCategoryChartData(object):
     def add_ser_fixture(self, CategorySeriesData_, series_):
         chart_data = CategoryChartData()
         name, values, number_format = 'foobar', iter((1, 2, 3)), '0.0'
-        calls = [call(1), call(2), call(3)]
         return (
             chart_data, name, values, number_format, CategorySeriesData_,
-            calls, series_
+            series_
         )
 
     @pytest.fixture
@@ -227,8 +225,7 @@ class DescribeCategoryChartData(object):
     def categories_set_fixture(self, Categories_, categories_):
         chart_data = CategoryChartData()
         names = iter(('a', 'b', 'c'))
-        calls = [call('a'), call('b'), call('c')]
-        return chart_data, names, Categories_, categories_, calls
+        return chart_data, names, Categories_, categories_
 
     @pytest.fixture
     def values_ref_fixture(
@@ -331,6 +328,34 @@ class DescribeCategories(object):
         assert categories._categories[-1] is category
         assert category is category_
 
+    def it_can_add_categories_as_a_column_of_labels(self, column_fixture):
+        categories, labels, expected_labels, expected_type = column_fixture
+
+        categories.add_categories(labels)
+
+        assert type(categories._labels) is expected_type
+        assert categories._categories == []
+        assert len(categories) == categories.leaf_count == len(labels)
+        assert categories.depth == 1
+        assert list(categories.labels) == expected_labels
+        assert list(categories.levels) == [list(enumerate(expected_labels))]
+
+    def it_creates_category_objects_from_its_labels_on_access(self):
+        categories = Categories()
+        categories.add_categories(array(str('d'), [1.5, 2.5]))
+
+        category = categories[1]
+        categories.add_category(3.5)
+
+        assert categories._labels is None
+        assert category.label == 2.5
+        assert category.idx == 1
+        assert [c.label for c in categories] == [1.5, 2.5, 3.5]
+
+    def it_knows_the_numeric_string_value_of_its_labels(self, num_fixture):
+        categories, expected_value = num_fixture
+        assert categories.numeric_str_vals() == expected_value
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -367,6 +392,16 @@ class DescribeCategories(object):
             categories.add_category(label)
         return categories, expected_value
 
+    @pytest.fixture(params=[
+        (array(str('d'), [1.5, 2.5]), [1.5, 2.5], array),
+        (array(str('l'), [1, 2, 3]),  [1, 2, 3],  array),
+        (['a', None, 'c'],           ['a', '', 'c'], list),
+    ])
+    def column_fixture(self, request):
+        labels, expected_labels, expected_type = request.param
+        categories = Categories()
+        return categories, labels, expected_labels, expected_type
+
     @pytest.fixture(params=[
         ((),        0),
         ((1,),      1),
@@ -461,6 +496,21 @@ class DescribeCategories(object):
             categories._number_format = number_format
         return categories, expected_value
 
+    @pytest.fixture(params=[
+        ('objects', ['42', '43.0', '42726.0']),
+        ('column',  ['42', '43.0', '42726.0']),
+    ])
+    def num_fixture(self, request):
+        storage, expected_value = request.param
+        labels = (42, 43.0, date(2016, 12, 22))
+        categories = Categories()
+        if storage == 'column':
+            categories.add_categories(labels)
+        else:
+            for label in labels:
+                categories.add_category(label)
+        return categories, expected_value
+
     @pytest.fixture(params=[
         ('0.0', '0.0'),
         (None,  'General'),
@@ -684,9 +734,41 @@ class DescribeCategorySeriesData(object):
         CategoryDataPoint_.assert_called_once_with(
             series_data, value, number_format
         )
-        assert series_data[-1] is data_point_
+        assert series_data.values == [value]
+        assert series_data._number_formats == {0: number_format}
         assert data_point is data_point_
 
+    def it_can_add_data_points(self, add_points_fixture):
+        series_data, values, expected_values, expected_type = (
+            add_points_fixture
+        )
+        series_data.add_data_points(values)
+        assert type(series_data.values) is expected_type
+        assert list(series_data.values) == expected_values
+
+    def it_provides_a_copy_of_its_values(self):
+        series_data = CategorySeriesData(None, None, None)
+        series_data.add_data_points(array(str('d'), [1.5, 2.5]))
+        values = series_data.values
+        values[0] = 9.5
+        assert list(series_data.values) == [1.5, 2.5]
+
+    def it_provides_access_to_its_data_points(self):
+        series_data = CategorySeriesData(None, None, '0.0')
+        series_data.add_data_points(array(str('d'), [1.5, 2.5]))
+        series_data.add_data_point(3.5, '0.00')
+
+        data_points = series_data[:]
+
+        assert len(series_data) == 3
+        assert [dp.value for dp in data_points] == [1.5, 2.5, 3.5]
+        assert [dp.number_format for dp in data_points] == [
+            '0.0', '0.0', '0.00'
+        ]
+        assert series_data[-1].value == 3.5
+        with pytest.raises(IndexError):
+            series_data[3]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -698,6 +780,26 @@ class DescribeCategorySeriesData(object):
             data_point_
         )
 
+    @pytest.fixture(params=[
+        ((),                            [],          [],            list),
+        ((1, None, 3),                  [],          [1, None, 3],  list),
+        (array(str('d'), [1.5, 2.5]),   [],          [1.5, 2.5],    array),
+        (array(str('d'), [1.5, 2.5]),   [0.5],       [0.5, 1.5, 2.5], list),
+        (array(str('l'), [1, 2]),       [0],         [0, 1, 2],     list),
+        (array(str('l'), [1, 2]),       array(str('l'), [0]), [0, 1, 2],
+         array),
+        (array(str('d'), [1.5]),        array(str('l'), [0]), [0, 1.5], list),
+        (memoryview(array(str('h'), [1, 2]))[::-1], [], [2, 1],     array),
+        (array(str('f'), [0.1, 2.5]),   [],          [0.1, 2.5],    array),
+    ])
+    def add_points_fixture(self, request):
+        values, initial_values, expected_values, expected_type = (
+            request.param
+        )
+        series_data = CategorySeriesData(None, None, None)
+        series_data._values = initial_values
+        return series_data, values, expected_values, expected_type
+
     @pytest.fixture
     def categories_fixture(self, chart_data_, categories_):
         series_data = CategorySeriesData(chart_data_, None, None)
@@ -712,13 +814,11 @@ class DescribeCategorySeriesData(object):
         return series_data, expected_value
 
     @pytest.fixture
-    def values_fixture(self, request):
+    def values_fixture(self):
         series_data = CategorySeriesData(None, None, None)
         expected_values = [1, 2, 3]
         for value in expected_values:
-            series_data._data_points.append(
-                instance_mock(request, CategoryDataPoint, value=value)
-            )
+            series_data.append(CategoryDataPoint(None, value, None))
         return series_data, expected_values
 
     @pytest.fixture
@@ -828,6 +928,26 @@ class DescribeBubbleSeriesData(object):
         assert series_data[-1] is data_point_
         assert data_point is data_point_
 
+    def it_can_add_data_points(self):
+        series_data = BubbleSeriesData(None, None, None)
+        x_values = array(str('d'), [1.5, 2.5])
+        y_values, sizes = array(str('l'), [3, 4]), [10, 20]
+
+        series_data.add_data_points(x_values, y_values, sizes)
+
+        assert series_data.x_values == x_values
+        assert series_data.y_values == y_values
+        assert series_data.bubble_sizes == sizes
+        assert [dp.bubble_size for dp in series_data] == [10, 20]
+
+    def it_can_append_a_data_point(self):
+        series_data = BubbleSeriesData(None, None, '0')
+        series_data.append(BubbleDataPoint(None, 1, 2, 3, '0.0'))
+        data_point = series_data[0]
+        assert (data_point.x, data_point.y) == (1, 2)
+        assert data_point.bubble_size == 3
+        assert data_point.number_format == '0.0'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -867,6 +987,25 @@ class DescribeXySeriesData(object):
         assert series_data[-1] is data_point_
         assert data_point is data_point_
 
+    def it_can_add_data_points(self):
+        series_data = XySeriesData(None, None, '0.0')
+        series_data.add_data_point(0.5, 1.5, '0.00')
+
+        series_data.add_data_points(
+            array(str('d'), [1.0, 2.0]), array(str('d'), [3.0, 4.0])
+        )
+
+        assert series_data.x_values == [0.5, 1.0, 2.0]
+        assert series_data.y_values == [1.5, 3.0, 4.0]
+        assert [(dp.x, dp.y, dp.number_format) for dp in series_data] == [
+            (0.5, 1.5, '0.00'), (1.0, 3.0, '0.0'), (2.0, 4.0, '0.0')
+        ]
+
+    def it_raises_on_x_and_y_values_differing_in_length(self):
+        series_data = XySeriesData(None, None, None)
+        with pytest.raises(ValueError):
+            series_data.add_data_points((1, 2), (3,))
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
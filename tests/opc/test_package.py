@@ -7,24 +7,33 @@ Test suite for pptx.opc.package module
 from __future__ import absolute_import
 
 import pytest
+import shutil
+import zipfile
 
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.oxml import CT_Relationships
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
-    OpcPackage, Part, PartFactory, _Relationship, RelationshipCollection,
-    Unmarshaller, XmlPart
+    _IdxAllocator, OpcPackage, PackageTemplate, Part, PartFactory,
+    _PartIndex, _Relationship, RelationshipCollection, Unmarshaller, XmlPart
 )
+from pptx.opc.phys_pkg import CachedPkgMember, PhysPkgMember, _ZipPkgReader
 from pptx.opc.pkgreader import PackageReader
+from pptx.oxml.ns import nsdecls
 from pptx.oxml.xmlchemy import BaseOxmlElement
 from pptx.package import Package
 
 from ..unitutil.cxml import element
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call, class_mock, cls_attr_mock, function_mock, initializer_mock,
     instance_mock, loose_mock, method_mock, Mock, patch, PropertyMock
 )
 
 
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+
+
 class DescribeOpcPackage(object):
 
     def it_can_open_a_pkg_file(self, PackageReader_, PartFactory_,
@@ -35,9 +44,11 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(
+            pkg_file, False, False
+        )
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
-                                                        PartFactory_)
+                                                        PartFactory_, None)
         assert isinstance(pkg, OpcPackage)
 
     def it_initializes_its_rels_collection_on_first_reference(
@@ -102,12 +113,36 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, None
         )
 
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
         pkg.after_unmarshal()
 
+    def it_can_close_the_file_it_was_lazily_loaded_from(self):
+        with OpcPackage.open(test_pptx_path, lazy=True) as pkg:
+            phys_reader = pkg._phys_reader
+            assert phys_reader._zipf.fp is not None
+        assert phys_reader._zipf.fp is None
+        assert pkg._phys_reader is None
+
+    @pytest.mark.parametrize('lazy, mmap', [(True, False), (False, True)])
+    def it_can_save_to_the_file_it_was_loaded_from(self, tmpdir, lazy, mmap):
+        path = str(tmpdir.join('source.pptx'))
+        shutil.copy(test_pptx_path, path)
+        pkg = OpcPackage.open(path, lazy=lazy, mmap=mmap)
+        partnames = sorted(p.partname for p in pkg.iter_parts())
+
+        pkg.save(path)
+
+        with zipfile.ZipFile(path) as zipf:
+            assert zipf.testzip() is None
+        assert pkg._phys_reader is None
+        saved_pkg = OpcPackage.open(path)
+        assert sorted(p.partname for p in saved_pkg.iter_parts()) == (
+            partnames
+        )
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -125,17 +160,12 @@ class DescribeOpcPackage(object):
     @pytest.fixture(params=[
         ((), 1), ((1,), 2), ((1, 2), 3), ((2, 3), 1), ((1, 3), 2)
     ])
-    def next_partname_fixture(self, request, iter_parts_):
+    def next_partname_fixture(self, request):
         existing_partname_numbers, next_partname_number = request.param
         package = OpcPackage()
-        parts = [
-            instance_mock(
-                request, Part, name='part[%d]' % idx,
-                partname='/foo/bar/baz%d.xml' % n
-            )
-            for idx, n in enumerate(existing_partname_numbers)
-        ]
-        iter_parts_.return_value = iter(parts)
+        for n in existing_partname_numbers:
+            part = Part(PackURI('/foo/bar/baz%d.xml' % n), None, None, package)
+            package.relate_to(part, 'http://rel/type')
         partname_template = '/foo/bar/baz%d.xml'
         expected_partname = PackURI(
             '/foo/bar/baz%d.xml' % next_partname_number
@@ -181,6 +211,8 @@ class DescribeOpcPackage(object):
 
         package = OpcPackage()
 
+        part_1_.partname = PackURI('/ppt/part1.xml')
+        part_2_.partname = PackURI('/ppt/part2.xml')
         package._rels = self.rels(request, (r1, r4, r5))
         part_1_.rels = self.rels(request, (r2,))
         part_2_.rels = self.rels(request, (r3,))
@@ -189,10 +221,6 @@ class DescribeOpcPackage(object):
 
     # fixture components -----------------------------------
 
-    @pytest.fixture
-    def iter_parts_(self, request):
-        return method_mock(request, OpcPackage, 'iter_parts')
-
     @pytest.fixture
     def PackageReader_(self, request):
         return class_mock(request, 'pptx.opc.package.PackageReader')
@@ -323,6 +351,34 @@ class DescribePart(object):
         part.blob = new_blob
         assert part.blob == new_blob
 
+    def it_reads_a_lazy_blob_on_first_reference(self, lazy_blob_fixture):
+        part, phys_reader_, partname = lazy_blob_fixture
+        assert phys_reader_.blob_for.call_count == 0
+        blob = part.blob
+        assert part.blob is blob
+        phys_reader_.blob_for.assert_called_once_with(partname)
+        assert blob == b'foobar'
+
+    def it_can_detach_from_its_package_file(self, lazy_blob_fixture):
+        part, phys_reader_ = lazy_blob_fixture[:2]
+        phys_reader_.compressed_blob_for.return_value = None
+
+        part.detach_from_source()
+
+        member = part.unmodified_member
+        assert isinstance(member, CachedPkgMember)
+        assert member.blob == b'foobar'
+        assert part.blob == b'foobar'
+        assert phys_reader_.blob_for.call_count == 1
+
+    def it_knows_when_it_is_unmodified_since_loading(self, lazy_blob_fixture):
+        part = lazy_blob_fixture[0]
+        member = part.unmodified_member
+        part.blob
+        assert part.unmodified_member is member
+        part.blob = b'barfoo'
+        assert part.unmodified_member is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -342,6 +398,14 @@ class DescribePart(object):
             __init_):
         return (partname_, content_type_, blob_, package_, __init_)
 
+    @pytest.fixture
+    def lazy_blob_fixture(self, phys_reader_):
+        partname = PackURI('/ppt/media/image1.png')
+        phys_reader_.blob_for.return_value = b'foobar'
+        member = PhysPkgMember(phys_reader_, partname)
+        part = Part(partname, None, member, None)
+        return part, phys_reader_, partname
+
     @pytest.fixture
     def package_get_fixture(self, package_):
         part = Part(None, None, None, package_)
@@ -387,6 +451,10 @@ class DescribePart(object):
     def partname_(self, request):
         return instance_mock(request, PackURI)
 
+    @pytest.fixture
+    def phys_reader_(self, request):
+        return instance_mock(request, _ZipPkgReader)
+
 
 class DescribePartRelationshipManagementInterface(object):
 
@@ -425,6 +493,13 @@ class DescribePartRelationshipManagementInterface(object):
         else:
             assert rId in part.rels
 
+    def it_can_drop_its_unreferenced_rels_in_one_sweep(
+            self, drop_unreferenced_fixture):
+        part, rIds, expected_dropped, expected_rIds = drop_unreferenced_fixture
+        dropped = part.drop_unreferenced_rels(rIds)
+        assert sorted(dropped) == expected_dropped
+        assert sorted(part.rels) == expected_rIds
+
     def it_can_find_a_related_part_by_reltype(self, related_part_fixture):
         part, reltype_, related_part_ = related_part_fixture
         related_part = part.part_related_by(reltype_)
@@ -455,6 +530,26 @@ class DescribePartRelationshipManagementInterface(object):
         part._rels = {rId: None}
         return part, rId, rel_should_be_dropped
 
+    @pytest.fixture(params=[
+        ('p:sp', None, ['rId1', 'rId2'], ['rId3']),
+        ('p:sp/r:a{r:embed=rId1}', None, ['rId2'], ['rId1', 'rId3']),
+        ('p:sp/r:a{r:id=rId2}', ['rId1'], ['rId1'], ['rId2', 'rId3']),
+        ('p:sp', ['rId3', 'rId9'], ['rId3'], ['rId1', 'rId2']),
+        ('p:sp', ['rId1', 'rId1'], ['rId1'], ['rId2', 'rId3']),
+        ('p:sp/r:a{r:id=rId2}', ['rId2'], [], ['rId1', 'rId2', 'rId3']),
+    ])
+    def drop_unreferenced_fixture(self, request, part):
+        part_cxml, rIds, expected_dropped, expected_rIds = request.param
+        part._element = element(part_cxml)
+        part._rels = dict(
+            (rId, Mock(name=rId, reltype=reltype)) for rId, reltype in (
+                ('rId1', RT.IMAGE),
+                ('rId2', RT.HYPERLINK),
+                ('rId3', RT.SLIDE_LAYOUT),
+            )
+        )
+        return part, rIds, expected_dropped, expected_rIds
+
     @pytest.fixture
     def load_rel_fixture(self, part, rels_, reltype_, part_, rId_):
         part._rels = rels_
@@ -560,6 +655,39 @@ class DescribeXmlPart(object):
         )
         assert isinstance(part, XmlPart)
 
+    def it_defers_parsing_when_loaded_lazily(self, lazy_load_fixture):
+        partname, member, parse_xml_, element_ = lazy_load_fixture
+        part = XmlPart.load(partname, None, member, None)
+        assert parse_xml_.call_count == 0
+        element = part._element
+        assert part._element is element
+        parse_xml_.assert_called_once_with(member.blob)
+        assert element is element_
+
+    def it_is_modified_once_its_xml_is_parsed(self, lazy_load_fixture):
+        partname, member = lazy_load_fixture[:2]
+        part = XmlPart.load(partname, None, member, None)
+        assert part.unmodified_member is member
+        part._element
+        assert part.unmodified_member is None
+
+    def it_copies_the_xml_of_a_cached_member_parsed_once(self):
+        partname = PackURI('/ppt/slides/slide1.xml')
+        member = CachedPkgMember(
+            partname, ('<p:sld %s><p:cSld/></p:sld>' % nsdecls('p')).encode()
+        )
+        part, part_2 = (
+            XmlPart.load(partname, None, member, None) for _ in range(2)
+        )
+
+        element, element_2 = part._element, part_2._element
+
+        assert element is not element_2
+        assert member.element not in (element, element_2)
+        assert element.xml == element_2.xml == member.element.xml
+        assert part.unmodified_member is None
+        assert part_2.unmodified_member is None
+
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
         blob = xml_part.blob
@@ -586,6 +714,14 @@ class DescribeXmlPart(object):
             __init_
         )
 
+    @pytest.fixture
+    def lazy_load_fixture(self, request, parse_xml_, element_):
+        partname = PackURI('/ppt/slides/slide1.xml')
+        phys_reader_ = instance_mock(request, _ZipPkgReader)
+        phys_reader_.blob_for.return_value = b'<p:sld/>'
+        member = PhysPkgMember(phys_reader_, partname)
+        return partname, member, parse_xml_, element_
+
     @pytest.fixture
     def part_fixture(self):
         return XmlPart(None, None, None, None)
@@ -629,6 +765,36 @@ class DescribeXmlPart(object):
         )
 
 
+class DescribePackageTemplate(object):
+
+    def it_can_construct_from_a_pkg_file(self, request):
+        pkg_reader_ = instance_mock(request, PackageReader)
+        cached_from_file_ = method_mock(
+            request, PackageReader, 'cached_from_file',
+            return_value=pkg_reader_
+        )
+
+        package_template = PackageTemplate.from_file('foo.pptx')
+
+        cached_from_file_.assert_called_once_with('foo.pptx')
+        assert package_template._pkg_reader is pkg_reader_
+
+    def it_creates_independent_packages(self):
+        package_template = PackageTemplate.from_file(test_pptx_path)
+
+        package = package_template.new_package(Package)
+        package_2 = package_template.new_package(Package)
+
+        assert isinstance(package, Package)
+        assert len(package.parts) == len(package_2.parts) > 1
+        for part, part_2 in zip(package.parts, package_2.parts):
+            assert part is not part_2
+            assert part.partname == part_2.partname
+            assert part.unmodified_member is part_2.unmodified_member
+        prs_part = package.main_document_part
+        assert prs_part._element is not package_2.main_document_part._element
+
+
 class DescribePartFactory(object):
 
     def it_constructs_custom_part_type_for_registered_content_types(
@@ -731,6 +897,185 @@ class Describe_Relationship(object):
         assert rel.target_ref == '../media/image1.png'
 
 
+class Describe_IdxAllocator(object):
+
+    def it_finds_the_lowest_unused_idx(self, idxs_fixture):
+        allocator, expected_idx = idxs_fixture
+        assert allocator.next_available == expected_idx
+
+    def it_reuses_a_removed_idx(self):
+        allocator = _IdxAllocator()
+        for idx in (1, 2, 3):
+            allocator.add(idx)
+        assert allocator.next_available == 4
+        allocator.remove(2)
+        assert allocator.next_available == 2
+        allocator.add(2)
+        assert allocator.next_available == 4
+
+    def it_keeps_an_idx_used_twice_until_both_are_removed(self):
+        allocator = _IdxAllocator()
+        allocator.add(1)
+        allocator.add(1)
+        allocator.remove(1)
+        assert allocator.next_available == 2
+        allocator.remove(1)
+        assert allocator.next_available == 1
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ((), 1), ((1,), 2), ((1, 2), 3), ((2, 3), 1), ((1, 3), 2),
+        ((1, 2, 9), 3),
+    ])
+    def idxs_fixture(self, request):
+        idxs, expected_idx = request.param
+        allocator = _IdxAllocator()
+        for idx in idxs:
+            allocator.add(idx)
+        return allocator, expected_idx
+
+
+class Describe_PartIndex(object):
+
+    def it_indexes_the_parts_reachable_from_the_package(self, pkg_fixture):
+        package, parts = pkg_fixture
+        part_index = _PartIndex(package)
+        assert part_index.parts == parts
+        assert len(part_index) == 3
+        assert '/ppt/part2.xml' in part_index
+        assert '/ppt/foobar.xml' not in part_index
+
+    def it_adds_newly_related_parts(self, pkg_fixture):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        part_index.parts
+        new_part = Part(PackURI('/ppt/part4.xml'), None, None, package)
+        child_part = Part(PackURI('/ppt/part5.xml'), None, None, package)
+        new_part.relate_to(child_part, RT.SLIDE)
+
+        parts[2].relate_to(new_part, RT.SLIDE)
+
+        assert part_index.parts == parts + (new_part, child_part)
+        assert '/ppt/part5.xml' in part_index
+
+    def it_ignores_parts_related_to_a_disconnected_part(self, pkg_fixture):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        part_index.parts
+        disconnected_part = Part(PackURI('/ppt/part4.xml'), None, None,
+                                 package)
+        child_part = Part(PackURI('/ppt/part5.xml'), None, None, package)
+
+        disconnected_part.relate_to(child_part, RT.SLIDE)
+
+        assert part_index.parts == parts
+
+    def it_follows_a_part_rename(self, pkg_fixture):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        part_index.parts
+
+        parts[0].partname = PackURI('/ppt/part9.xml')
+
+        assert '/ppt/part1.xml' not in part_index
+        assert '/ppt/part9.xml' in part_index
+
+    def it_is_rebuilt_after_a_relationship_is_dropped(
+            self, pkg_fixture, _rel_ref_count_):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        part_index.parts
+        generation = part_index.generation
+        _rel_ref_count_.return_value = 1
+
+        parts[0].drop_rel('rId1')
+
+        assert part_index.generation != generation
+        assert part_index.parts == (parts[0],)
+        assert '/ppt/part2.xml' not in part_index
+
+    def but_not_when_the_target_part_is_still_reachable(
+            self, pkg_fixture, _rel_ref_count_):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        part_index.parts
+        generation = part_index.generation
+        _rel_ref_count_.return_value = 0
+
+        parts[2].drop_rel('rId1')
+
+        assert 'rId1' not in parts[2].rels
+        assert part_index.generation == generation
+        assert part_index.parts == parts
+
+    def and_not_when_the_relationship_is_external(
+            self, pkg_fixture, _rel_ref_count_, _iter_unvisited_parts_):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        part_index.parts
+        generation = part_index.generation
+        rId = parts[0].relate_to('http://foo', RT.HYPERLINK, is_external=True)
+        _rel_ref_count_.return_value = 1
+        _iter_unvisited_parts_.reset_mock()
+
+        parts[0].drop_rel(rId)
+
+        assert rId not in parts[0].rels
+        assert _iter_unvisited_parts_.call_count == 0
+        assert part_index.generation == generation
+
+    def it_knows_the_next_available_partname_idx(self, pkg_fixture):
+        package, parts = pkg_fixture
+        part_index = package._part_index
+        assert part_index.next_available_idx('/ppt/part') == 4
+        assert part_index.next_available_idx('/ppt/foo') == 1
+
+        parts[1].partname = PackURI('/ppt/part7.xml')
+
+        assert part_index.next_available_idx('/ppt/part') == 2
+
+    def it_changes_generation_when_invalidated(self, pkg_fixture):
+        package = pkg_fixture[0]
+        part_index = package._part_index
+        generation = part_index.generation
+        part_index.invalidate()
+        assert part_index.generation != generation
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def pkg_fixture(self):
+        """
+        package --> part1 --> part2 --> part3
+                                ^         |
+                                +---------+
+        """
+        package = OpcPackage()
+        parts = tuple(
+            Part(PackURI('/ppt/part%d.xml' % n), None, None, package)
+            for n in (1, 2, 3)
+        )
+        package.relate_to(parts[0], RT.SLIDE)
+        parts[0].relate_to(parts[1], RT.SLIDE)
+        parts[1].relate_to(parts[2], RT.SLIDE)
+        parts[2].relate_to(parts[1], RT.SLIDE)
+        return package, parts
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def _iter_unvisited_parts_(self, request):
+        return method_mock(
+            request, _PartIndex, '_iter_unvisited_parts',
+            wraps=_PartIndex._iter_unvisited_parts
+        )
+
+    @pytest.fixture
+    def _rel_ref_count_(self, request):
+        return method_mock(request, Part, '_rel_ref_count')
+
+
 class DescribeRelationshipCollection(object):
 
     def it_has_a_len(self):
@@ -775,6 +1120,54 @@ class DescribeRelationshipCollection(object):
         assert _rId == rId
         assert len(rels) == 1
 
+    def it_keeps_its_indexes_current_when_a_rel_is_deleted(self, reltype):
+        part, other_part = Mock(name='part'), Mock(name='other_part')
+        rels = RelationshipCollection(None)
+        rels.add_relationship(reltype, part, 'rId1')
+        rels.add_relationship(reltype, other_part, 'rId2')
+        rels.add_relationship('http://rel/other', part, 'rId3')
+
+        del rels['rId1']
+
+        assert rels.get_or_add(reltype, part).rId == 'rId1'
+        assert rels.get_or_add(reltype, other_part).rId == 'rId2'
+        assert rels.get_or_add('http://rel/new', part).rId == 'rId4'
+        assert 'rId1' in rels.related_parts
+        del rels['rId2']
+        assert 'rId2' not in rels.related_parts
+        assert rels.part_with_reltype(reltype) is part
+
+    def it_keeps_its_indexes_current_through_dict_methods(self, reltype):
+        part, other_part = Mock(name='part'), Mock(name='other_part')
+        rels = RelationshipCollection(None)
+        rels.add_relationship(reltype, part, 'rId1')
+        rels.add_relationship(reltype, other_part, 'rId2')
+
+        rel = rels.pop('rId1')
+        assert rels.pop('rId1', None) is None
+        assert rels.part_with_reltype(reltype) is other_part
+        assert 'rId1' not in rels.related_parts
+
+        rels.update({'rId1': rel})
+        assert rels.setdefault('rId1', None) is rel
+        assert rels.get_or_add(reltype, part) is rel
+        assert rels.related_parts['rId1'] is part
+
+        rId, popped_rel = rels.popitem()
+        assert rels.get_or_add(reltype, popped_rel.target_part).rId == rId
+
+        rels.clear()
+        assert rels.related_parts == {}
+        assert rels.get_or_add(reltype, part).rId == 'rId1'
+        assert rels.part_with_reltype(reltype) is part
+
+    def it_raises_on_more_than_one_rel_of_a_reltype(self, reltype):
+        rels = RelationshipCollection(None)
+        rels.add_relationship(reltype, Mock(name='part_1'), 'rId1')
+        rels.add_relationship(reltype, Mock(name='part_2'), 'rId2')
+        with pytest.raises(ValueError):
+            rels.part_with_reltype(reltype)
+
     def it_can_compose_rels_xml(self, rels, rels_elm):
         # exercise ---------------------
         rels.xml
@@ -863,7 +1256,7 @@ class DescribeUnmarshaller(object):
         Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_)
         # verify -----------------------
         _unmarshal_parts.assert_called_once_with(
-            pkg_reader_, pkg_, part_factory_
+            pkg_reader_, pkg_, part_factory_, None
         )
         _unmarshal_relationships.assert_called_once_with(
             pkg_reader_, pkg_, parts_dict_
@@ -892,6 +1285,21 @@ class DescribeUnmarshaller(object):
         )
         assert parts == parts_dict_
 
+    def it_can_unmarshal_parts_on_a_thread_pool(
+            self, pkg_reader_, pkg_, partnames_, content_types_, blobs_):
+        def part_factory(partname, content_type, blob, package):
+            return (content_type, blob, package)
+
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory, workers=4
+        )
+
+        assert parts == dict(
+            (partname, (content_type, blob, pkg_))
+            for partname, content_type, blob
+            in zip(partnames_, content_types_, blobs_)
+        )
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = 'http://reltype'
@@ -13,17 +13,22 @@ except ImportError:
 
 import hashlib
 import pytest
+import zlib
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    CachedPkgMember, CompressedBlob, _DirPkgReader, FilePkgMember,
+    PhysPkgMember, PhysPkgReader,
+    PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import class_mock, loose_mock, Mock
+from ..unitutil.mock import (
+    class_mock, loose_mock, method_mock, Mock, var_mock
+)
 
 
 test_pptx_path = absjoin(test_file_dir, 'test.pptx')
@@ -31,6 +36,107 @@ dir_pkg_path = absjoin(test_file_dir, 'expanded_pptx')
 zip_pkg_path = test_pptx_path
 
 
+class DescribeCompressedBlob(object):
+
+    def it_can_provide_its_compressed_blob(self):
+        blob = b'<foo>' + b'bar' * 100 + b'</foo>'
+        zipinfo, compressed_blob = CompressedBlob(blob).compressed
+        assert zlib.decompress(compressed_blob, -zlib.MAX_WBITS) == blob
+        assert len(compressed_blob) < len(blob)
+        assert zipinfo.compress_type == ZIP_DEFLATED
+        assert zipinfo.CRC == zlib.crc32(blob) & 0xffffffff
+        assert zipinfo.file_size == len(blob)
+
+    def it_can_provide_its_uncompressed_blob(self):
+        assert CompressedBlob(b'foobar').blob == b'foobar'
+
+    def it_can_store_a_blob_without_compressing_it(self):
+        zipinfo, compressed_blob = CompressedBlob(
+            b'foobar', ZIP_STORED
+        ).compressed
+        assert zipinfo.compress_type == ZIP_STORED
+        assert compressed_blob == b'foobar'
+
+
+class DescribePhysPkgMember(object):
+
+    def it_reads_its_blob_from_the_phys_pkg_on_demand(self):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        member = PhysPkgMember(phys_reader, pack_uri)
+        blob = member.blob
+        phys_reader.close()
+        assert member.pack_uri is pack_uri
+        assert blob == ZipFile(zip_pkg_path).read('ppt/presentation.xml')
+
+    def it_can_provide_its_compressed_blob(self):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        zipinfo, compressed_blob = PhysPkgMember(
+            phys_reader, pack_uri
+        ).compressed
+        phys_reader.close()
+        blob = zlib.decompress(compressed_blob, -zlib.MAX_WBITS)
+        assert zipinfo.filename == 'ppt/presentation.xml'
+        assert blob == ZipFile(zip_pkg_path).read('ppt/presentation.xml')
+
+    def it_knows_the_sha1_hash_of_its_blob(self):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        member = PhysPkgMember(_DirPkgReader(dir_pkg_path), pack_uri)
+        assert member.sha1 == '51b78f4dabc0af2419d4e044ab73028c4bef53aa'
+
+    def it_opens_its_blob_in_the_phys_pkg_for_reading(self):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        with PhysPkgMember(phys_reader, pack_uri).open() as stream:
+            blob = stream.read()
+        phys_reader.close()
+        assert blob == ZipFile(zip_pkg_path).read('ppt/presentation.xml')
+
+
+class DescribeFilePkgMember(object):
+
+    def it_reads_its_file_on_demand(self):
+        with open(test_pptx_path, 'rb') as f:
+            blob = f.read()
+        member = FilePkgMember(test_pptx_path)
+        assert member.blob == blob
+        assert member.compressed is None
+        assert member.size == len(blob)
+        assert member.sha1 == hashlib.sha1(blob).hexdigest()
+        with member.open() as f:
+            assert f.read() == blob
+
+    def it_raises_when_its_file_has_changed(self, tmpdir):
+        path = str(tmpdir.join('foo.bin'))
+        with open(path, 'wb') as f:
+            f.write(b'foobar')
+        member = FilePkgMember(path)
+        with open(path, 'wb') as f:
+            f.write(b'foo')
+        with pytest.raises(IOError):
+            member.blob
+
+
+class DescribeCachedPkgMember(object):
+
+    def it_keeps_its_blobs_after_the_phys_pkg_is_closed(self):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        member = CachedPkgMember.from_member(
+            PhysPkgMember(phys_reader, pack_uri)
+        )
+        phys_reader.close()
+        zipinfo, compressed_blob = member.compressed
+        expected_blob = ZipFile(zip_pkg_path).read('ppt/presentation.xml')
+        assert member.pack_uri is pack_uri
+        assert member.blob == expected_blob
+        assert zlib.decompress(
+            compressed_blob, -zlib.MAX_WBITS
+        ) == expected_blob
+        assert member.element is None
+
+
 class DescribeDirPkgReader(object):
 
     def it_is_used_by_PhysPkgReader_when_pkg_is_a_dir(self):
@@ -56,6 +162,10 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == '64ffe86bb2bbaad53c3c1976042b907f8e10c5a3'
 
+    def it_has_no_compressed_blobs(self, dir_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        assert dir_reader.compressed_blob_for(pack_uri) is None
+
     def it_returns_none_when_part_has_no_rels_xml(self, dir_reader):
         partname = PackURI('/ppt/viewProps.xml')
         rels_xml = dir_reader.rels_xml_for(partname)
@@ -123,8 +233,45 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_provides_a_view_of_a_stored_member_when_mapped(
+            self, stored_pkg_path):
+        phys_reader = _ZipPkgReader(stored_pkg_path, mmap=True)
+
+        stored_blob = phys_reader.blob_for(PackURI('/ppt/media/image1.png'))
+        deflated_blob = phys_reader.blob_for(PackURI('/ppt/slide1.xml'))
+        zipinfo, compressed_blob = phys_reader.compressed_blob_for(
+            PackURI('/ppt/media/image1.png')
+        )
+        phys_reader.close()
+
+        assert isinstance(stored_blob, memoryview)
+        assert stored_blob.tobytes() == b'stored-png-bytes' * 8
+        assert deflated_blob == b'<foo/>' * 8
+        assert isinstance(compressed_blob, memoryview)
+        assert compressed_blob.tobytes() == b'stored-png-bytes' * 8
+
+    def it_reads_bytes_when_the_pkg_file_cant_be_mapped(
+            self, stored_pkg_path):
+        with open(stored_pkg_path, 'rb') as f:
+            stream = BytesIO(f.read())
+        phys_reader = _ZipPkgReader(stream, mmap=True)
+        blob = phys_reader.blob_for(PackURI('/ppt/media/image1.png'))
+        phys_reader.close()
+        assert blob == b'stored-png-bytes' * 8
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def stored_pkg_path(self, tmpdir):
+        path = str(tmpdir.join('stored.zip'))
+        zipf = ZipFile(path, 'w')
+        zipf.writestr(
+            'ppt/media/image1.png', b'stored-png-bytes' * 8, ZIP_STORED
+        )
+        zipf.writestr('ppt/slide1.xml', b'<foo/>' * 8, ZIP_DEFLATED)
+        zipf.close()
+        return path
+
     @pytest.fixture(scope='class')
     def phys_reader(self, request):
         phys_reader = _ZipPkgReader(zip_pkg_path)
@@ -174,6 +321,160 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_copy_a_compressed_member(self, pkg_file):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        member = PhysPkgMember(phys_reader, pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<foo/>')
+        pkg_writer.write_member(pack_uri, member)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('part/name.xml') == b'<foo/>'
+        assert zipf.read(pack_uri.membername) == member.blob
+        zipf.close()
+        phys_reader.close()
+
+    def it_recompresses_members_where_it_cant_copy_them(
+            self, pkg_file, request):
+        var_mock(request, 'pptx.opc.phys_pkg._CAN_COPY_COMPRESSED', new=False)
+        pack_uri = PackURI('/ppt/presentation.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        member = PhysPkgMember(phys_reader, pack_uri)
+        blob = b'<BlobbityFooBlob/>' * 10
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_member(pack_uri, member)
+        pkg_writer.write_member(PackURI('/part/a.xml'), CompressedBlob(blob))
+        pkg_writer.write_member(
+            PackURI('/part/b.xml'), FilePkgMember(test_pptx_path)
+        )
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read(pack_uri.membername) == member.blob
+        assert zipf.read('part/a.xml') == blob
+        assert zipf.read('part/b.xml') == FilePkgMember(test_pptx_path).blob
+        zipf.close()
+        phys_reader.close()
+
+    def it_can_write_a_blob_compressed_in_advance(self, pkg_file):
+        pack_uri = PackURI('/part/name.xml')
+        blob = b'<BlobbityFooBlob/>' * 10
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_member(pack_uri, CompressedBlob(blob))
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read(pack_uri.membername) == blob
+        zipf.close()
+
+    def it_can_write_to_a_stream_that_cannot_tell_its_position(self):
+        class Pipe(object):
+            def __init__(self):
+                self.stream = BytesIO()
+
+            def write(self, data):
+                self.stream.write(data)
+
+        pipe = Pipe()
+        blob = b'<BlobbityFooBlob/>' * 10
+
+        pkg_writer = PhysPkgWriter(pipe)
+        pkg_writer.write(PackURI('/part/name.xml'), blob)
+        pkg_writer.write_member(PackURI('/part/name2.xml'), CompressedBlob(blob))
+        pkg_writer.close()
+
+        zipf = ZipFile(BytesIO(pipe.stream.getvalue()), 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('part/name.xml') == blob
+        assert zipf.read('part/name2.xml') == blob
+        zipf.close()
+
+    def it_writes_the_blob_of_an_uncompressed_member(self, pkg_file):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        member = PhysPkgMember(_DirPkgReader(dir_pkg_path), pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_member(pack_uri, member)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.read(pack_uri.membername) == member.blob
+        zipf.close()
+
+    def it_streams_a_file_member_as_the_policy_specifies(self, pkg_file):
+        member = FilePkgMember(test_pptx_path)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_member(PackURI('/ppt/media/a.bin'), member)
+        pkg_writer.write_member(
+            PackURI('/ppt/media/b.bin'), member, ZIP_STORED
+        )
+        pkg_writer.write_member(
+            PackURI('/ppt/media/c.bin'), member, ZIP_DEFLATED, 1
+        )
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert [i.compress_type for i in zipf.infolist()] == [
+            ZIP_DEFLATED, ZIP_STORED, ZIP_DEFLATED
+        ]
+        for name in ('ppt/media/a.bin', 'ppt/media/b.bin', 'ppt/media/c.bin'):
+            assert zipf.read(name) == member.blob
+        zipf.close()
+
+    def it_streams_a_member_through_ZipFile_open(
+            self, request, pkg_file, tmpdir):
+        _write_compressed_ = method_mock(
+            request, _ZipPkgWriter, '_write_compressed'
+        )
+        path = str(tmpdir.join('foo.xml'))
+        with open(path, 'wb') as f:
+            f.write(b'<foo>' + b'bar' * 10000 + b'</foo>')
+        member = FilePkgMember(path)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_member(PackURI('/a.xml'), member, ZIP_DEFLATED, 0)
+        pkg_writer.write_member(PackURI('/b.xml'), member, ZIP_DEFLATED, 9)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        a_info, b_info = zipf.infolist()
+        assert _write_compressed_.call_count == 0
+        assert zipf.testzip() is None
+        assert a_info.compress_size > b_info.compress_size
+        assert zipf.read('b.xml') == member.blob
+        assert pkg_writer._zipf.compression == ZIP_DEFLATED
+        zipf.close()
+
+    def it_streams_a_file_member_to_a_stream_that_cannot_seek(self):
+        class Pipe(object):
+            def __init__(self):
+                self.stream = BytesIO()
+
+            def write(self, data):
+                self.stream.write(data)
+
+        pipe = Pipe()
+        member = FilePkgMember(test_pptx_path)
+
+        pkg_writer = PhysPkgWriter(pipe)
+        pkg_writer.write_member(PackURI('/ppt/media/a.bin'), member)
+        pkg_writer.close()
+
+        zipf = ZipFile(BytesIO(pipe.stream.getvalue()), 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('ppt/media/a.bin') == member.blob
+        zipf.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
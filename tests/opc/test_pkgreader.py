@@ -13,19 +13,25 @@ from pptx.opc.constants import (
 )
 from pptx.opc.oxml import CT_Relationship
 from pptx.opc.packuri import PackURI
-from pptx.opc.phys_pkg import _ZipPkgReader
+from pptx.opc.phys_pkg import (
+    CachedPkgMember, PhysPkgMember, _ZipPkgReader
+)
 from pptx.opc.pkgreader import (
     _ContentTypeMap, PackageReader, _SerializedPart, _SerializedRelationship,
     _SerializedRelationshipCollection
 )
 
 from .unitdata.types import a_Default, a_Types, an_Override
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call, class_mock, function_mock, initializer_mock, method_mock, Mock,
     patch
 )
 
 
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+
+
 class DescribePackageReader(object):
 
     @pytest.fixture
@@ -77,15 +83,39 @@ class DescribePackageReader(object):
         # exercise ---------------------
         pkg_reader = PackageReader.from_file(pkg_file)
         # verify -----------------------
-        PhysPkgReader_.assert_called_once_with(pkg_file)
+        PhysPkgReader_.assert_called_once_with(pkg_file, False)
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
-                                                       content_types)
+                                                       content_types, False)
         phys_reader.close.assert_called_once_with()
         init.assert_called_once_with(content_types, pkg_srels, sparts)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_leaves_the_phys_pkg_open_when_lazy(
+            self, init, PhysPkgReader_, from_xml, _srels_for,
+            _load_serialized_parts):
+        phys_reader = PhysPkgReader_.return_value
+        pkg_file = Mock(name='pkg_file')
+
+        PackageReader.from_file(pkg_file, lazy=True)
+
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, _srels_for.return_value, from_xml.return_value, True
+        )
+        assert phys_reader.close.call_count == 0
+
+    def it_can_construct_a_reusable_reader_from_pkg_file(self):
+        pkg_reader = PackageReader.cached_from_file(test_pptx_path)
+
+        sparts = list(pkg_reader.iter_sparts())
+        assert len(sparts) > 1
+        for partname, content_type, blob in sparts:
+            assert isinstance(blob, CachedPkgMember)
+            assert blob.pack_uri == partname
+        assert sparts[0][2].blob.startswith(b'<?xml')
+        assert list(pkg_reader.iter_sparts()) == sparts
+
     def it_can_iterate_over_the_serialized_parts(self):
         # mockery ----------------------
         partname, content_type, blob = ('part/name.xml', 'app/vnd.type',
@@ -192,6 +222,24 @@ class DescribePackageReader(object):
         ]
         assert generated_tuples == expected_tuples
 
+    def it_can_walk_phys_pkg_parts_lazily(self, _srels_for):
+        partname = PackURI('/part/name1.xml')
+        pkg_srels = [Mock(name='rId1', is_external=False,
+                          target_partname=partname)]
+        phys_reader = Mock(name='phys_reader')
+        _srels_for.return_value = []
+
+        generated_tuples = list(PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=True
+        ))
+
+        assert len(generated_tuples) == 1
+        partname_, member, srels = generated_tuples[0]
+        assert partname_ == partname
+        assert isinstance(member, PhysPkgMember)
+        assert member.pack_uri == partname
+        assert phys_reader.blob_for.call_count == 0
+
     def it_can_retrieve_srels_for_a_source_uri(
             self, _SerializedRelationshipCollection_):
         # mockery ----------------------
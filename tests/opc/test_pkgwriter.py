@@ -5,11 +5,16 @@ Test suite for opc.pkgwriter module
 """
 
 import pytest
+import zlib
+
+from zipfile import ZIP_DEFLATED, ZIP_STORED
 
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
-from pptx.opc.pkgwriter import _ContentTypesItem, PackageWriter
+from pptx.opc.pkgwriter import (
+    _ContentTypesItem, CompressionPolicy, PackageWriter
+)
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
@@ -29,9 +34,9 @@ class DescribePackageWriter(object):
         PackageWriter.write(pkg_file, pkg_rels, parts)
         # verify -----------------------
         expected_calls = [
-            call._write_content_types_stream(phys_writer, parts),
-            call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_content_types_stream(phys_writer, parts, None),
+            call._write_pkg_rels(phys_writer, pkg_rels, None),
+            call._write_parts(phys_writer, parts, None),
         ]
         PhysPkgWriter_.assert_called_once_with(pkg_file)
         assert _write_methods.mock_calls == expected_calls
@@ -66,8 +71,8 @@ class DescribePackageWriter(object):
         phys_writer = Mock(name='phys_writer')
         rels = MagicMock(name='rels')
         rels.__len__.return_value = 1
-        part1 = Mock(name='part1', _rels=rels)
-        part2 = Mock(name='part2', _rels=[])
+        part1 = Mock(name='part1', _rels=rels, unmodified_member=None)
+        part2 = Mock(name='part2', _rels=[], unmodified_member=None)
         # exercise ---------------------
         PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
@@ -78,6 +83,86 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_copies_an_unmodified_part_from_its_member(self):
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(name='part', _rels=[])
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write_member.assert_called_once_with(
+            part.partname, part.unmodified_member
+        )
+        assert phys_writer.write.call_count == 0
+
+    def it_copies_an_unmodified_part_as_its_policy_specifies(self):
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(name='part', _rels=[], content_type=CT.MP4)
+
+        PackageWriter._write_parts(
+            phys_writer, [part], CompressionPolicy.from_spec('fast')
+        )
+
+        phys_writer.write_member.assert_called_once_with(
+            part.partname, part.unmodified_member, ZIP_STORED, None
+        )
+
+    def it_can_write_a_package_using_worker_threads(
+            self, PhysPkgWriter_, _write_methods):
+        pkg_file, pkg_rels, parts = 'pkg_file', 'pkg_rels', 'parts'
+        phys_writer = PhysPkgWriter_.return_value
+
+        PackageWriter.write(pkg_file, pkg_rels, parts, workers=4)
+
+        assert _write_methods.mock_calls == [
+            call._write_content_types_stream(phys_writer, parts, None),
+            call._write_pkg_rels(phys_writer, pkg_rels, None),
+            call._write_parts_in_parallel(phys_writer, parts, 4, None),
+        ]
+
+    def it_writes_parts_compressed_as_its_compression_policy_specifies(self):
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(
+            name='part', _rels=[], blob=b'foobar', content_type=CT.JPEG,
+            unmodified_member=None
+        )
+
+        PackageWriter._write_parts(phys_writer, [part], CompressionPolicy(
+            stored_content_types=(CT.JPEG,)
+        ))
+
+        assert phys_writer.write.call_count == 0
+        pack_uri, member = phys_writer.write_member.call_args[0]
+        zipinfo, compressed_blob = member.compressed
+        assert pack_uri is part.partname
+        assert zipinfo.compress_type == ZIP_STORED
+        assert compressed_blob == b'foobar'
+
+    def it_can_compress_parts_on_worker_threads(self):
+        phys_writer = Mock(name='phys_writer')
+        rels = MagicMock(name='rels')
+        rels.__len__.return_value = 1
+        parts = [
+            Mock(
+                name='part%d' % n, _rels=rels if n == 0 else [],
+                blob=('<part%d/>' % n).encode('utf-8'),
+                unmodified_member=None,
+                content_type=CT.XML,
+            ) for n in range(8)
+        ]
+        parts[5].unmodified_member = member = Mock(name='member')
+
+        PackageWriter._write_parts_in_parallel(phys_writer, parts, 2)
+
+        write_member_calls = phys_writer.write_member.call_args_list
+        assert [c[0][0] for c in write_member_calls] == [
+            part.partname for part in parts
+        ]
+        assert write_member_calls[5][0][1] is member
+        assert write_member_calls[2][0][1].blob == b'<part2/>'
+        phys_writer.write.assert_called_once_with(
+            parts[0].partname.rels_uri, rels.xml
+        )
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -99,14 +184,17 @@ class DescribePackageWriter(object):
         patch1 = patch.object(PackageWriter, '_write_content_types_stream')
         patch2 = patch.object(PackageWriter, '_write_pkg_rels')
         patch3 = patch.object(PackageWriter, '_write_parts')
+        patch4 = patch.object(PackageWriter, '_write_parts_in_parallel')
         root_mock.attach_mock(patch1.start(), '_write_content_types_stream')
         root_mock.attach_mock(patch2.start(), '_write_pkg_rels')
         root_mock.attach_mock(patch3.start(), '_write_parts')
+        root_mock.attach_mock(patch4.start(), '_write_parts_in_parallel')
 
         def fin():
             patch1.stop()
             patch2.stop()
             patch3.stop()
+            patch4.stop()
 
         request.addfinalizer(fin)
         return root_mock
@@ -116,6 +204,53 @@ class DescribePackageWriter(object):
         return method_mock(request, _ContentTypesItem, 'xml_for')
 
 
+class DescribeCompressionPolicy(object):
+
+    def it_can_be_specified_by_profile_name(self, from_spec_fixture):
+        spec, content_type, expected_compress_type = from_spec_fixture
+        policy = CompressionPolicy.from_spec(spec)
+        zipinfo, _ = policy.compress(b'foobar', content_type).compressed
+        assert zipinfo.compress_type == expected_compress_type
+
+    def it_passes_through_a_policy_or_None(self):
+        policy = CompressionPolicy()
+        assert CompressionPolicy.from_spec(policy) is policy
+        assert CompressionPolicy.from_spec(None) is None
+
+    def it_raises_on_an_unknown_profile_name(self):
+        with pytest.raises(ValueError):
+            CompressionPolicy.from_spec('foobar')
+
+    def it_deflates_at_the_level_for_the_content_type(self):
+        blob = b'<foo>' + b'bar baz ' * 1000 + b'</foo>'
+        policy = CompressionPolicy(level=1, levels={CT.XML: 9})
+        _, fast_blob = policy.compress(blob, CT.PNG).compressed
+        _, small_blob = policy.compress(blob, CT.XML).compressed
+        assert fast_blob == zlib.compress(blob, 1)[2:-4]
+        assert small_blob == zlib.compress(blob, 9)[2:-4]
+
+    def it_knows_the_zip_params_for_a_content_type(self):
+        policy = CompressionPolicy(
+            level=1, stored_content_types=(CT.MP4,), levels={CT.XML: 9}
+        )
+        assert policy.zip_params(CT.MP4) == (ZIP_STORED, None)
+        assert policy.zip_params(CT.XML) == (ZIP_DEFLATED, 9)
+        assert policy.zip_params(CT.PNG) == (ZIP_DEFLATED, 1)
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        ('default', CT.JPEG, ZIP_DEFLATED),
+        ('fast',    CT.JPEG, ZIP_STORED),
+        ('fast',    CT.MP4,  ZIP_STORED),
+        ('fast',    CT.XML,  ZIP_DEFLATED),
+        ('small',   CT.PNG,  ZIP_STORED),
+        ('small',   CT.BMP,  ZIP_DEFLATED),
+    ])
+    def from_spec_fixture(self, request):
+        return request.param
+
+
 class Describe_ContentTypesItem(object):
 
     def it_can_compose_content_types_xml(self, xml_for_fixture):
@@ -21,6 +21,27 @@ from ...unitutil.mock import (
 
 class DescribeCT_GroupShape(object):
 
+    def it_can_add_several_autoshape_sp_elements(self):
+        spTree = element('p:spTree/p:extLst')
+        expected_sps = [
+            CT_Shape.new_autoshape_sp(2, 'Oval 1', 'ellipse', 1, 2, 3, 4),
+            CT_Shape.new_textbox_sp(3, 'TextBox 2', 5, 6, 7, 8),
+            CT_Shape.new_textbox_sp(4, 'TextBox 3', 5, 6, 7, 8),
+        ]
+        expected_sps[0].txBody.p_lst[0].append_text('a\n<b>')
+        solidFill = expected_sps[2].spPr.get_or_change_to_solidFill()
+        solidFill.get_or_change_to_srgbClr().val = 'FF0000'
+
+        sps = spTree.add_autoshapes([
+            (2, 'Oval 1', 'ellipse', 1, 2, 3, 4, 'a\n<b>', None),
+            (3, 'TextBox 2', None, 5, 6, 7, 8, None, None),
+            (4, 'TextBox 3', None, 5, 6, 7, 8, '', 'FF0000'),
+        ])
+
+        assert [sp.xml for sp in sps] == [sp.xml for sp in expected_sps]
+        assert spTree[:3] == sps
+        assert spTree[3].tag.endswith('extLst')
+
     def it_can_add_a_graphicFrame_element_containing_a_table(
             self, add_table_fixt):
         spTree, id_, name, rows, cols, x, y, cx, cy = add_table_fixt[:9]
@@ -30,7 +51,7 @@ class DescribeCT_GroupShape(object):
         graphicFrame = spTree.add_table(id_, name, rows, cols, x, y, cx, cy)
 
         new_table_graphicFrame_.assert_called_once_with(
-            id_, name, rows, cols, x, y, cx, cy
+            id_, name, rows, cols, x, y, cx, cy, None
         )
         insert_element_before_.assert_called_once_with(
             graphicFrame_, 'p:extLst'
@@ -40,7 +61,7 @@ class DescribeCT_GroupShape(object):
     def it_can_add_a_grpSp_element(self, add_grpSp_fixture):
         spTree, expected_grpSp_xml, expected_xml = add_grpSp_fixture
 
-        grpSp = spTree.add_grpSp()
+        grpSp = spTree.add_grpSp(1, 'Group 0')
 
         assert grpSp.xml == expected_grpSp_xml
         assert spTree.xml == expected_xml
@@ -86,6 +107,14 @@ class DescribeCT_GroupShape(object):
         insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
         assert sp is sp_
 
+    def it_knows_its_last_shape_element(self, last_shape_fixture):
+        spTree, expected_idx = last_shape_fixture
+        last_shape_elm = spTree.last_shape_elm
+        if expected_idx is None:
+            assert last_shape_elm is None
+        else:
+            assert last_shape_elm is spTree[expected_idx]
+
     def it_can_recalculate_its_pos_and_size(self, recalc_fixture):
         xSp, expected_xml, parent_sp, calls = recalc_fixture
 
@@ -111,6 +140,15 @@ class DescribeCT_GroupShape(object):
             insert_element_before_, sp_
         )
 
+    @pytest.fixture(params=[
+        ('p:spTree/(p:nvGrpSpPr,p:grpSpPr)', None),
+        ('p:spTree/(p:nvGrpSpPr,p:grpSpPr,p:sp,p:pic)', 3),
+        ('p:spTree/(p:nvGrpSpPr,p:grpSpPr,p:grpSp,p:extLst)', 2),
+    ])
+    def last_shape_fixture(self, request):
+        spTree_cxml, expected_idx = request.param
+        return element(spTree_cxml), expected_idx
+
     @pytest.fixture
     def add_grpSp_fixture(self):
         spTree = element('p:spTree{a:b=c,r:s=t}')
@@ -7,13 +7,15 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 from __future__ import print_function, unicode_literals
 
 import pytest
+import threading
 
 from lxml import etree
 
 from pptx.oxml import (
-    oxml_parser, parse_xml, register_element_cls
+    _current_parser, oxml_parser, parse_xml, parse_xml_template,
+    register_element_cls
 )
-from pptx.oxml.ns import qn
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.mock import function_mock, loose_mock, var_mock
@@ -34,6 +36,21 @@ class DescribeParseXml(object):
         fromstring.assert_called_once_with(mock_xml_bytes, mock_oxml_parser)
         assert element is fromstring.return_value
 
+    def it_uses_a_parser_of_its_own_on_another_thread(self, xml_bytes):
+        results = []
+
+        def parse():
+            results.append((_current_parser(), parse_xml(xml_bytes)))
+
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+
+        parser, element = results[0]
+        assert parser is not oxml_parser
+        assert element.tag == qn('a:foo')
+        assert _current_parser() is oxml_parser
+
     def it_prefers_to_parse_bytes(self, xml_bytes):
         parse_xml(xml_bytes)
 
@@ -52,6 +69,48 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeParseXmlTemplate(object):
+
+    def it_produces_the_element_parse_xml_would(self, tmpl_fixture):
+        tmpl, args = tmpl_fixture
+        element = parse_xml_template(tmpl, *args)
+        assert etree.tostring(element) == etree.tostring(
+            parse_xml(tmpl % args)
+        )
+
+    def it_produces_a_new_element_on_each_call(self):
+        tmpl = '<a:foo %s val="%%d"/>' % nsdecls('a')
+        foo = parse_xml_template(tmpl, 1)
+        foo_2 = parse_xml_template(tmpl, 2)
+        assert foo is not foo_2
+        assert (foo.get('val'), foo_2.get('val')) == ('1', '2')
+
+    def it_does_not_interpret_argument_values_as_xml(self):
+        tmpl = '<a:foo %s name="%%s">%%s</a:foo>' % nsdecls('a')
+        foo = parse_xml_template(tmpl, 'a & "b"', '<bar/>')
+        assert foo.get('name') == 'a & "b"'
+        assert foo.text == '<bar/>'
+        assert len(foo) == 0
+
+    def it_raises_on_wrong_number_of_arguments(self):
+        tmpl = '<a:foo %s val="%%d"/>' % nsdecls('a')
+        with pytest.raises(TypeError):
+            parse_xml_template(tmpl, 1, 2)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('<a:foo %s/>', ()),
+        ('<a:foo %s a="%%d" b="%%s"/>', (42, 'bar')),
+        ('<a:foo %s a="x%%dy%%%%"><a:b/><a:c v="%%s"/></a:foo>', (7, 'z')),
+        ('<a:foo %s><a:bar>%%s</a:bar></a:foo>', ('baz',)),
+        ('<a:foo %s><a:bar/>%%s</a:foo>', ('tail',)),
+    ])
+    def tmpl_fixture(self, request):
+        tmpl, args = request.param
+        return tmpl % nsdecls('a'), args
+
+
 class DescribeRegisterCustomElementClass(object):
 
     def it_determines_cust_elm_class_constructed_for_specified_tag(
@@ -61,6 +61,9 @@ class DescribeQn(object):
             self, nsptag_str, clark_name):
         assert qn(nsptag_str) == clark_name
 
+    def it_returns_the_same_clark_name_on_repeated_calls(self, nsptag_str):
+        assert qn(nsptag_str) is qn(nsptag_str)
+
 
 # ===========================================================================
 # fixtures
@@ -9,9 +9,9 @@ from __future__ import (
 import pytest
 
 from pptx.oxml.ns import nsdecls
-from pptx.oxml.table import CT_Table, TcRange
+from pptx.oxml.table import CT_Table, TcGrid, TcRange
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 
 
 class DescribeCT_Table(object):
@@ -45,6 +45,20 @@ class DescribeCT_Table(object):
         tbl = CT_Table.new_tbl(2, 3, 334, 445)
         assert tbl.xml == expected_xml
 
+    def it_can_create_a_new_tbl_populated_with_text(self):
+        tbl = CT_Table.new_tbl(
+            2, 2, 200, 100, texts=[['a & b', None], ['', 'c\nd']]
+        )
+        assert tbl.xml == xml(
+            'a:tbl/(a:tblPr{firstRow=1,bandRow=1}/a:tableStyleId"{5C22544A-7'
+            'EE6-4342-B048-85BDC9FD1C3A}",a:tblGrid/(a:gridCol{w=100},a:gridC'
+            'ol{w=100}),a:tr{h=50}/(a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p/a'
+            ':r/a:t"a &amp; b"),a:tcPr),a:tc/(a:txBody/(a:bodyPr,a:lstStyle,'
+            'a:p),a:tcPr)),a:tr{h=50}/(a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:'
+            'p),a:tcPr),a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p/(a:r/a:t"c",a'
+            ':br,a:r/a:t"d")),a:tcPr)))'
+        )
+
     def it_provides_access_to_its_tc_elements(self):
         tbl_cxml = 'a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))'
         tbl = element(tbl_cxml)
@@ -56,8 +70,34 @@ class DescribeCT_Table(object):
         assert tbl.tc(1, 1) is tcs[3]
 
 
+class DescribeTcGrid(object):
+
+    def it_indexes_the_cells_of_a_table(self):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        tcs = tbl.xpath('.//a:tc')
+
+        tc_grid = TcGrid(tbl)
+
+        assert tc_grid.tbl is tbl
+        assert list(tc_grid.iter_tcs()) == tcs
+        assert tc_grid.tc(1, 0) is tcs[2]
+        assert tc_grid.position(tcs[3]) == (1, 1)
+        assert tcs[1] in tc_grid
+        assert element('a:tc') not in tc_grid
+
+
 class DescribeTcRange(object):
 
+    def it_can_construct_from_a_merge_origin_tc(self):
+        tbl = element(
+            'a:tbl/(a:tr/(a:tc{gridSpan=2},a:tc{hMerge=1}),a:tr/(a:tc,a:tc))'
+        )
+        tc_grid = TcGrid(tbl)
+
+        tc_range = TcRange.from_merge_origin(tbl.tc(0, 0), tc_grid)
+
+        assert list(tc_range.iter_tcs()) == [tbl.tc(0, 0), tbl.tc(0, 1)]
+
     def it_knows_when_the_range_contains_a_merged_cell(
             self, contains_merge_fixture):
         tc, other_tc, expected_value = contains_merge_fixture
@@ -27,6 +27,18 @@ class DescribeCustomElementClass(object):
     def it_has_the_MetaOxmlElement_metaclass(self):
         assert type(CT_Parent).__name__ == 'MetaOxmlElement'
 
+    def it_inserts_before_the_first_successor_present(self):
+        parent = (
+            a_parent().with_nsdecls().with_child(
+                an_oooChild()).with_child(
+                a_zomChild())
+        ).element
+        oomChild = an_oomChild().with_nsdecls().element
+
+        parent.insert_element_before(oomChild, 'p:zomChild', 'p:oooChild')
+
+        assert parent[0] is oomChild
+
 
 class DescribeChoice(object):
 
@@ -6,16 +6,21 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import hashlib
+
 import pytest
 
 from pptx.compat import BytesIO
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.phys_pkg import FilePkgMember
 from pptx.package import Package
 from pptx.parts.image import Image, ImagePart
 from pptx.util import Emu
 
 from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
-    class_mock, initializer_mock, instance_mock, method_mock, property_mock
+    class_mock, function_mock, initializer_mock, instance_mock, method_mock,
+    property_mock
 )
 
 
@@ -35,11 +40,46 @@ class DescribeImagePart(object):
 
         package_.next_image_partname.assert_called_once_with(image_.ext)
         _init_.assert_called_once_with(
-            partname_, image_.content_type, image_.blob, package_,
+            partname_, image_.content_type, image_.blob_source, package_,
             image_.filename
         )
         assert isinstance(image_part, ImagePart)
 
+    def it_hashes_its_member_when_file_backed(self):
+        member = FilePkgMember(new_image_path)
+        image_part = ImagePart(None, None, member, None)
+        assert image_part.sha1 == member.sha1
+        assert image_part._px_size == (150, 214)
+        assert image_part.unmodified_member is member
+
+    def it_rehashes_its_image_when_its_blob_is_replaced(self):
+        package = Package()
+        with open(test_image_path, 'rb') as f:
+            old_blob = f.read()
+        with open(new_image_path, 'rb') as f:
+            new_blob = f.read()
+        image_part = package.get_or_add_image_part(test_image_path)
+        package.relate_to(image_part, RT.IMAGE)
+        assert image_part._px_size == (204, 204)
+
+        image_part.blob = new_blob
+
+        assert image_part.sha1 == hashlib.sha1(new_blob).hexdigest()
+        assert image_part._px_size == (150, 214)
+        assert package.get_or_add_image_part(new_image_path) is image_part
+        assert package.get_or_add_image_part(BytesIO(old_blob)) is not (
+            image_part
+        )
+
+    def but_it_can_replace_its_blob_when_not_in_a_package(self):
+        with open(new_image_path, 'rb') as f:
+            new_blob = f.read()
+        image_part = ImagePart(None, None, b'blob', None)
+
+        image_part.blob = new_blob
+
+        assert image_part.sha1 == hashlib.sha1(new_blob).hexdigest()
+
     def it_provides_access_to_its_image(self, image_fixture):
         image_part, Image_, blob, desc, image_ = image_fixture
         image = image_part.image
@@ -54,6 +94,18 @@ class DescribeImagePart(object):
         image, expected_size = size_fixture
         assert image._px_size == expected_size
 
+    def it_reads_its_image_props_only_once(self, request, image_):
+        from_blob_ = method_mock(
+            request, Image, 'from_blob', return_value=image_
+        )
+        image_.size, image_.dpi = (42, 24), (72, 72)
+        image_part = ImagePart(None, None, b'blob', None)
+
+        image_part.scale(None, None)
+        image_part.scale(1000, None)
+
+        from_blob_.assert_called_once_with(b'blob')
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -116,6 +168,15 @@ class DescribeImage(object):
         Image.from_blob.assert_called_once_with(blob, filename)
         assert image is image_
 
+    def it_can_defer_reading_a_path_until_needed(self, from_path_fixture):
+        image_file, blob, filename, image_ = from_path_fixture
+        image = Image.from_file(image_file, lazy=True)
+        member, filename_ = Image.from_blob.call_args[0]
+        assert isinstance(member, FilePkgMember)
+        assert member.blob == blob
+        assert filename_ == filename
+        assert image is image_
+
     def it_can_construct_from_a_stream(self, from_stream_fixture):
         image_file, blob, image_ = from_stream_fixture
         image = Image.from_file(image_file)
@@ -152,6 +213,41 @@ class DescribeImage(object):
         image = Image(b'foobar', None)
         assert image.sha1 == '8843d7f92416211de9ebb963ff4ce28125932878'
 
+    def it_reads_an_image_file_only_as_needed(self):
+        with open(new_image_path, 'rb') as f:
+            blob = f.read()
+        member = FilePkgMember(new_image_path)
+
+        image = Image.from_file(new_image_path, lazy=True)
+
+        assert image.blob_source.blob == blob
+        assert image.sha1 == hashlib.sha1(blob).hexdigest()
+        assert image.size == (150, 214)
+        assert Image(member, None).ext == 'png'
+        assert image.blob == blob
+
+    def it_reads_its_props_from_the_image_header(self, request):
+        image_header_props_ = function_mock(
+            request, 'pptx.parts.image.image_header_props',
+            return_value=('PNG', (42, 24), (150.0, 300.0))
+        )
+        image = Image(b'blob', None)
+
+        assert image.ext == 'png'
+        assert image.size == (42, 24)
+        assert image.dpi == (150, 300)
+        image_header_props_.assert_called_once_with(b'blob')
+
+    def it_falls_back_to_PIL_for_other_formats(self, request, _pil_props_):
+        function_mock(
+            request, 'pptx.parts.image.image_header_props', return_value=None
+        )
+        _pil_props_.return_value = ('WMF', (42, 24), None)
+        image = Image(b'blob', None)
+
+        assert image.ext == 'wmf'
+        assert image.size == (42, 24)
+
     def it_knows_its_PIL_properties_to_help(self, pil_fixture):
         image, size, format, dpi = pil_fixture
         assert image.size == size
@@ -184,10 +280,10 @@ class DescribeImage(object):
         ((3047, 2388), (72, 72)),
         ('foobar',     (72, 72)),
     ])
-    def dpi_fixture(self, request, _pil_props_):
+    def dpi_fixture(self, request, _props_):
         raw_dpi, expected_dpi = request.param
         image = Image(None, None)
-        _pil_props_.return_value = (None, None, raw_dpi)
+        _props_.return_value = (None, None, raw_dpi)
         return image, expected_dpi
 
     @pytest.fixture(params=[
@@ -259,3 +355,7 @@ class DescribeImage(object):
     @pytest.fixture
     def _pil_props_(self, request):
         return property_mock(request, Image, '_pil_props')
+
+    @pytest.fixture
+    def _props_(self, request):
+        return property_mock(request, Image, '_props')
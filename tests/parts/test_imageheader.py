@@ -0,0 +1,100 @@
+# encoding: utf-8
+
+"""Unit test suite for pptx.parts.imageheader module."""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from struct import unpack_from
+
+from PIL import Image as PIL_Image
+
+from pptx.compat import BytesIO
+from pptx.parts.imageheader import image_header_props
+
+from ..unitutil.file import absjoin, test_file_dir
+
+
+class DescribeImageHeaderProps(object):
+
+    def it_reads_the_props_of_an_image_file(self, file_fixture):
+        blob, expected_props = file_fixture
+        assert image_header_props(blob) == expected_props
+
+    def it_reads_the_props_from_the_header_of_each_format(
+            self, format_fixture):
+        blob, format, dpi = format_fixture
+        props = image_header_props(blob)
+        assert props[:2] == (format, (123, 45))
+        if dpi is None:
+            assert props[2] is None
+        else:
+            assert tuple(round(value) for value in props[2]) == dpi
+
+    def it_reads_the_dpi_of_a_jpeg_from_its_exif_segment(self):
+        pil_image = PIL_Image.new('RGB', (10, 20))
+        exif = pil_image.getexif()
+        exif[296], exif[282] = 3, 40.0  # ---ResolutionUnit, XResolution---
+        blob = self.save(pil_image, 'JPEG', exif=exif.tobytes())
+        # ---remove the JFIF segment so the resolution comes from EXIF---
+        jfif_offset = blob.index(b'\xff\xe0')
+        jfif_len = unpack_from('>H', blob, jfif_offset + 2)[0]
+        blob = blob[:jfif_offset] + blob[jfif_offset + 2 + jfif_len:]
+
+        format, size, dpi = image_header_props(blob)
+
+        assert (format, size) == ('JPEG', (10, 20))
+        assert tuple(round(value) for value in dpi) == (102, 102)
+
+    def it_returns_None_when_it_cant_read_the_header(self, none_fixture):
+        blob = none_fixture
+        assert image_header_props(blob) is None
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('monty-truth.png', ('PNG', (150, 214), None)),
+        ('python-icon.jpeg', ('JPEG', (204, 204), None)),
+        ('python.bmp', ('BMP', (211, 71), (0.0, 0.0))),
+    ])
+    def file_fixture(self, request):
+        filename, expected_props = request.param
+        with open(absjoin(test_file_dir, filename), 'rb') as f:
+            blob = f.read()
+        return blob, expected_props
+
+    @pytest.fixture(params=[
+        ('PNG', {}, None),
+        ('PNG', {'dpi': (150, 300)}, (150, 300)),
+        ('JPEG', {}, None),
+        ('JPEG', {'dpi': (200, 100)}, (200, 100)),
+        ('GIF', {}, None),
+        ('BMP', {'dpi': (300, 96)}, (300, 96)),
+        ('TIFF', {}, None),
+        ('TIFF', {'dpi': (96, 120)}, (96, 120)),
+    ])
+    def format_fixture(self, request):
+        format, save_kwargs, dpi = request.param
+        pil_image = PIL_Image.new('RGB', (123, 45))
+        return self.save(pil_image, format, **save_kwargs), format, dpi
+
+    @pytest.fixture(params=[
+        b'foobar',
+        b'\x89PNG\r\n\x1a\n',
+        b'\xff\xd8\xff\xe0\x00\x10JFIF',
+        b'BM\x00\x00',
+        b'II*\x00\x08\x00\x00\x00',
+    ])
+    def none_fixture(self, request):
+        return request.param
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def save(pil_image, format, **kwargs):
+        stream = BytesIO()
+        pil_image.save(stream, format, **kwargs)
+        return stream.getvalue()
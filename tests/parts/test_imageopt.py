@@ -0,0 +1,228 @@
+# encoding: utf-8
+
+"""Unit test suite for pptx.parts.imageopt module."""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from PIL import Image as PIL_Image
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.oxml.ns import qn
+from pptx.parts.image import Image, ImagePart
+from pptx.parts.imageopt import (
+    _full_extents, ImageOptimizer, downsample_image
+)
+from pptx.util import Inches
+
+from ..unitutil.cxml import element
+from ..unitutil.file import absjoin, test_file_dir
+from ..unitutil.mock import function_mock, var_mock
+
+
+jpeg_path = absjoin(test_file_dir, 'python-icon.jpeg')
+png_path = absjoin(test_file_dir, 'monty-truth.png')
+
+
+class DescribeImageOptimizer(object):
+
+    def it_can_be_specified_by_dpi(self, from_spec_fixture):
+        spec, expected_dpi = from_spec_fixture
+        optimizer = ImageOptimizer.from_spec(spec)
+        assert optimizer._dpi == expected_dpi
+
+    def it_passes_through_an_optimizer_or_None(self):
+        optimizer = ImageOptimizer()
+        assert ImageOptimizer.from_spec(optimizer) is optimizer
+        assert ImageOptimizer.from_spec(None) is None
+
+    def it_raises_on_an_invalid_spec(self):
+        with pytest.raises(ValueError):
+            ImageOptimizer.from_spec('foobar')
+
+    def it_computes_the_size_to_resample_an_image_to(self, size_fixture):
+        dpi, px_size, extents, expected_value = size_fixture
+        optimizer = ImageOptimizer(dpi)
+        assert optimizer._target_size(px_size, extents) == expected_value
+
+    def it_downsamples_an_image_for_its_display_size(self):
+        image = Image.from_file(jpeg_path)
+        optimizer = ImageOptimizer(dpi=50)
+
+        optimized = optimizer.optimize_image(image, Inches(1), Inches(1))
+
+        assert optimized.size == (50, 50)
+        assert optimized.dpi == (50, 50)
+        assert optimized.content_type == CT.JPEG
+        assert optimized.filename == 'python-icon.jpeg'
+        assert len(optimized.blob) < len(image.blob)
+
+    def it_optimizes_an_image_once_for_each_size(self, request):
+        downsample_image_ = function_mock(
+            request, 'pptx.parts.imageopt.downsample_image',
+            return_value=b'foobar'
+        )
+        image = Image.from_file(jpeg_path)
+        optimizer = ImageOptimizer(dpi=50)
+
+        blobs = [
+            optimizer.optimize_image(image, Inches(1), Inches(1)).blob
+            for _ in range(3)
+        ]
+
+        assert blobs == [b'foobar'] * 3
+        downsample_image_.assert_called_once_with(
+            image.blob, (50, 50), CT.JPEG, 50, 85
+        )
+
+    def it_keeps_only_the_most_recently_optimized_images(self, request):
+        var_mock(request, 'pptx.parts.imageopt._CACHED_BLOBS', new=2)
+        function_mock(
+            request, 'pptx.parts.imageopt.downsample_image',
+            return_value=b'foobar'
+        )
+        image = Image.from_file(jpeg_path)
+        optimizer = ImageOptimizer(dpi=50)
+
+        for inches in (1, 2, 1, 3):
+            optimizer.optimize_image(image, Inches(inches), Inches(inches))
+
+        assert list(optimizer._blobs) == [
+            (image.sha1, (50, 50)), (image.sha1, (150, 150))
+        ]
+
+    def but_it_leaves_an_image_that_needs_no_optimizing(
+            self, unoptimized_fixture):
+        image, cx, cy = unoptimized_fixture
+        optimizer = ImageOptimizer(dpi=50)
+        assert optimizer.optimize_image(image, cx, cy) is image
+
+    def it_can_optimize_the_images_in_a_package(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        jpeg_pic = slide.shapes.add_picture(jpeg_path, 0, 0, Inches(1))
+        png_pic = slide.shapes.add_picture(png_path, 0, 0, Inches(0.5))
+        slide_2 = prs.slides.add_slide(prs.slide_layouts[6])
+        jpeg_pic_2 = slide_2.shapes.add_picture(jpeg_path, 0, 0, Inches(2))
+        package = prs.part.package
+
+        ImageOptimizer(dpi=50).optimize_package(package, workers=2)
+
+        assert jpeg_pic.image.size == (100, 100)
+        assert jpeg_pic_2.image.sha1 == jpeg_pic.image.sha1
+        assert png_pic.image.size == (25, 36)
+        assert png_pic.width == Inches(0.5)
+        image_parts = [
+            p for p in package.iter_parts()
+            if isinstance(p, ImagePart) and p.partname.startswith('/ppt/')
+        ]
+        assert sorted(p.image.size for p in image_parts) == [
+            (25, 36), (100, 100)
+        ]
+
+    def it_can_restore_the_images_it_replaced(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        pic = slide.shapes.add_picture(jpeg_path, 0, 0, Inches(1))
+        sha1, package = pic.image.sha1, prs.part.package
+        parts = set(package.iter_parts())
+        optimizer = ImageOptimizer(dpi=50)
+
+        replaced = optimizer.optimize_package(package)
+        optimized_sha1 = pic.image.sha1
+        optimizer.restore_package(package, replaced)
+
+        assert optimized_sha1 != sha1
+        assert pic.image.sha1 == sha1
+        assert set(package.iter_parts()) == parts
+
+    def it_optimizes_only_the_saved_file_of_a_presentation(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        pic = slide.shapes.add_picture(jpeg_path, 0, 0, Inches(1))
+        sha1, stream = pic.image.sha1, BytesIO()
+
+        prs.save(stream, optimize_images=50)
+
+        assert pic.image.sha1 == sha1
+        saved_pic = Presentation(stream).slides[0].shapes[0]
+        assert saved_pic.image.size == (50, 50)
+
+    def but_it_leaves_an_image_used_other_than_by_pictures(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        pic = slide.shapes.add_picture(jpeg_path, 0, 0, Inches(1))
+        # ---refer to the image a second time, other than by a picture---
+        pic._element.nvPicPr.cNvPr.set(qn('r:id'), pic._element.blip_rId)
+        sha1 = pic.image.sha1
+
+        ImageOptimizer(dpi=50).optimize_package(prs.part.package)
+
+        assert pic.image.sha1 == sha1
+
+    def it_knows_the_extents_of_the_whole_image_of_a_picture(
+            self, extents_fixture):
+        pic, expected_value = extents_fixture
+        assert _full_extents(pic) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('p:pic/(p:blipFill,p:spPr/a:xfrm/a:ext{cx=100,cy=200})',
+         (100, 200)),
+        ('p:pic/(p:blipFill/a:srcRect{l=25000,r=25000,b=50000},p:spPr/a:xf'
+         'rm/a:ext{cx=100,cy=200})', (200, 400)),
+        ('p:grpSp/(p:grpSpPr/a:xfrm/(a:ext{cx=300,cy=100},a:chExt{cx=100,c'
+         'y=100}),p:pic/(p:blipFill,p:spPr/a:xfrm/a:ext{cx=100,cy=200}))',
+         (300, 200)),
+        ('p:pic/(p:blipFill,p:spPr)', None),
+    ])
+    def extents_fixture(self, request):
+        pic_cxml, expected_value = request.param
+        root = element(pic_cxml)
+        pic = root if root.tag.endswith('}pic') else root[1]
+        return pic, expected_value
+
+    @pytest.fixture(params=[
+        (150, 150),
+        (96.0, 96.0),
+    ])
+    def from_spec_fixture(self, request):
+        return request.param
+
+    @pytest.fixture(params=[
+        (100, (1000, 500), [(Inches(2), Inches(1))], (200, 100)),
+        (100, (1000, 500), [(Inches(2), Inches(1)), (Inches(3), 0)],
+         (300, 150)),
+        (100, (1000, 500), [(Inches(1), Inches(2))], (400, 200)),
+        (100, (1000, 500), [(Inches(9.5), Inches(1))], None),
+    ])
+    def size_fixture(self, request):
+        return request.param
+
+    @pytest.fixture(params=['small', 'gif'])
+    def unoptimized_fixture(self, request):
+        if request.param == 'small':
+            return Image.from_file(jpeg_path), Inches(5), Inches(5)
+        stream = BytesIO()
+        PIL_Image.new('RGB', (400, 400)).save(stream, 'GIF')
+        return Image.from_blob(stream.getvalue()), Inches(1), Inches(1)
+
+
+class DescribeDownsampleImage(object):
+
+    def it_resamples_an_image_in_its_own_format(self):
+        with open(png_path, 'rb') as f:
+            blob = f.read()
+
+        resampled = downsample_image(blob, (30, 43), CT.PNG, 96)
+
+        pil_image = PIL_Image.open(BytesIO(resampled))
+        assert pil_image.format == 'PNG'
+        assert pil_image.size == (30, 43)
+        assert tuple(round(d) for d in pil_image.info['dpi']) == (96, 96)
@@ -6,12 +6,17 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import hashlib
+
 import pytest
 
 from pptx.media import Video
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.phys_pkg import FilePkgMember
 from pptx.package import Package
 from pptx.parts.media import MediaPart
 
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import initializer_mock, instance_mock
 
 
@@ -24,7 +29,8 @@ class DescribeMediaPart(object):
 
         package_.next_media_partname.assert_called_once_with(media_.ext)
         _init_.assert_called_once_with(
-            media_part, partname_, media_.content_type, media_.blob, package_
+            media_part, partname_, media_.content_type, media_.blob_source,
+            package_
         )
         assert isinstance(media_part, MediaPart)
 
@@ -33,12 +39,38 @@ class DescribeMediaPart(object):
         sha1 = media_part.sha1
         assert sha1 == expected_value
 
+    def it_hashes_its_member_when_file_backed(self):
+        member = FilePkgMember(absjoin(test_file_dir, 'dummy.mp4'))
+        media_part = MediaPart(None, None, member, None)
+        assert media_part.sha1 == member.sha1
+        assert media_part.unmodified_member is member
+
+    def it_rehashes_its_media_when_its_blob_is_replaced(self):
+        package = Package()
+        video = Video.from_blob(b'old', 'video/mp4')
+        media_part = package.get_or_add_media_part(video)
+        package.relate_to(media_part, RT.MEDIA)
+        assert media_part.sha1 == hashlib.sha1(b'old').hexdigest()
+
+        media_part.blob = b'new'
+
+        assert media_part.sha1 == hashlib.sha1(b'new').hexdigest()
+        new_video = Video.from_blob(b'new', 'video/mp4')
+        assert package.get_or_add_media_part(new_video) is media_part
+
+    def but_it_can_replace_its_blob_when_not_in_a_package(self):
+        media_part = MediaPart(None, None, b'old', None)
+
+        media_part.blob = b'new'
+
+        assert media_part.sha1 == hashlib.sha1(b'new').hexdigest()
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def new_fixture(self, request, package_, media_, _init_):
         partname_ = package_.next_media_partname.return_value = 'media42.mp4'
-        media_.blob, media_.content_type = b'blob-bytes', 'video/mp4'
+        media_.blob_source, media_.content_type = b'blob-bytes', 'video/mp4'
         return package_, media_, _init_, partname_
 
     @pytest.fixture
@@ -92,7 +92,7 @@ class DescribePresentationPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         prs_part, file_, package_ = save_fixture
         prs_part.save(file_)
-        package_.save.assert_called_once_with(file_)
+        package_.save.assert_called_once_with(file_, None, None)
 
     def it_can_add_a_new_slide(self, add_slide_fixture):
         prs_part, slide_layout_, SlidePart_, partname = add_slide_fixture[:4]
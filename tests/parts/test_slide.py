@@ -25,7 +25,7 @@ from pptx.parts.media import MediaPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import (
     BaseSlidePart, NotesMasterPart, NotesSlidePart, SlideLayoutPart,
-    SlideMasterPart, SlidePart
+    SlideMasterPart, SlidePart, _ShapeIdAllocator, _ShapeNames
 )
 from pptx.slide import (
     NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
@@ -61,8 +61,39 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId is rId_
 
+    def it_provides_the_next_shape_id(self, next_id_fixture):
+        slide, expected_value = next_id_fixture
+        assert slide.next_shape_id() == expected_value
+
+    def it_provides_a_new_shape_id_each_time(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:cNvPr{id=1}')
+        slide = BaseSlidePart(None, None, sld, None)
+        assert [slide.next_shape_id() for _ in range(3)] == [2, 3, 4]
+
+    def it_can_reserve_several_shape_ids_at_once(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:cNvPr{id=1}')
+        slide = BaseSlidePart(None, None, sld, None)
+        assert slide.next_shape_ids(3) == [2, 3, 4]
+        assert slide.next_shape_ids(0) == []
+        assert slide.next_shape_id() == 5
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ('p:sld/p:cSld/p:spTree/p:nvSpPr',                                 1),
+        ('p:sld/p:cSld/p:spTree/p:nvSpPr/p:cNvPr{id=0}',                   1),
+        ('p:sld/p:cSld/p:spTree/p:nvSpPr/p:cNvPr{id=1}',                   2),
+        ('p:sld/p:cSld/p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   4),
+        ('p:sld/p:cSld/p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})', 3),
+        ('p:sld/p:cSld/p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})', 3),
+        ('p:sld/(p:cSld/p:spTree/p:nvSpPr/p:cNvPr{id=1},p:timing/p:tnLst/'
+         'p:par/p:cTn{id=9})',                                             10),
+    ])
+    def next_id_fixture(self, request):
+        sld_cxml, expected_value = request.param
+        slide = BaseSlidePart(None, None, element(sld_cxml), None)
+        return slide, expected_value
+
     @pytest.fixture
     def get_image_fixture(self, related_parts_prop_, image_part_, image_):
         slide = BaseSlidePart(None, None, None, None)
@@ -114,6 +145,103 @@ class DescribeBaseSlidePart(object):
         return property_mock(request, BaseSlidePart, 'related_parts')
 
 
+class Describe_ShapeIdAllocator(object):
+
+    def it_accounts_for_a_shape_appended_by_other_means(
+            self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id() == 3
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{id=7}'))
+        assert allocator.next_id() == 8
+
+    def it_rescans_when_the_shape_tree_changes_otherwise(
+            self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id() == 3
+        spTree.remove(spTree[-1])
+        spTree.remove(spTree[-1])
+        assert allocator.next_id() == 1
+
+    def it_rescans_when_a_shape_is_inserted_before_the_last(
+            self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id() == 3
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{id=4}'))
+        assert allocator.next_id() == 5
+        spTree.insert(1, element('p:sp/p:nvSpPr/p:cNvPr{id=9}'))
+        assert allocator.next_id() == 10
+
+    def it_rescans_when_the_last_shape_is_replaced(self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id() == 3
+        spTree.replace(spTree[-1], element('p:sp/p:nvSpPr/p:cNvPr{id=6}'))
+        assert allocator.next_id() == 7
+
+    def it_rescans_when_an_id_it_would_issue_is_in_use(
+            self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id() == 3
+        spTree.append(element('p:grpSp/p:nvGrpSpPr/p:cNvPr{id=4}'))
+        assert allocator.next_id() == 5
+        spTree[-1].append(element('p:sp/p:nvSpPr/p:cNvPr{id=6}'))
+        assert allocator.next_ids(2) == [7, 8]
+        spTree[1][0][0].set('id', '9')
+        assert allocator.next_id() == 10
+
+    def it_rescans_when_the_part_element_is_replaced(self, allocator_fixture):
+        allocator, spTree = allocator_fixture
+        assert allocator.next_id() == 3
+        allocator._part._element = element(
+            'p:sld/p:cSld/p:spTree/p:nvGrpSpPr/p:cNvPr{id=41}'
+        )
+        assert allocator.next_id() == 42
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def allocator_fixture(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/'
+            'p:cNvPr{id=2})'
+        )
+        slide = BaseSlidePart(None, None, sld, None)
+        return _ShapeIdAllocator(slide), sld.cSld.spTree
+
+
+class Describe_ShapeNames(object):
+
+    def it_keeps_track_of_the_shape_names_used(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr{name=Title 1}'
+        )
+        spTree = sld.cSld.spTree
+        shape_names = _ShapeNames(BaseSlidePart(None, None, sld, None))
+        assert 'Title 1' in shape_names
+
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{name=Foo 2}'))
+        assert 'Foo 2' in shape_names
+
+        spTree.remove(spTree[0])
+        assert 'Title 1' not in shape_names
+
+    def it_notes_names_it_is_told_about(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:grpSp/p:nvGrpSpPr/p:cNvPr{name=Group 1}'
+        )
+        grpSp = sld.cSld.spTree[0]
+        shape_names = _ShapeNames(BaseSlidePart(None, None, sld, None))
+        assert 'Group 1' in shape_names
+
+        sp = element('p:sp/p:nvSpPr/p:cNvPr{name=Foo 2}')
+        grpSp.append(sp)
+        shape_names.add_shape(sp)
+        sp.nvSpPr.cNvPr.name = 'Bar'
+        shape_names.add_name('Bar')
+
+        assert 'Foo 2' in shape_names
+        assert 'Bar' in shape_names
+
+
 class DescribeNotesMasterPart(object):
 
     def it_can_create_a_notes_master_part(self, create_fixture):
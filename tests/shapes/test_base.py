@@ -47,9 +47,10 @@ class DescribeBaseShape(object):
         assert shape.name == name
 
     def it_can_change_its_name(self, name_set_fixture):
-        shape, new_value, expected_xml = name_set_fixture
+        shape, new_value, expected_xml, shape_names_ = name_set_fixture
         shape.name = new_value
         assert shape._element.xml == expected_xml
+        shape_names_.add_name.assert_called_once_with(new_value)
 
     def it_has_a_position(self, position_get_fixture):
         shape, expected_left, expected_top = position_get_fixture
@@ -212,8 +213,9 @@ class DescribeBaseShape(object):
     def name_set_fixture(self, request):
         xSp_cxml, ShapeCls, new_value, expected_xSp_cxml = request.param
         shape = ShapeCls(element(xSp_cxml), None)
+        part_ = property_mock(request, BaseShape, 'part').return_value
         expected_xml = xml(expected_xSp_cxml)
-        return shape, new_value, expected_xml
+        return shape, new_value, expected_xml, part_.shape_names
 
     @pytest.fixture
     def part_fixture(self, shapes_):
@@ -6,10 +6,13 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from array import array
+
 import pytest
 
 from pptx.compat import BytesIO
 from pptx.chart.data import ChartData
+from pptx.dml.color import RGBColor
 from pptx.enum.shapes import (
     MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER
 )
@@ -19,8 +22,9 @@ from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement, ST_Direction
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
-from pptx.parts.image import ImagePart
-from pptx.parts.slide import SlidePart
+from pptx.parts.image import Image, ImagePart
+from pptx.parts.imageopt import ImageOptimizer
+from pptx.parts.slide import BaseSlidePart, SlidePart
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -113,6 +117,68 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
+    def it_supports_negative_indexes(self, BaseShapeFactory_):
+        spTree = element('p:spTree/(p:sp,p:pic,p:extLst)')
+        shapes = _BaseShapes(spTree, None)
+        shapes[-1]
+        shapes[-2]
+        assert BaseShapeFactory_.call_args_list == [
+            call(spTree[1], shapes), call(spTree[0], shapes)
+        ]
+        with pytest.raises(IndexError):
+            shapes[-3]
+
+    def it_indexes_its_shapes_without_walking_the_shape_tree(
+            self, request, BaseShapeFactory_):
+        spTree = element('p:spTree/(p:sp,p:pic,p:cxnSp)')
+        shapes = _BaseShapes(spTree, None)
+        assert len(shapes) == 3
+        _iter_member_elms_ = method_mock(
+            request, _BaseShapes, '_iter_member_elms'
+        )
+
+        for idx in range(len(shapes)):
+            shapes[idx]
+
+        assert _iter_member_elms_.call_count == 0
+        assert BaseShapeFactory_.call_args_list == [
+            call(spTree[0], shapes), call(spTree[1], shapes),
+            call(spTree[2], shapes),
+        ]
+
+    def it_reflects_changes_noted_by_pptx(self, BaseShapeFactory_):
+        spTree = element('p:spTree/(p:sp,p:pic,p:cxnSp)')
+        shapes = _BaseShapes(spTree, None)
+        sp, cxnSp = spTree[0], spTree[2]
+        shapes[-1]
+
+        # ---z-order change, which keeps the shape count---
+        spTree.append(sp)
+        CT_GroupShape.shapes_changed()
+        shapes[-1]
+
+        assert BaseShapeFactory_.call_args_list == [
+            call(cxnSp, shapes), call(sp, shapes)
+        ]
+
+    def and_changes_made_in_the_xml_that_add_or_remove_shapes(
+            self, BaseShapeFactory_):
+        spTree = element('p:spTree/(p:sp,p:pic)')
+        shapes = _BaseShapes(spTree, None)
+        sp, pic = spTree[0], spTree[1]
+        assert len(shapes) == 2
+
+        cxnSp = element('p:cxnSp')
+        spTree.append(cxnSp)
+        assert len(shapes) == 3
+        # ---shape moved into a new group, which keeps the shape count---
+        grpSp = element('p:grpSp')
+        spTree.append(grpSp)
+        grpSp.append(sp)
+        shapes[0]
+
+        assert BaseShapeFactory_.call_args_list == [call(pic, shapes)]
+
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
@@ -130,7 +196,7 @@ class Describe_BaseShapes(object):
 
     def it_finds_the_next_shape_id_to_help(self, next_id_fixture):
         shapes, expected_value = next_id_fixture
-        assert shapes._next_shape_id == expected_value
+        assert shapes._next_shape_id() == expected_value
 
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
@@ -139,8 +205,11 @@ class Describe_BaseShapes(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def clone_ph_fixture(self, placeholder_):
-        shapes = SlideShapes(element('p:spTree{a:b=c}'), None)
+    def clone_ph_fixture(self, placeholder_, _next_shape_id_, part_prop_):
+        sld = element('p:sld/p:cSld/p:spTree{a:b=c}')
+        shapes = SlideShapes(sld.cSld.spTree, None)
+        part_prop_.return_value = BaseSlidePart(None, None, sld, None)
+        _next_shape_id_.return_value = 1
         expected_xml = xml(
             'p:spTree{a:b=c}/p:sp/(p:nvSpPr/(p:cNvPr{id=1,name=Vertical Char'
             't Placeholder 0},p:cNvSpPr/a:spLocks{noGrp=1},p:nvPr/p:ph{type='
@@ -189,21 +258,12 @@ class Describe_BaseShapes(object):
         expected_count = 2
         return shapes, expected_count
 
-    @pytest.fixture(params=[
-        ('p:spTree/p:nvSpPr',                                 1),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=0}',                   1),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=1}',                   2),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   4),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})', 3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})', 3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
-         'cNvPr{id=1},p:cNvPr{id=4})',                        5),
-    ])
-    def next_id_fixture(self, request):
-        spTree_cxml, expected_value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        return shapes, expected_value
+    @pytest.fixture
+    def next_id_fixture(self, part_prop_, slide_part_):
+        shapes = _BaseShapes(element('p:spTree'), None)
+        part_prop_.return_value = slide_part_
+        slide_part_.next_shape_id.return_value = 42
+        return shapes, 42
 
     @pytest.fixture(params=[
         (PP_PLACEHOLDER.OBJECT, 3, ST_Direction.HORZ,
@@ -215,24 +275,25 @@ class Describe_BaseShapes(object):
         (PP_PLACEHOLDER.TITLE,  2, ST_Direction.HORZ,
          'Title 2'),
     ])
-    def ph_name_fixture(self, request):
+    def ph_name_fixture(self, request, part_prop_):
         ph_type, sp_id, orient, expected_name = request.param
-        spTree = element(
-            'p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder '
-            '3})'
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table'
+            ' Placeholder 3})'
         )
-        shapes = SlideShapes(spTree, None)
+        shapes = SlideShapes(sld.cSld.spTree, None)
+        part_prop_.return_value = BaseSlidePart(None, None, sld, None)
         return shapes, ph_type, sp_id, orient, expected_name
 
     @pytest.fixture(params=[
         (None, False),
-        (42, True),
+        (True, True),
     ])
     def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
+        turbo_add_enabled, expected_value = request.param
         shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
+        if turbo_add_enabled:
+            shapes.turbo_add_enabled = turbo_add_enabled
         return shapes, expected_value
 
     @pytest.fixture(params=[
@@ -257,6 +318,14 @@ class Describe_BaseShapes(object):
             return_value=shape_, autospec=True
         )
 
+    @pytest.fixture
+    def _next_shape_id_(self, request):
+        return method_mock(request, _BaseShapes, '_next_shape_id')
+
+    @pytest.fixture
+    def part_prop_(self, request):
+        return property_mock(request, _BaseShapes, 'part')
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, Shape)
@@ -265,6 +334,10 @@ class Describe_BaseShapes(object):
     def shape_(self, request):
         return instance_mock(request, BaseShape)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, SlidePart)
+
 
 class Describe_BaseGroupShapes(object):
 
@@ -318,7 +391,7 @@ class Describe_BaseGroupShapes(object):
 
         group_shape = shapes.add_group_shape()
 
-        spTree.add_grpSp.assert_called_once_with(spTree)
+        spTree.add_grpSp.assert_called_once_with(spTree, 42, 'Group 41')
         shapes._shape_factory.assert_called_once_with(shapes, grpSp)
         assert group_shape is group_shape_
 
@@ -338,6 +411,40 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, pic)
         assert picture is picture_
 
+    def it_can_defer_reading_a_picture_file(self, request, picture_fixture):
+        shapes, image_file, x, y, cx, cy = picture_fixture[:6]
+        image_ = instance_mock(request, Image)
+        from_file_ = method_mock(
+            request, Image, 'from_file', return_value=image_
+        )
+
+        shapes.add_picture(image_file, x, y, cx, cy, lazy=True)
+
+        from_file_.assert_called_once_with(image_file, lazy=True)
+        shapes.part.get_or_add_image_part.assert_called_once_with(image_)
+
+    def it_can_optimize_a_picture_image_for_its_size(
+            self, request, picture_fixture):
+        shapes, image_file, x, y = picture_fixture[:4]
+        image_part_, rId = picture_fixture[6:8]
+        Image_ = class_mock(request, 'pptx.shapes.shapetree.Image')
+        image_ = Image_.from_file.return_value
+        image_.scale.return_value = (300, 400)
+        optimizer_ = instance_mock(request, ImageOptimizer)
+        optimized_image_ = optimizer_.optimize_image.return_value
+
+        shapes.add_picture(image_file, x, y, 300, optimize=optimizer_)
+
+        Image_.from_file.assert_called_once_with(image_file)
+        image_.scale.assert_called_once_with(300, None)
+        optimizer_.optimize_image.assert_called_once_with(image_, 300, 400)
+        shapes.part.get_or_add_image_part.assert_called_once_with(
+            optimized_image_
+        )
+        shapes._add_pic_from_image_part.assert_called_once_with(
+            shapes, image_part_, rId, x, y, 300, 400
+        )
+
     def it_can_add_a_shape(self, shape_fixture):
         shapes, autoshape_type_id, x, y, cx, cy = shape_fixture[:6]
         AutoShapeType_, autoshape_type_, sp, shape_ = shape_fixture[6:]
@@ -352,6 +459,54 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, sp)
         assert shape is shape_
 
+    def it_can_add_shapes_in_bulk(self, bulk_fixture):
+        shapes, specs = bulk_fixture
+
+        new_shapes = shapes.add_shapes_bulk(iter(specs))
+
+        shapes._recalculate_extents.assert_called_once_with(shapes)
+        assert [type(s) for s in new_shapes] == [Shape, Shape]
+        assert list(shapes) == new_shapes
+        rect, textbox = new_shapes
+        assert (rect.shape_id, rect.name) == (42, 'Rounded Rectangle 41')
+        assert (rect.left, rect.top, rect.width, rect.height) == (1, 2, 3, 4)
+        assert rect.text_frame.text == 'foo\nbar'
+        assert rect.fill.fore_color.rgb == RGBColor(0x12, 0x34, 0x56)
+        assert (textbox.shape_id, textbox.name) == (43, 'TextBox 42')
+        assert textbox.text_frame.text == ''
+
+    def it_can_add_shapes_in_bulk_from_columns(self, bulk_fixture):
+        shapes, _ = bulk_fixture
+        lefts, tops = array(str('l'), [1, 5]), array(str('l'), [2, 6])
+        widths, heights = array(str('l'), [3, 7]), array(str('l'), [4, 8])
+
+        new_shapes = shapes.add_shapes_bulk(
+            autoshape_type_id=MSO_AUTO_SHAPE_TYPE.OVAL, lefts=lefts,
+            tops=tops, widths=widths, heights=heights, texts=['foo', None]
+        )
+
+        oval, oval_2 = new_shapes
+        assert (oval.shape_id, oval.name) == (42, 'Oval 41')
+        assert (oval.left, oval.top, oval.width, oval.height) == (1, 2, 3, 4)
+        assert oval.text_frame.text == 'foo'
+        assert (oval_2.left, oval_2.top, oval_2.width, oval_2.height) == (
+            5, 6, 7, 8
+        )
+        assert oval_2.auto_shape_type == MSO_AUTO_SHAPE_TYPE.OVAL
+        assert oval_2.text_frame.text == ''
+
+    @pytest.mark.parametrize('kwargs', [
+        {'specs': [], 'lefts': [1]},
+        {'lefts': [1], 'tops': [2], 'widths': [3]},
+        {'lefts': [1], 'tops': [2], 'widths': [3], 'heights': [4, 5]},
+        {'lefts': [1], 'tops': [2], 'widths': [3], 'heights': [4],
+         'fills': []},
+    ])
+    def it_raises_on_inconsistent_bulk_arguments(self, kwargs):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        with pytest.raises(ValueError):
+            shapes.add_shapes_bulk(**kwargs)
+
     def it_can_add_a_textbox(self, textbox_fixture):
         shapes, x, y, cx, cy, sp, shape_ = textbox_fixture
 
@@ -438,8 +593,9 @@ class Describe_BaseGroupShapes(object):
         )
 
     @pytest.fixture
-    def add_cht_gr_frm_fixture(self):
+    def add_cht_gr_frm_fixture(self, _next_shape_id_):
         shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_.return_value = 1
         rId, x, y, cx, cy = 'rId42', 1, 2, 3, 4
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -468,9 +624,10 @@ class Describe_BaseGroupShapes(object):
         (9, 8, 2, 3,
          'p:spPr/(a:xfrm{flipH=1,flipV=1}/(a:off{x=2,y=3},a:ext{cx=7,cy=5})'),
     ])
-    def add_cxnSp_fixture(self, request):
+    def add_cxnSp_fixture(self, request, _next_shape_id_):
         begin_x, begin_y, end_x, end_y, spPr_cxml = request.param
         shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_.return_value = 1
         connector_type = MSO_CONNECTOR.STRAIGHT
         tmpl_cxml = (
             'p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=1,name=Connector 0},p:cNvCxnSp'
@@ -486,11 +643,11 @@ class Describe_BaseGroupShapes(object):
         )
 
     @pytest.fixture
-    def add_pic_fixture(self, image_part_, _next_shape_id_prop_):
+    def add_pic_fixture(self, image_part_, _next_shape_id_):
         shapes = _BaseGroupShapes(element('p:spTree'), None)
         rId, x, y, cx, cy = 'rId24', 10, 11, 12, 13
 
-        _next_shape_id_prop_.return_value = 42
+        _next_shape_id_.return_value = 42
         image_part_.scale.return_value = (101, 102)
         image_part_.desc = 'sprocket.jpg'
         expected_xml = (
@@ -511,11 +668,11 @@ class Describe_BaseGroupShapes(object):
         return shapes, image_part_, rId, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_sp_fixture(self, autoshape_type_, _next_shape_id_prop_):
+    def add_sp_fixture(self, autoshape_type_, _next_shape_id_):
         shapes = _BaseGroupShapes(element('p:spTree'), None)
         x, y, cx, cy = 8, 7, 6, 5
 
-        _next_shape_id_prop_.return_value = 7
+        _next_shape_id_.return_value = 7
         autoshape_type_.basename = 'Rounded Rectangle'
         autoshape_type_.prst = 'roundRect'
 
@@ -541,11 +698,11 @@ class Describe_BaseGroupShapes(object):
         return shapes, autoshape_type_, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_textbox_sp_fixture(self, _next_shape_id_prop_):
+    def add_textbox_sp_fixture(self, _next_shape_id_):
         shapes = _BaseGroupShapes(element('p:spTree'), None)
         x, y, cx, cy = 1, 2, 3, 4
 
-        _next_shape_id_prop_.return_value = 6
+        _next_shape_id_.return_value = 6
 
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -594,10 +751,11 @@ class Describe_BaseGroupShapes(object):
 
     @pytest.fixture
     def group_fixture(self, CT_GroupShape_add_grpSp_, _shape_factory_,
-                      group_shape_):
+                      group_shape_, _next_shape_id_):
         spTree = element('p:spTree{id=2e838acdc755e83113ed03904d2fe081f}')
         grpSp = element('p:grpSp{id=052874e154b48f9bec4266f80913cae38f}')
         shapes = _BaseGroupShapes(spTree, None)
+        _next_shape_id_.return_value = 42
 
         CT_GroupShape_add_grpSp_.return_value = grpSp
         _shape_factory_.return_value = group_shape_
@@ -632,8 +790,8 @@ class Describe_BaseGroupShapes(object):
         return shapes, shape_
 
     @pytest.fixture
-    def _next_shape_id_prop_(self, request):
-        return property_mock(request, _BaseGroupShapes, '_next_shape_id')
+    def _next_shape_id_(self, request):
+        return method_mock(request, _BaseGroupShapes, '_next_shape_id')
 
     @pytest.fixture
     def picture_fixture(self, part_prop_, slide_part_, image_part_,
@@ -668,6 +826,20 @@ class Describe_BaseGroupShapes(object):
             autoshape_type_, sp, shape_
         )
 
+    @pytest.fixture
+    def bulk_fixture(self, request, _recalculate_extents_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        method_mock(
+            request, _BaseGroupShapes, '_next_shape_ids',
+            return_value=[42, 43]
+        )
+        specs = [
+            (MSO_AUTO_SHAPE_TYPE.ROUNDED_RECTANGLE, 1, 2, 3, 4, 'foo\nbar',
+             RGBColor(0x12, 0x34, 0x56)),
+            (None, 5, 6, 7, 8),
+        ]
+        return shapes, specs
+
     @pytest.fixture
     def textbox_fixture(self, _add_textbox_sp_, _recalculate_extents_,
                         _shape_factory_, shape_):
@@ -792,6 +964,24 @@ class DescribeGroupShapes(object):
         shapes._recalculate_extents()
         shapes._grpSp.recalculate_extents.assert_called_once_with()
 
+    def it_notes_the_names_of_shapes_added_to_it(self, request):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo 1},'
+            'p:grpSp/(p:nvGrpSpPr/p:cNvPr{id=3,name=Group 2},p:grpSpPr))'
+        )
+        slide_part = BaseSlidePart(None, None, sld, None)
+        grpSp = sld.cSld.spTree.xpath('p:grpSp')[0]
+        shapes = GroupShapes(grpSp, None)
+        property_mock(
+            request, GroupShapes, 'part', return_value=slide_part
+        )
+        assert 'Foo 2' not in slide_part.shape_names
+
+        shapes.add_textbox(0, 0, 10, 10).name = 'Bar'
+
+        assert 'TextBox 3' in slide_part.shape_names
+        assert 'Bar' in slide_part.shape_names
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -926,6 +1116,24 @@ class DescribeSlidePlaceholders(object):
         placeholders, expected_value = len_fixture
         assert len(placeholders) == expected_value
 
+    def it_notices_a_placeholder_replaced_in_place(self, SlideShapeFactory_):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/'
+            'p:nvPr/p:ph{type=body,idx=1})'
+        )
+        placeholders = SlidePlaceholders(spTree, None)
+        placeholders[1]
+        pic = element('p:pic/p:nvPicPr/p:nvPr/p:ph{type=body,idx=1}')
+        spTree[1].addprevious(pic)
+        spTree.remove(spTree[2])
+
+        placeholders[1]
+
+        assert SlideShapeFactory_.call_args_list[-1] == call(
+            pic, placeholders
+        )
+        assert len(placeholders) == 2
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -1151,7 +1359,7 @@ class DescribeSlideShapes(object):
 
         _MoviePicElementCreator_.new_movie_pic.assert_called_once_with(
             shapes, shape_id_, movie_file, x, y, cx, cy, poster_frame_image,
-            mime_type
+            mime_type, False
         )
         shapes._spTree[-1] is movie_pic
         _add_video_timing_.assert_called_once_with(shapes, movie_pic)
@@ -1168,6 +1376,42 @@ class DescribeSlideShapes(object):
         assert table is table_
         assert shapes._element.xml == expected_xml
 
+    def it_can_add_a_table_populated_from_data(
+            self, request, _shape_factory_):
+        shapes = SlideShapes(element('p:spTree'), None)
+        method_mock(
+            request, SlideShapes, '_next_shape_id', return_value=1
+        )
+        data = [[1.5, None, 'a'], [-2, 3, 'b']]
+        col_formats = [',.2f', lambda v: '(%d)' % v, None]
+
+        shapes.add_table_from_data(data, 10, 11, 12, 13, col_formats)
+
+        tbl = shapes._element.xpath('.//a:tbl')[0]
+        assert [[tc.text for tc in tr.tc_lst] for tr in tbl.tr_lst] == [
+            ['1.50', '', 'a'], ['-2.00', '(3)', 'b']
+        ]
+        graphicFrame = shapes._element.xpath('p:graphicFrame')[0]
+        _shape_factory_.assert_called_once_with(shapes, graphicFrame)
+
+    def it_accepts_array_like_table_data(self):
+        class ArrayLike(object):
+            def tolist(self):
+                return [[1, 2], [3, 4]]
+
+        texts = SlideShapes._table_cell_texts(ArrayLike(), None)
+
+        assert texts == [['1', '2'], ['3', '4']]
+
+    @pytest.mark.parametrize('data, col_formats', [
+        ([], None),
+        ([[1, 2], [3]], None),
+        ([[1, 2]], [None]),
+    ])
+    def it_raises_on_table_data_of_the_wrong_shape(self, data, col_formats):
+        with pytest.raises(ValueError):
+            SlideShapes._table_cell_texts(data, col_formats)
+
     def it_can_clone_placeholder_shapes_from_a_layout(self, clone_fixture):
         shapes, slide_layout_, calls = clone_fixture
         shapes.clone_layout_placeholders(slide_layout_)
@@ -1212,14 +1456,14 @@ class DescribeSlideShapes(object):
 
     @pytest.fixture
     def movie_fixture(self, _MoviePicElementCreator_, _add_video_timing_,
-                      _shape_factory_, movie_, _next_shape_id_prop_):
+                      _shape_factory_, movie_, _next_shape_id_):
         shapes = SlideShapes(element('p:spTree'), None)
         movie_file, x, y, cx, cy = 'foobar.mp4', 1, 2, 3, 4
         poster_frame_image, mime_type = 'foobar.png', 'video/mp4'
         movie_pic = element('p:pic')
         _MoviePicElementCreator_.new_movie_pic.return_value = movie_pic
         _shape_factory_.return_value = movie_
-        shape_id_ = _next_shape_id_prop_.return_value
+        shape_id_ = _next_shape_id_.return_value
         return (
             shapes, movie_file, x, y, cx, cy, poster_frame_image, mime_type,
             shape_id_, _MoviePicElementCreator_, movie_pic,
@@ -1227,8 +1471,11 @@ class DescribeSlideShapes(object):
         )
 
     @pytest.fixture
-    def table_fixture(self, table_, _shape_factory_):
+    def table_fixture(self, request, table_, _shape_factory_):
         shapes = SlideShapes(element('p:spTree'), None)
+        method_mock(
+            request, SlideShapes, '_next_shape_id', return_value=1
+        )
         rows, cols, x, y, cx, cy = 1, 2, 10, 11, 12, 13
         _shape_factory_.return_value = table_
         expected_xml = (
@@ -1296,8 +1543,8 @@ class DescribeSlideShapes(object):
         )
 
     @pytest.fixture
-    def _next_shape_id_prop_(self, request, shape_id_):
-        return property_mock(
+    def _next_shape_id_(self, request, shape_id_):
+        return method_mock(
             request, SlideShapes, '_next_shape_id', return_value=shape_id_
         )
 
@@ -1658,12 +1905,12 @@ class Describe_MoviePicElementCreator(object):
 
         pic = _MoviePicElementCreator.new_movie_pic(
             shapes_, shape_id, movie_file, x, y, cx, cy, poster_frame_image,
-            mime_type
+            mime_type, True
         )
 
         _MoviePicElementCreator_init_.assert_called_once_with(
             ANY, shapes_, shape_id, movie_file, x, y, cx, cy,
-            poster_frame_image, mime_type
+            poster_frame_image, mime_type, True
         )
         _pic_prop_.assert_called_once_with()
         assert pic is pic_
@@ -1691,7 +1938,7 @@ class Describe_MoviePicElementCreator(object):
         mime_type, video_ = video_fixture[2:]
         video = movie_pic_element_creator._video
         Video.from_path_or_file_like.assert_called_once_with(
-            movie_file, mime_type
+            movie_file, mime_type, False
         )
         assert video is video_
 
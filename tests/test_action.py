@@ -67,7 +67,9 @@ class DescribeActionSetting(object):
 
         action_setting._clear_click_action()
 
-        assert action_setting.part.drop_rel.call_args_list == calls
+        assert (
+            action_setting.part.drop_unreferenced_rels.call_args_list == calls
+        )
         assert action_setting._element.xml == expected_xml
 
     # fixtures -------------------------------------------------------
@@ -125,7 +127,7 @@ class DescribeActionSetting(object):
 
         part_prop_.return_value = slide_part_
 
-        calls = [call(rId)] if rId else []
+        calls = [call([rId])] if rId else []
         expected_xml = xml(expected_cxml)
         return action_setting, calls, expected_xml
 
@@ -265,7 +267,7 @@ class DescribeHyperlink(object):
 
         hyperlink.address = None
 
-        assert hyperlink.part.drop_rel.call_args_list == calls
+        assert hyperlink.part.drop_unreferenced_rels.call_args_list == calls
         assert hyperlink._element.xml == expected_xml
 
     def it_can_set_its_target_url(self, update_fixture):
@@ -300,7 +302,7 @@ class DescribeHyperlink(object):
     @pytest.fixture(params=[
         ('p:cNvPr{a:a=a,r:r=r}',                         []),
         ('p:cNvPr{a:a=a,r:r=r}/a:hlinkClick',            []),
-        ('p:cNvPr{a:a=a,r:r=r}/a:hlinkClick{r:id=rId3}', [call('rId3')]),
+        ('p:cNvPr{a:a=a,r:r=r}/a:hlinkClick{r:id=rId3}', [call(['rId3'])]),
     ])
     def remove_fixture(self, request, part_prop_):
         cNvPr_cxml, calls = request.param
@@ -12,9 +12,11 @@ import os
 
 import pytest
 
-from pptx.api import Presentation
+from pptx.api import Presentation, PresentationTemplate
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
+from pptx.presentation import Presentation as PresentationObj
 
 from .unitutil.mock import class_mock, instance_mock
 
@@ -24,7 +26,25 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, False, None, False)
+        assert prs is prs_
+
+    def it_can_open_a_package_lazily(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(path, lazy=True)
+        Package_.open.assert_called_once_with(path, True, None, False)
+        assert prs is prs_
+
+    def it_can_parse_parts_on_worker_threads(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(path, workers=4)
+        Package_.open.assert_called_once_with(path, False, 4, False)
+        assert prs is prs_
+
+    def it_can_memory_map_the_package_file(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(path, mmap=True)
+        Package_.open.assert_called_once_with(path, False, None, True)
         assert prs is prs_
 
     # fixtures -------------------------------------------------------
@@ -55,3 +75,46 @@ class DescribePresentation(object):
     @pytest.fixture
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
+
+
+class DescribePresentationTemplate(object):
+
+    def it_loads_the_default_template_on_no_path_provided(self, request):
+        PackageTemplate_ = class_mock(request, 'pptx.api.PackageTemplate')
+        package_ = PackageTemplate_.from_file.return_value.new_package(
+            Package
+        )
+        package_.main_document_part.content_type = CT.PML_PRESENTATION_MAIN
+
+        PresentationTemplate()
+
+        PackageTemplate_.from_file.assert_called_once_with(
+            os.path.abspath(
+                os.path.join(
+                    os.path.split(__file__)[0], '../pptx/templates',
+                    'default.pptx'
+                )
+            )
+        )
+
+    def it_creates_independent_presentations(self):
+        template = PresentationTemplate()
+
+        prs = template.presentation()
+        prs_2 = template.presentation()
+        prs.slides.add_slide(prs.slide_layouts[0])
+
+        assert isinstance(prs, PresentationObj)
+        assert prs_2 is not prs
+        assert len(prs.slides) == 1
+        assert len(prs_2.slides) == 0
+
+    def it_raises_on_a_package_that_is_not_a_presentation(self, request):
+        PackageTemplate_ = class_mock(request, 'pptx.api.PackageTemplate')
+        package_ = PackageTemplate_.from_file.return_value.new_package(
+            Package
+        )
+        package_.main_document_part.content_type = CT.WML_DOCUMENT_MAIN
+
+        with pytest.raises(ValueError):
+            PresentationTemplate('foo.docx')
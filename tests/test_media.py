@@ -10,6 +10,7 @@ import pytest
 
 from pptx.compat import BytesIO
 from pptx.media import Video
+from pptx.opc.phys_pkg import FilePkgMember
 
 from .unitutil.file import absjoin, test_file_dir
 from .unitutil.mock import (
@@ -28,6 +29,15 @@ class DescribeVideo(object):
         Video.from_blob.assert_called_once_with(blob, mime_type, filename)
         assert video is video_
 
+    def it_can_defer_reading_a_path_until_needed(self, from_path_fixture):
+        movie_path, mime_type, blob, filename, video_ = from_path_fixture
+        video = Video.from_path_or_file_like(movie_path, mime_type, True)
+        member, mime_type_, filename_ = Video.from_blob.call_args[0]
+        assert isinstance(member, FilePkgMember)
+        assert member.blob == blob
+        assert (mime_type_, filename_) == (mime_type, filename)
+        assert video is video_
+
     def it_can_construct_from_a_stream(self, from_stream_fixture):
         movie_stream, mime_type, blob, video_ = from_stream_fixture
         video = Video.from_path_or_file_like(movie_stream, mime_type)
@@ -60,6 +70,16 @@ class DescribeVideo(object):
         video, expected_value = sha1_fixture
         assert video.sha1 == expected_value
 
+    def it_hashes_a_video_file_without_loading_it(self):
+        with open(TEST_VIDEO_PATH, 'rb') as f:
+            blob = f.read()
+        video = Video.from_path_or_file_like(
+            TEST_VIDEO_PATH, 'video/mp4', lazy=True
+        )
+        assert video.sha1 == Video(blob, None, None).sha1
+        assert isinstance(video.blob_source, FilePkgMember)
+        assert video.blob == blob
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
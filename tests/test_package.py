@@ -14,7 +14,7 @@ from pptx.media import Video
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part, _Relationship
 from pptx.opc.packuri import PackURI
-from pptx.package import _ImageParts, _MediaParts, Package
+from pptx.package import _ImageParts, _MediaParts, Package, _Sha1Index
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
@@ -93,10 +93,10 @@ class DescribePackage(object):
         ((4, 2, 1), 3),
         ((2, 3, 1), 4),
     ])
-    def next_fixture(self, request, iter_parts_):
+    def next_fixture(self, request):
         idxs, idx = request.param
         package = Package()
-        package.iter_parts.return_value = self.i_image_parts(request, idxs)
+        self.relate_parts(package, '/ppt/media/image%d.png', idxs)
         ext = 'foo'
         expected_value = '/ppt/media/image%d.%s' % (idx, ext)
         return package, ext, expected_value
@@ -106,10 +106,10 @@ class DescribePackage(object):
         ((4, 2, 1), 3),
         ((2, 3, 1), 4),
     ])
-    def nmp_fixture(self, request, iter_parts_):
+    def nmp_fixture(self, request):
         idxs, idx = request.param
         package = Package()
-        package.iter_parts.return_value = self.i_media_parts(request, idxs)
+        self.relate_parts(package, '/ppt/media/media%d.mp4', idxs)
         ext = 'foo'
         expected_value = '/ppt/media/media%d.%s' % (idx, ext)
         return package, ext, expected_value
@@ -128,21 +128,10 @@ class DescribePackage(object):
     def _image_parts_prop_(self, request):
         return property_mock(request, Package, '_image_parts')
 
-    def i_image_parts(self, request, idxs):
-        def part(idx):
-            partname = PackURI('/ppt/media/image%d.png' % idx)
-            return instance_mock(request, Part, partname=partname)
-        return iter([part(idx) for idx in idxs])
-
-    def i_media_parts(self, request, idxs):
-        def part(idx):
-            partname = PackURI('/ppt/media/media%d.mp4' % idx)
-            return instance_mock(request, Part, partname=partname)
-        return iter([part(idx) for idx in idxs])
-
-    @pytest.fixture
-    def iter_parts_(self, request):
-        return property_mock(request, Package, 'iter_parts')
+    def relate_parts(self, package, tmpl, idxs):
+        for idx in idxs:
+            part = Part(PackURI(tmpl % idx), None, None, package)
+            package.relate_to(part, RT.IMAGE)
 
     @pytest.fixture
     def media_(self, request):
@@ -189,6 +178,7 @@ class Describe_ImageParts(object):
         Image_.from_file.assert_called_once_with(image_file)
         image_parts._find_by_sha1.assert_called_once_with(image_.sha1)
         ImagePart_.new.assert_called_once_with(package_, image_)
+        assert image_parts._sha1_index.get(image_.sha1) is image_part_
         assert image_part is image_part_
 
     def it_can_find_an_image_part_by_sha1_hash(self, find_fixture):
@@ -196,7 +186,8 @@ class Describe_ImageParts(object):
         image_part = image_parts._find_by_sha1(sha1)
         assert image_part is expected_value
 
-    def but_it_skips_unsupported_image_types(self, request, _iter_):
+    def but_it_skips_unsupported_image_types(self, request, _iter_,
+                                             package_):
         sha1 = 'f00beed'
         svg_part_ = instance_mock(
             request, Part, name='svg_part_'
@@ -206,7 +197,7 @@ class Describe_ImageParts(object):
         )
         # ---order iteration to encounter svg part before target part---
         _iter_.return_value = iter((svg_part_, png_part_))
-        image_parts = _ImageParts(None)
+        image_parts = _ImageParts(package_)
 
         result = image_parts._find_by_sha1(sha1)
 
@@ -228,9 +219,9 @@ class Describe_ImageParts(object):
         )
 
     @pytest.fixture(params=[True, False])
-    def find_fixture(self, request, _iter_, image_part_):
+    def find_fixture(self, request, _iter_, image_part_, package_):
         image_part_is_present = request.param
-        image_parts = _ImageParts(None)
+        image_parts = _ImageParts(package_)
         _iter_.return_value = iter((image_part_,))
         sha1 = 'foobar'
         if image_part_is_present:
@@ -317,6 +308,9 @@ class Describe_MediaParts(object):
 
         media_parts._find_by_sha1.assert_called_once_with(media_parts, sha1)
         assert MediaPart_.new.call_args_list == calls
+        assert media_parts._sha1_index.get(sha1) is (
+            None if calls == [] else media_part_
+        )
         assert media_part is media_part_
 
     def it_can_find_a_media_part_by_sha1(self, find_fixture):
@@ -330,9 +324,9 @@ class Describe_MediaParts(object):
         True,
         False
     ])
-    def find_fixture(self, request, _iter_, media_part_):
+    def find_fixture(self, request, _iter_, media_part_, package_):
         media_part_is_present = request.param
-        media_parts = _MediaParts(None)
+        media_parts = _MediaParts(package_)
         _iter_.return_value = iter((media_part_,))
         sha1 = 'foobar'
         if media_part_is_present:
@@ -413,3 +407,42 @@ class Describe_MediaParts(object):
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
+
+
+class Describe_Sha1Index(object):
+
+    def it_finds_the_first_part_having_a_sha1(self, request, package_):
+        parts_ = [
+            instance_mock(request, MediaPart, name='part_%d' % n, sha1=sha1)
+            for n, sha1 in enumerate(('f00', 'bar', 'f00'))
+        ]
+        parts = list(parts_)
+        sha1_index = _Sha1Index(package_, parts)
+
+        assert sha1_index.get('f00') is parts_[0]
+        assert sha1_index.get('bar') is parts_[1]
+        parts.pop()
+        assert sha1_index.get('f00') is parts_[0]
+
+    def it_can_add_a_part(self, request, package_):
+        part_ = instance_mock(request, MediaPart)
+        sha1_index = _Sha1Index(package_, [])
+        sha1_index.add('f00', part_)
+        assert sha1_index.get('f00') is part_
+
+    def it_is_rebuilt_when_parts_may_have_been_removed(self, request):
+        package = Package()
+        parts = [instance_mock(request, MediaPart, sha1='f00')]
+        sha1_index = _Sha1Index(package, parts)
+        assert sha1_index.get('f00') is parts[0]
+
+        parts.pop()
+        package._part_index.invalidate()
+
+        assert sha1_index.get('f00') is None
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, Package)
@@ -11,6 +11,7 @@ from __future__ import (
 import pytest
 
 from pptx.parts.coreprops import CorePropertiesPart
+from pptx.parts.imageopt import ImageOptimizer
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
 from pptx.presentation import Presentation
@@ -85,7 +86,39 @@ class DescribePresentation(object):
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, None, None)
+
+    def it_can_save_using_worker_threads(self, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        prs.save(file_, workers=4)
+        prs_part_.save.assert_called_once_with(file_, 4, None)
+
+    def it_can_save_with_a_compression_policy(self, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        prs.save(file_, compression='fast')
+        prs_part_.save.assert_called_once_with(file_, None, 'fast')
+
+    def it_can_optimize_its_images_as_it_saves(self, request, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        optimizer_ = instance_mock(request, ImageOptimizer)
+        replaced_ = optimizer_.optimize_package.return_value
+
+        prs.save(file_, workers=4, optimize_images=optimizer_)
+
+        optimizer_.optimize_package.assert_called_once_with(
+            prs_part_.package, 4
+        )
+        prs_part_.save.assert_called_once_with(file_, 4, None)
+        optimizer_.restore_package.assert_called_once_with(
+            prs_part_.package, replaced_
+        )
+
+    def it_can_close_its_package_file(self, save_fixture):
+        prs, prs_part_ = save_fixture[0], save_fixture[2]
+        with prs as entered:
+            assert entered is prs
+            assert prs_part_.package.close.call_count == 0
+        prs_part_.package.close.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -11,7 +11,7 @@ import pytest
 from pptx.dml.fill import FillFormat
 from pptx.enum.text import MSO_ANCHOR
 from pptx.oxml.ns import qn
-from pptx.oxml.table import CT_Table, CT_TableCell, TcRange
+from pptx.oxml.table import CT_Table, TcRange
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.table import (
     _Cell, _CellCollection, _Column, _ColumnCollection, _Row, _RowCollection,
@@ -20,23 +20,95 @@ from pptx.table import (
 from pptx.util import Inches, Length, Pt
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import call, class_mock, instance_mock
+from .unitutil.mock import call, class_mock, instance_mock, property_mock
 
 
 class DescribeTable(object):
 
-    def it_provides_access_to_its_cells(self, tbl_, tc_, _Cell_, cell_):
-        row_idx, col_idx = 4, 2
-        tbl_.tc.return_value = tc_
+    def it_provides_access_to_its_cells(self, _Cell_, cell_):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
         _Cell_.return_value = cell_
-        table = Table(tbl_, None)
+        table = Table(tbl, None)
 
-        cell = table.cell(row_idx, col_idx)
+        cell = table.cell(1, 0)
 
-        tbl_.tc.assert_called_once_with(row_idx, col_idx)
-        _Cell_.assert_called_once_with(tc_, table)
+        _Cell_.assert_called_once_with(tbl.tc(1, 0), table)
         assert cell is cell_
 
+    def it_indexes_its_cells_by_grid_position(self):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        table = Table(tbl, None)
+
+        tc_grid = table.tc_grid
+
+        assert table.tc_grid is tc_grid
+        assert tc_grid.tc(1, 1) is tbl.tc(1, 1)
+        assert tc_grid.position(tbl.tc(1, 0)) == (1, 0)
+
+    def it_rebuilds_its_cell_index_when_a_row_is_added(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc))'
+        )
+        table = Table(tbl, None)
+        tc_grid = table.tc_grid
+        tr = tbl.add_tr(42)
+        tr.add_tc()
+        tr.add_tc()
+
+        assert table.tc_grid is not tc_grid
+        assert table.cell(1, 1)._tc is tbl.tc(1, 1)
+
+    def and_it_rebuilds_it_when_a_column_is_added(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),'
+            'a:tr/(a:tc,a:tc))'
+        )
+        table = Table(tbl, None)
+        assert len(list(table.iter_cells())) == 4
+        tbl.tblGrid.add_gridCol(42)
+        for tr in tbl.tr_lst:
+            tr.add_tc()
+
+        assert len(list(table.iter_cells())) == 6
+        assert table.cell(0, 2)._tc is tbl.tc(0, 2)
+
+    def and_it_rebuilds_it_when_a_row_is_removed_in_the_xml(self):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        table = Table(tbl, None)
+        table.tc_grid
+        tbl.remove(tbl.tr_lst[0])
+
+        assert table.cell(0, 1)._tc is tbl.tc(0, 1)
+
+    def and_it_rebuilds_it_when_a_cell_is_appended_in_the_xml(self):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        table = Table(tbl, None)
+        table.tc_grid
+        tbl.tr_lst[0].append(element('a:tc'))
+
+        assert table.cell(0, 2)._tc is tbl.tc(0, 2)
+
+    def it_finds_a_cell_without_walking_the_rows(self, request):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        table = Table(tbl, None)
+        table.tc_grid
+        tr_lst_ = property_mock(request, CT_Table, 'tr_lst')
+
+        cells = [table.cell(r, c) for r in range(2) for c in range(2)]
+
+        assert tr_lst_.call_count == 0
+        assert [cell._tc for cell in cells] == tbl.xpath('.//a:tc')
+
+    def and_it_rebuilds_it_when_a_row_is_replaced_in_place(self):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        table = Table(tbl, None)
+        table.tc_grid
+        tr = tbl.tr_lst[1]
+        tr.addnext(element('a:tr/(a:tc,a:tc)'))
+        tbl.remove(tr)
+
+        assert table.cell(1, 0)._tc is tbl.tc(1, 0)
+
     def it_provides_access_to_its_columns(self, columns_fixture):
         table, expected_columns_ = columns_fixture
         assert table.columns is expected_columns_
@@ -123,14 +195,6 @@ class DescribeTable(object):
     def table(self):
         return Table(element('a:tbl'), None)
 
-    @pytest.fixture
-    def tbl_(self, request):
-        return instance_mock(request, CT_Table)
-
-    @pytest.fixture
-    def tc_(self, request):
-        return instance_mock(request, CT_TableCell)
-
 
 class DescribeTableBooleanProperties(object):
 
@@ -255,29 +319,30 @@ class Describe_Cell(object):
             'a:tbl/(a:tr/(a:tc{gridSpan=2,rowSpan=2},a:tc{rowSpan=2,hMerge=1'
             '}),a:tr/(a:tc{gridSpan=2,vMerge=1},a:tc{hMerge=1,vMerge=1}))'
         )
-        cell, other_cell = _Cell(tc, None), _Cell(other_tc, None)
+        table = Table(tbl, None)
+        cell, other_cell = _Cell(tc, table), _Cell(other_tc, table)
 
         cell.merge(other_cell)
 
-        TcRange_.assert_called_once_with(tc, other_tc)
+        TcRange_.assert_called_once_with(tc, other_tc, table.tc_grid)
         tc_range_.move_content_to_origin.assert_called_once_with()
         assert tbl.xml == expected_xml
 
     def but_it_raises_when_cells_are_from_different_tables(
-            self, TcRange_, tc_range_):
+            self, TcRange_, tc_range_, table_):
         TcRange_.return_value = tc_range_
         tc_range_.in_same_table = False
-        cell, other_cell = _Cell(None, None), _Cell(None, None)
+        cell, other_cell = _Cell(None, table_), _Cell(None, table_)
 
         with pytest.raises(ValueError) as e:
             cell.merge(other_cell)
         assert 'different table' in str(e.value)
 
     def and_it_raises_when_range_contains_merged_cell(
-            self, TcRange_, tc_range_):
+            self, TcRange_, tc_range_, table_):
         TcRange_.return_value = tc_range_
         tc_range_.contains_merged_cell = True
-        cell, other_cell = _Cell(None, None), _Cell(None, None)
+        cell, other_cell = _Cell(None, table_), _Cell(None, table_)
 
         with pytest.raises(ValueError) as e:
             cell.merge(other_cell)
@@ -297,7 +362,7 @@ class Describe_Cell(object):
 
     def it_can_split_a_merged_cell(self, split_fixture):
         origin_tc, range_tcs = split_fixture
-        cell = _Cell(origin_tc, None)
+        cell = _Cell(origin_tc, Table(origin_tc.tbl, None))
 
         cell.split()
 
@@ -504,6 +569,10 @@ class Describe_Cell(object):
     def cell(self):
         return _Cell(element('a:tc'), None)
 
+    @pytest.fixture
+    def table_(self, request):
+        return instance_mock(request, Table)
+
     @pytest.fixture
     def TcRange_(self, request):
         return class_mock(request, 'pptx.table.TcRange')
@@ -22,7 +22,7 @@ from pptx.util import Inches, Pt
 from ..oxml.unitdata.text import a_p, a_t, an_hlinkClick, an_r, an_rPr
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
-    class_mock, instance_mock, loose_mock, method_mock, property_mock
+    call, class_mock, instance_mock, loose_mock, method_mock, property_mock
 )
 
 
@@ -87,6 +87,21 @@ class DescribeTextFrame(object):
         text_frame.text = text
         assert text_frame._element.xml == expected_xml
 
+    def it_drops_the_rels_of_the_text_it_clears(self, request):
+        part_ = instance_mock(request, Part)
+        property_mock(request, TextFrame, 'part', return_value=part_)
+        text_frame = TextFrame(element(
+            'p:txBody/(a:p/a:r/a:rPr/a:hlinkClick{r:id=rId1},'
+            'a:p/a:r/a:rPr/a:hlinkClick{r:id=rId2})'
+        ), None)
+
+        text_frame.clear()
+
+        assert part_.drop_unreferenced_rels.call_args_list == [
+            call(['rId2']), call(['rId1'])
+        ]
+        assert len(text_frame._txBody.p_lst) == 1
+
     def it_raises_on_attempt_to_set_margin_to_non_int(self):
         text_frame = TextFrame(element('p:txBody/a:bodyPr'), None)
         with pytest.raises(TypeError):
@@ -622,14 +637,14 @@ class Describe_Hyperlink(object):
         hlink, rPr_xml, rId = remove_hlink_fixture_
         hlink.address = None
         assert hlink._rPr.xml == rPr_xml
-        hlink.part.drop_rel.assert_called_once_with(rId)
+        hlink.part.drop_unreferenced_rels.assert_called_once_with([rId])
 
     def it_should_remove_the_hyperlink_when_url_set_to_empty_string(
             self, remove_hlink_fixture_):
         hlink, rPr_xml, rId = remove_hlink_fixture_
         hlink.address = ''
         assert hlink._rPr.xml == rPr_xml
-        hlink.part.drop_rel.assert_called_once_with(rId)
+        hlink.part.drop_unreferenced_rels.assert_called_once_with([rId])
 
     def it_can_change_the_target_url(self, change_hlink_fixture_):
         # fixture ----------------------
@@ -638,7 +653,9 @@ class Describe_Hyperlink(object):
         hlink.address = new_url
         # verify -----------------------
         assert hlink._rPr.xml == new_rPr_xml
-        hlink.part.drop_rel.assert_called_once_with(rId_existing)
+        hlink.part.drop_unreferenced_rels.assert_called_once_with(
+            [rId_existing]
+        )
         hlink.part.relate_to.assert_called_once_with(
             new_url, RT.HYPERLINK, is_external=True
         )
@@ -798,6 +815,21 @@ class Describe_Paragraph(object):
         paragraph.clear()
         assert paragraph._element.xml == expected_xml
 
+    def and_it_drops_the_rels_of_the_content_it_clears(self, request):
+        part_ = instance_mock(request, Part)
+        property_mock(request, _Paragraph, 'part', return_value=part_)
+        paragraph = _Paragraph(element(
+            'a:p/(a:r/a:rPr/a:hlinkClick{r:id=rId1},a:br,'
+            'a:fld/a:rPr/a:hlinkClick{r:id=rId2})'
+        ), None)
+
+        paragraph.clear()
+
+        part_.drop_unreferenced_rels.assert_called_once_with(
+            ['rId1', 'rId2']
+        )
+        assert paragraph._element.content_children == ()
+
     def it_provides_access_to_the_default_paragraph_font(
             self, paragraph, Font_):
         font = paragraph.font